@@ -4,8 +4,6 @@ import argparse
 import logging
 from pathlib import Path
 
-from afts_pro.core.e2e_runner import E2ESimConfig, run_e2e_sim
-
 logger = logging.getLogger(__name__)
 
 
@@ -14,6 +12,8 @@ def main() -> None:
     parser.add_argument("--config", default="configs/modes/sim_e2e_acceptance.yaml", help="E2E SIM config path.")
     args = parser.parse_args()
     logging.basicConfig(level=logging.INFO)
+    from afts_pro.core.e2e_runner import E2ESimConfig, run_e2e_sim
+
     cfg = E2ESimConfig(config_path=args.config)
     result = run_e2e_sim(cfg)
     logger.info(
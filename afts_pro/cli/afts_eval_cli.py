@@ -5,8 +5,6 @@ import logging
 from pathlib import Path
 import json
 
-from afts_pro.core.eval_controller import EvalConfig, EvalController
-
 logger = logging.getLogger(__name__)
 
 
@@ -18,6 +16,7 @@ def main() -> None:
     parser.add_argument("--no-html", action="store_true", help="Disable HTML report generation for this run.")
     args = parser.parse_args()
     logging.basicConfig(level=logging.INFO)
+    from afts_pro.core.eval_controller import EvalConfig, EvalController
 
     cfg = EvalConfig.from_yaml(args.profile)
     if args.no_html:
@@ -3,18 +3,19 @@ from __future__ import annotations
 import argparse
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import yaml
 
-from afts_pro.rl.env import RLTradingEnv, load_env_config
-from afts_pro.rl.exit_agent import ExitAgent, ExitAgentConfig
-from afts_pro.rl.exit_training import ExitTrainConfig, train_exit_agent
-from afts_pro.rl.types import ActionSpec, RLObsSpec
+if TYPE_CHECKING:
+    from afts_pro.rl.env import RLTradingEnv
 
 logger = logging.getLogger(__name__)
 
 
 def _build_env(env_config_path: str) -> RLTradingEnv:
+    from afts_pro.rl.env import RLTradingEnv, load_env_config
+
     cfg = load_env_config(env_config_path)
     event_stream = [{"equity": 1.0, "drawdown": 0.0, "dd_remaining": 1.0, "features": [0.0, 0.0, 0.0, 0.0]} for _ in range(200)]
     return RLTradingEnv(cfg, event_stream=event_stream)
@@ -27,6 +28,9 @@ def main() -> None:
     parser.add_argument("--output-dir", default="models/exit_agent/exp001", help="Directory to store checkpoints.")
     args = parser.parse_args()
     logging.basicConfig(level=logging.INFO)
+    from afts_pro.rl.exit_agent import ExitAgent, ExitAgentConfig
+    from afts_pro.rl.exit_training import ExitTrainConfig, train_exit_agent
+    from afts_pro.rl.types import ActionSpec, RLObsSpec
 
     env = _build_env(args.env_config)
     obs_spec = RLObsSpec(shape=env.obs_spec.shape, dtype="float32", as_dict=False)
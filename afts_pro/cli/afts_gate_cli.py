@@ -4,17 +4,19 @@ import argparse
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import yaml
 
-from afts_pro.core.qa_config import QAConfig
-from afts_pro.core.system_gate import GatePolicy, evaluate_gate, load_latest_report, run_gate_from_scratch
-from afts_pro.core.qa_report import save_report
+if TYPE_CHECKING:
+    from afts_pro.core.system_gate import GatePolicy
 
 logger = logging.getLogger(__name__)
 
 
 def _load_policy(path: str) -> GatePolicy:
+    from afts_pro.core.system_gate import GatePolicy
+
     data = yaml.safe_load(Path(path).read_text()) if Path(path).exists() else {}
     return GatePolicy(
         required_sections=data.get("required_sections", GatePolicy().required_sections),
@@ -31,6 +33,8 @@ def main() -> None:
     parser.add_argument("--report-dir", default="runs/qa", help="Directory for QA reports.")
     args = parser.parse_args()
     logging.basicConfig(level=logging.INFO)
+    from afts_pro.core.qa_config import QAConfig
+    from afts_pro.core.system_gate import evaluate_gate, load_latest_report, run_gate_from_scratch
 
     policy = _load_policy(args.policy_config)
     report_dir = Path(args.report_dir)
@@ -4,31 +4,38 @@ import argparse
 import logging
 import uuid
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
-from afts_pro.lab.runner import LabRunner, load_lab_config
-from afts_pro.lab.models import LabExperiment, LabSweepDefinition, RunResult
+if TYPE_CHECKING:
+    from afts_pro.lab.lockstep import LockstepSimApi
 
 logger = logging.getLogger(__name__)
 
 
-class BasicSimApi:
+def _build_sim_api(cfg: Dict[str, Any], profile: str) -> LockstepSimApi:
     """
-    Minimal stub SIM backtest API used by the CLI to allow smoke runs.
+    Lockstep SIM API for the lab config's base profile and first symbol.
     """
-
-    def __init__(self, root_dir: Path):
-        self.root_dir = root_dir
-        self.root_dir.mkdir(parents=True, exist_ok=True)
-
-    def run_backtest(self, profile_name: str, overrides: Dict[str, Any] | None = None, seed: int | None = None) -> RunResult:
-        run_id = uuid.uuid4().hex[:8]
-        run_path = self.root_dir / run_id
-        run_path.mkdir(parents=True, exist_ok=True)
-        metrics = {"pf": 1.0, "winrate": 0.5, "mdd": 0.1, "trades": 10}
-        metrics_path = run_path / "metrics.json"
-        metrics_path.write_text(str(metrics))
-        return RunResult(run_id=run_id, run_path=str(run_path), metrics=metrics)
+    from afts_pro.engine.engine import DATA_ROOT, PROJECT_ROOT
+    from afts_pro.lab.lockstep import LockstepSimApi
+
+    run_cfg = cfg.get("run", {}) or {}
+    output_cfg = cfg.get("output", {}) or {}
+    symbols = run_cfg.get("symbols") or [None]
+    if len(symbols) > 1:
+        logger.warning("LAB | lockstep runs use one symbol | using=%s | ignored=%s", symbols[0], symbols[1:])
+    profile_path = Path(profile) if profile.endswith(".yaml") else PROJECT_ROOT / "configs" / "profiles" / f"{profile}.yaml"
+    return LockstepSimApi.from_profile(
+        profile_path,
+        project_root=PROJECT_ROOT,
+        data_root=DATA_ROOT,
+        output_root=Path(output_cfg.get("root_dir", "runs/lab")) / "raw_runs",
+        symbol=symbols[0],
+        start=run_cfg.get("start_date"),
+        end=run_cfg.get("end_date"),
+        strategy_profile_path=cfg.get("strategy_profile"),
+        record_equity=bool(output_cfg.get("save_equity", False)),
+    )
 
 
 def _parse_params(param_str: str | None) -> Dict[str, Any]:
@@ -65,10 +72,12 @@ def main() -> None:
         parser.print_help()
         return
 
+    from afts_pro.lab.models import LabExperiment, LabSweepDefinition
+    from afts_pro.lab.runner import LabRunner, load_lab_config
+
     cfg = load_lab_config(args.config)
-    output_cfg = cfg.get("output", {})
-    sim_api = BasicSimApi(Path(output_cfg.get("root_dir", "runs/lab/raw_runs")))
-    runner = LabRunner(cfg, sim_api)
+    profile = getattr(args, "profile", None) or cfg.get("base_profile", "sim")
+    runner = LabRunner(cfg, _build_sim_api(cfg, profile))
 
     if args.command == "run-once":
         params = _parse_params(getattr(args, "params", None))
@@ -76,7 +85,7 @@ def main() -> None:
             id=uuid.uuid4().hex[:8],
             name="cli_run",
             mode=cfg.get("default_mode", "strategy_backtest"),
-            base_profile=args.profile or cfg.get("base_profile", "sim"),
+            base_profile=profile,
             params=params,
             seed=None,
             meta={},
@@ -6,10 +6,6 @@ from pathlib import Path
 
 import yaml
 
-from afts_pro.broker.fake import FakeBroker
-from afts_pro.core.live_engine import LiveEngine
-from afts_pro.core.live_runner import LiveConfig, LiveRunner
-
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +15,9 @@ def main() -> None:
     parser.add_argument("--broker", default="fake", help="Broker type (only 'fake' supported in skeleton).")
     args = parser.parse_args()
     logging.basicConfig(level=logging.INFO)
+    from afts_pro.broker.fake import FakeBroker
+    from afts_pro.core.live_engine import LiveEngine
+    from afts_pro.core.live_runner import LiveConfig, LiveRunner
 
     cfg_data = yaml.safe_load(Path(args.config).read_text()) if Path(args.config).exists() else {}
     live_cfg = LiveConfig(**cfg_data)
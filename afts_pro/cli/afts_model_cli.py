@@ -3,10 +3,12 @@ from __future__ import annotations
 import argparse
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import yaml
 
-from afts_pro.core.model_selection import ModelSelectionConfig, ModelSelectionCriteria, ModelSelector
+if TYPE_CHECKING:
+    from afts_pro.core.model_selection import ModelSelector
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +22,8 @@ def _load_profile(name: str, path: str) -> dict:
 
 
 def _build_selector(profile: dict) -> ModelSelector:
+    from afts_pro.core.model_selection import ModelSelectionConfig, ModelSelectionCriteria, ModelSelector
+
     crit_data = profile.get("criteria", {})
     criteria = ModelSelectionCriteria(
         min_profit_factor=crit_data.get("min_profit_factor", 1.1),
@@ -6,9 +6,6 @@ from pathlib import Path
 
 import yaml
 
-from afts_pro.core.qa_config import QAConfig
-from afts_pro.core.qa_report import run_qa_suite, save_report
-
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +16,9 @@ def main() -> None:
     args = parser.parse_args()
 
     logging.basicConfig(level=logging.INFO)
+    from afts_pro.core.qa_config import QAConfig
+    from afts_pro.core.qa_report import run_qa_suite, save_report
+
     cfg_data = yaml.safe_load(Path(args.config).read_text()) if Path(args.config).exists() else {}
     cfg = QAConfig(**cfg_data) if cfg_data else QAConfig()
 
@@ -3,13 +3,17 @@ from __future__ import annotations
 import argparse
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from afts_pro.analysis.quant_analyzer import QuantAnalyzer, load_quant_config
+if TYPE_CHECKING:
+    from afts_pro.analysis.quant_analyzer import QuantAnalyzer
 
 logger = logging.getLogger(__name__)
 
 
 def _build_analyzer(cfg_path: str) -> QuantAnalyzer:
+    from afts_pro.analysis.quant_analyzer import QuantAnalyzer, load_quant_config
+
     config = load_quant_config(cfg_path)
     return QuantAnalyzer(config)
 
@@ -5,8 +5,6 @@ import logging
 from pathlib import Path
 import yaml
 
-from afts_pro.core.train_controller import TrainController, TrainJobConfig
-
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +26,8 @@ def main() -> None:
     parser.add_argument("--agent-type", help="Override agent type (risk/exit).")
     args = parser.parse_args()
     logging.basicConfig(level=logging.INFO)
+    from afts_pro.core.train_controller import TrainController, TrainJobConfig
+
 
     profile = _load_train_profile(args.train_profile, args.profiles_path)
     agent_type = args.agent_type or profile.get("agent_type", "risk")
@@ -0,0 +1,69 @@
+"""
+Import-time profile of a CLI command.
+
+Runs the command under `python -X importtime` and prints the wall time plus the modules
+with the largest cumulative and self import times, e.g.:
+
+    python dev/profile_imports.py -- main.py runs list
+    python dev/profile_imports.py --top 30 -- -m cli.afts_lab_cli --help
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+
+ImportTiming = Tuple[str, int, int]  # module, self_us, cumulative_us
+
+
+def parse_importtime(stderr: str) -> List[ImportTiming]:
+    timings: List[ImportTiming] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        timings.append((name.strip(), int(self_us), int(cumulative_us)))
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Profile import time of an AFTS-PRO command.")
+    parser.add_argument("--top", type=int, default=20, help="Number of modules to list per table.")
+    parser.add_argument("command", nargs=argparse.REMAINDER, help="Script or -m module plus its arguments.")
+    args = parser.parse_args()
+    if args.command[:1] == ["--"]:
+        args.command = args.command[1:]
+    if not args.command:
+        parser.error("no command given")
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(ROOT / "src"), str(ROOT), os.environ.get("PYTHONPATH")])))
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args.command],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    timings = parse_importtime(proc.stderr)
+    total_ms = sum(t[1] for t in timings) / 1000
+    print(f"command: {' '.join(args.command)} | exit={proc.returncode} | wall={wall_ms:.0f} ms | imports={total_ms:.0f} ms | modules={len(timings)}")
+    heavy = [name for name in ("numpy", "pandas", "pyarrow", "sklearn", "torch", "fastapi") if any(t[0] == name for t in timings)]
+    print(f"heavy packages loaded: {', '.join(heavy) or '-'}")
+    for title, index in (("cumulative", 2), ("self", 1)):
+        print(f"\ntop {args.top} by {title} time:")
+        for name, self_us, cumulative_us in sorted(timings, key=lambda t: t[index], reverse=True)[: args.top]:
+            print(f"  {cumulative_us / 1000:8.1f} ms  {self_us / 1000:7.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
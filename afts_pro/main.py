@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 import sys
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import typer
 
@@ -15,34 +14,28 @@ SRC_DIR = ROOT_DIR / "src"
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
-from afts_pro.core import Mode, ModeDispatcher
-from afts_pro.engine import start as engine_start
-from afts_pro.utils.logging import configure_logging, setup_logging
-from afts_pro.config import (
-    global_config_summary,
-    list_profile_paths,
-    load_global_config_from_profile,
-    run_all_validations,
-)
-from afts_pro.data import ExtrasLoader
-from afts_pro.features import FeatureEngine
-from afts_pro.data import ParquetFeed, MarketStateBuilder
-
-try:
-    import uvloop
-except ImportError:  # pragma: no cover - optional dependency
-    uvloop = None
-
-
-app = typer.Typer(no_args_is_help=True, add_completion=False)
-config_app = typer.Typer(no_args_is_help=True, add_completion=False, help="Config validation and dump utilities.")
-extras_app = typer.Typer(no_args_is_help=True, add_completion=False, help="Extras utilities.")
-runs_app = typer.Typer(no_args_is_help=True, add_completion=False, help="Run history utilities.")
+# Only what the CLI definition needs is imported here; each command imports its own
+# dependencies (config, engine, data, pandas) so `--help` and light commands start fast.
+from afts_pro.core.mode_dispatcher import Mode
+from afts_pro.utils.logging import setup_logging
+
+if TYPE_CHECKING:
+    from afts_pro.config.runlogger_config import RunLoggerConfig
+
+
+app = typer.Typer(no_args_is_help=True, add_completion=False, rich_markup_mode=None)
+config_app = typer.Typer(no_args_is_help=True, add_completion=False, rich_markup_mode=None, help="Config validation and dump utilities.")
+extras_app = typer.Typer(no_args_is_help=True, add_completion=False, rich_markup_mode=None, help="Extras utilities.")
+runs_app = typer.Typer(no_args_is_help=True, add_completion=False, rich_markup_mode=None, help="Run history utilities.")
+data_app = typer.Typer(no_args_is_help=True, add_completion=False, rich_markup_mode=None, help="Data catalog utilities.")
 logger = logging.getLogger(__name__)
 
 
-async def _start_mode(mode: Mode, profile_path: str) -> None:
-    dispatcher = ModeDispatcher(lambda m: engine_start(m, profile_path=profile_path))
+async def _start_mode(mode: Mode, profile_path: str, resume: bool = False) -> None:
+    from afts_pro.core.mode_dispatcher import ModeDispatcher
+    from afts_pro.engine import start as engine_start
+
+    dispatcher = ModeDispatcher(lambda m: engine_start(m, profile_path=profile_path, resume=resume))
     await dispatcher.dispatch(mode)
 
 
@@ -52,6 +45,8 @@ def _resolve_profile_selection(profile: str, profile_path: Optional[str]) -> Tup
         profile_name = resolved_profile.stem
         return profile_name, resolved_profile
 
+    from afts_pro.config.profile_config import list_profile_paths
+
     available = list_profile_paths(str(ROOT_DIR / "configs" / "profiles"))
     resolved = available.get(profile)
     if resolved is None:
@@ -62,6 +57,14 @@ def _resolve_profile_selection(profile: str, profile_path: Optional[str]) -> Tup
     return profile_name, resolved_profile
 
 
+def _load_runlogger_config(resolved_profile: Path) -> "RunLoggerConfig":
+    # Run history commands only need the runlogger section, not the full GlobalConfig.
+    from afts_pro.config.profile_config import get_profile_include_path
+    from afts_pro.config.runlogger_config import load_runlogger_config
+
+    return load_runlogger_config(str(get_profile_include_path(str(resolved_profile), "runlogger")))
+
+
 @app.callback(invoke_without_command=True)
 def main(
     ctx: typer.Context,
@@ -90,11 +93,30 @@ def main(
         "--profile-path",
         help="Explicit path to a profile YAML (overrides --profile).",
     ),
+    sample_profile: bool = typer.Option(
+        False,
+        "--sample-profile",
+        help="Run the sampling profiler during SIM and write profile.folded into the run directory.",
+    ),
+    sample_interval_ms: float = typer.Option(
+        5.0,
+        "--sample-interval-ms",
+        help="Sampling interval of --sample-profile in milliseconds.",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Continue the latest interrupted SIM run of this profile from its last checkpoint.",
+    ),
 ) -> None:
     if ctx.invoked_subcommand:
         return
 
     setup_logging(level=log_level)
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - optional dependency
+        uvloop = None
     if uvloop is not None:
         uvloop.install()
         logger.debug("uvloop event loop policy installed")
@@ -104,7 +126,51 @@ def main(
 
     logger.info("PROFILE_SELECTED | name=%s | path=%s", profile_name, resolved_profile)
     logger.info("Starting AFTS-PRO in mode=%s", mode.value)
-    asyncio.run(_start_mode(mode, str(resolved_profile)))
+    if sample_profile:
+        from afts_pro.engine import set_sampling_profiler
+
+        set_sampling_profiler(sample_interval_ms)
+    import asyncio
+
+    asyncio.run(_start_mode(mode, str(resolved_profile), resume=resume))
+
+
+@app.command("portfolio")
+def portfolio(
+    symbol: Optional[List[str]] = typer.Option(
+        None, "--symbol", "-s", help="Symbol to simulate (repeatable); defaults to every asset of the profile."
+    ),
+    workers: Optional[int] = typer.Option(None, "--workers", "-w", help="Worker processes (default: CPU count)."),
+    profile: str = typer.Option("sim", "--profile", "-p", help="Name of config profile."),
+    profile_path: str = typer.Option(None, "--profile-path", help="Explicit path to a profile YAML."),
+    log_level: str = typer.Option("INFO", "--log-level", "-l", help="Logging level."),
+    worker_log_level: str = typer.Option("WARNING", "--worker-log-level", help="Logging level inside the workers."),
+) -> None:
+    """
+    Run the SIM profile over several symbols in parallel and merge them into a portfolio run.
+    """
+    from afts_pro.config.global_config import load_global_config_from_profile
+    from afts_pro.engine.portfolio import run_portfolio
+
+    setup_logging(level=log_level)
+    profile_name, resolved_profile = _resolve_profile_selection(profile, profile_path)
+    logger.info("PROFILE_SELECTED | name=%s | path=%s", profile_name, resolved_profile)
+    symbols = list(symbol or load_global_config_from_profile(str(resolved_profile)).assets.assets.keys())
+    if not symbols:
+        logger.error("PORTFOLIO_ERROR | no symbols given and the profile lists no assets")
+        raise typer.Exit(code=1)
+    result = run_portfolio(str(resolved_profile), symbols, max_workers=workers, log_level=worker_log_level)
+    for run in result.runs:
+        status = f"error={run.error}" if run.error else f"run={Path(run.run_dir).name if run.run_dir else '-'}"
+        typer.echo(f"{run.symbol} | {run.elapsed_s:.1f}s | {status}")
+    extra = result.metrics.get("additional", {})
+    typer.echo(
+        f"Portfolio: {result.portfolio_dir.name} | net_pnl={extra.get('net_pnl')} | trades={result.metrics.get('num_trades')} "
+        f"| maxDD={result.metrics.get('max_drawdown_pct')} | wall={result.elapsed_s:.1f}s "
+        f"| slowest={extra.get('max_symbol_time_s', 0.0):.1f}s"
+    )
+    if any(run.error for run in result.runs):
+        raise typer.Exit(code=1)
 
 
 @config_app.command("validate")
@@ -113,11 +179,17 @@ def config_validate(
     profile_path: str = typer.Option(None, "--profile-path", help="Explicit path to a profile YAML."),
     log_level: str = typer.Option("INFO", "--log-level", "-l", help="Logging level."),
 ) -> None:
+    from afts_pro.config.global_config import global_config_summary, load_global_config_from_profile
+    from afts_pro.config.validator import run_all_validations
+    from afts_pro.data.catalog import DataCatalog
+
     setup_logging(level=log_level)
     profile_name, resolved_profile = _resolve_profile_selection(profile, profile_path)
     logger.info("PROFILE_SELECTED | name=%s | path=%s", profile_name, resolved_profile)
     global_config = load_global_config_from_profile(str(resolved_profile))
-    ok, messages = run_all_validations(global_config, ROOT_DIR / "data" / "final_agg")
+    # The persisted catalog as is: refresh() would read footers and hash changed files.
+    catalog = DataCatalog(ROOT_DIR / "data")
+    ok, messages = run_all_validations(global_config, ROOT_DIR / "data" / "final_agg", catalog=catalog)
     summary = global_config_summary(global_config)
     logger.info("CONFIG SUMMARY | %s", summary)
     for msg in messages:
@@ -136,6 +208,8 @@ def config_dump(
     format: str = typer.Option("table", "--format", help="Output format: table or json"),
     log_level: str = typer.Option("INFO", "--log-level", "-l", help="Logging level."),
 ) -> None:
+    from afts_pro.config.global_config import global_config_summary, load_global_config_from_profile
+
     setup_logging(level=log_level)
     profile_name, resolved_profile = _resolve_profile_selection(profile, profile_path)
     logger.info("PROFILE_SELECTED | name=%s | path=%s", profile_name, resolved_profile)
@@ -165,6 +239,10 @@ def extras_check(
     profile_path: str = typer.Option(None, "--profile-path", help="Explicit path to a profile YAML."),
     log_level: str = typer.Option("INFO", "--log-level", "-l", help="Logging level."),
 ) -> None:
+    from afts_pro.config.global_config import load_global_config_from_profile
+    from afts_pro.data.catalog import DataCatalog
+    from afts_pro.data.extras_loader import ExtrasLoader
+
     setup_logging(level=log_level)
     profile_name, resolved_profile = _resolve_profile_selection(profile, profile_path)
     logger.info("PROFILE_SELECTED | name=%s | path=%s", profile_name, resolved_profile)
@@ -172,9 +250,21 @@ def extras_check(
     if not global_config.extras.enabled:
         logger.info("Extras loader disabled in config; nothing to check.")
         return
-    loader = ExtrasLoader(global_config.extras)
-    series_map = loader.load_for_symbol(symbol)
-    logger.info("EXTRAS_CHECK | symbol=%s | datasets_loaded=%s", symbol, list(series_map.keys()))
+    loader = ExtrasLoader(global_config.extras, catalog=DataCatalog(ROOT_DIR / "data").refresh())
+    described = loader.describe_for_symbol(symbol)
+    for name, entry in described.items():
+        if entry is None:
+            logger.info("EXTRAS_CHECK | symbol=%s | dataset=%s | not indexed in data catalog", symbol, name)
+            continue
+        logger.info(
+            "EXTRAS_CHECK | symbol=%s | dataset=%s | rows=%d | first=%s | last=%s",
+            symbol,
+            name,
+            entry.rows,
+            entry.first_ts,
+            entry.last_ts,
+        )
+    logger.info("EXTRAS_CHECK | symbol=%s | datasets_found=%s", symbol, list(described.keys()))
 
 
 @extras_app.command("preview")
@@ -185,6 +275,10 @@ def extras_preview(
     profile_path: str = typer.Option(None, "--profile-path", help="Explicit path to a profile YAML."),
     log_level: str = typer.Option("INFO", "--log-level", "-l", help="Logging level."),
 ) -> None:
+    from afts_pro.config.global_config import load_global_config_from_profile
+    from afts_pro.data import DataCatalog, ExtrasLoader, MarketStateBuilder, ParquetFeed
+    from afts_pro.features import FeatureEngine
+
     setup_logging(level=log_level)
     profile_name, resolved_profile = _resolve_profile_selection(profile, profile_path)
     logger.info("PROFILE_SELECTED | name=%s | path=%s", profile_name, resolved_profile)
@@ -192,16 +286,18 @@ def extras_preview(
     if not global_config.extras.enabled:
         logger.info("EXTRAS_PREVIEW | extras disabled in config.")
         return
-    extras_loader = ExtrasLoader(global_config.extras)
+    catalog = DataCatalog(ROOT_DIR / "data").refresh()
+    extras_loader = ExtrasLoader(global_config.extras, catalog=catalog)
     extras_map = extras_loader.load_for_symbol(symbol)
     if not extras_map:
         logger.info("EXTRAS_PREVIEW | no extras available for symbol=%s", symbol)
         return
     feature_engine = FeatureEngine(global_config.features)
     feature_engine.attach_extras(extras_map)
-    feed = ParquetFeed(ROOT_DIR / "data")
+    feed = ParquetFeed(ROOT_DIR / "data", catalog=catalog)
     builder = MarketStateBuilder(feed)
-    ms_iter = builder.iter_market_states(symbol=symbol, folder="final_agg")
+    # Streaming decodes only the leading row group(s) needed for the preview.
+    ms_iter = builder.iter_market_states(symbol=symbol, folder="final_agg", stream=True)
     for idx, ms in enumerate(ms_iter):
         if idx >= bars:
             break
@@ -211,6 +307,29 @@ def extras_preview(
             ms.timestamp.isoformat(),
             list(bundle.extras.values.keys()) if bundle.extras else [],
         )
+    logger.info(
+        "EXTRAS_PREVIEW | symbol=%s | configured=%s | loaded=%s",
+        symbol,
+        list(extras_map),
+        [name for name in extras_map if extras_map.is_loaded(name)],
+    )
+
+
+@data_app.command("catalog")
+def data_catalog(
+    folder: str = typer.Option(None, "--folder", "-f", help="Only list files in this folder (e.g. final_agg)."),
+    log_level: str = typer.Option("INFO", "--log-level", "-l", help="Logging level."),
+) -> None:
+    from afts_pro.data.catalog import DataCatalog
+
+    setup_logging(level=log_level)
+    catalog = DataCatalog(ROOT_DIR / "data").refresh()
+    for entry in catalog.find(folder=folder):
+        typer.echo(
+            f"{entry.path} | symbol={entry.symbol} | timeframe={entry.timeframe or '-'} | rows={entry.rows} | "
+            f"first={entry.first_ts} | last={entry.last_ts} | row_groups={len(entry.row_groups)} | "
+            f"hash={entry.content_hash[:12]}"
+        )
 
 
 @runs_app.command("list")
@@ -221,8 +340,7 @@ def runs_list(
 ) -> None:
     setup_logging(level=log_level)
     profile_name, resolved_profile = _resolve_profile_selection(profile, profile_path)
-    global_config = load_global_config_from_profile(str(resolved_profile))
-    run_cfg = global_config.runlogger
+    run_cfg = _load_runlogger_config(resolved_profile)
     base_dir = Path(run_cfg.base_dir)
     if not base_dir.is_absolute():
         base_dir = ROOT_DIR / base_dir
@@ -254,8 +372,7 @@ def runs_metrics(
 ) -> None:
     setup_logging(level=log_level)
     _, resolved_profile = _resolve_profile_selection(profile, profile_path)
-    global_config = load_global_config_from_profile(str(resolved_profile))
-    run_cfg = global_config.runlogger
+    run_cfg = _load_runlogger_config(resolved_profile)
     base_dir = Path(run_cfg.base_dir)
     if not base_dir.is_absolute():
         base_dir = ROOT_DIR / base_dir
@@ -283,9 +400,40 @@ def runs_metrics(
     typer.echo("\n".join(lines))
 
 
+@runs_app.command("events")
+def runs_events(
+    run_id: str = typer.Option(..., "--run-id", "-r", help="Run identifier (folder name)."),
+    event: Optional[List[str]] = typer.Option(None, "--event", "-e", help="Only these event types (repeatable)."),
+    start_bar: Optional[int] = typer.Option(None, "--start-bar", help="First bar index to show."),
+    end_bar: Optional[int] = typer.Option(None, "--end-bar", help="Last bar index to show."),
+    limit: int = typer.Option(50, "--limit", "-n", help="Maximum number of events to print (0 = all)."),
+    profile: str = typer.Option("sim", "--profile", "-p", help="Name of config profile."),
+    profile_path: str = typer.Option(None, "--profile-path", help="Explicit path to a profile YAML."),
+    log_level: str = typer.Option("INFO", "--log-level", "-l", help="Logging level."),
+) -> None:
+    from afts_pro.runlogger.journal import format_event, read_journal
+
+    setup_logging(level=log_level)
+    _, resolved_profile = _resolve_profile_selection(profile, profile_path)
+    run_cfg = _load_runlogger_config(resolved_profile)
+    base_dir = Path(run_cfg.base_dir)
+    if not base_dir.is_absolute():
+        base_dir = ROOT_DIR / base_dir
+    journal_path = base_dir / run_id / run_cfg.filename_patterns.get("journal", "events.parquet")
+    if not journal_path.exists():
+        logger.error("Event journal not found: %s", journal_path)
+        raise typer.Exit(code=1)
+    df = read_journal(journal_path, events=event, start_bar=start_bar, end_bar=end_bar)
+    typer.echo(f"Run: {run_id} | events={len(df)} | by_type={df['event'].value_counts().to_dict()}")
+    rows = df if limit <= 0 else df.head(limit)
+    for row in rows.itertuples(index=False):
+        typer.echo(format_event(row))
+
+
 app.add_typer(config_app, name="config")
 app.add_typer(extras_app, name="extras")
 app.add_typer(runs_app, name="runs")
+app.add_typer(data_app, name="data")
 
 
 if __name__ == "__main__":
@@ -5,7 +5,6 @@ from __future__ import annotations
 from typing import Sequence
 
 import numpy as np
-from sklearn.cluster import KMeans
 
 from research_lab.backend.core.analytics.models import RegimeClusteringResult
 
@@ -36,6 +35,9 @@ class RegimeClusteringService:
         if X.shape[0] < n_clusters:
             raise ValueError("number of samples must be >= n_clusters.")
 
+        # scikit-learn is imported on first use so the research API starts without it.
+        from sklearn.cluster import KMeans
+
         model = KMeans(n_clusters=n_clusters, random_state=self.random_state, n_init=10)
         labels = model.fit_predict(X)
         return RegimeClusteringResult(n_clusters=n_clusters, labels=labels.tolist())
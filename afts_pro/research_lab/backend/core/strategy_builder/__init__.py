@@ -12,6 +12,7 @@ from research_lab.backend.core.strategy_builder.node_catalog import NodeCatalog
 from research_lab.backend.core.strategy_builder.graph_engine import GraphEngine
 from research_lab.backend.core.strategy_builder.dsl_serializer import StrategyDslSerializer
 from research_lab.backend.core.strategy_builder.config_translator import StrategyConfigTranslator
+from research_lab.backend.core.strategy_builder.price_sources import PriceSourceResolver
 
 __all__ = [
     "NodeParamDefinition",
@@ -24,4 +25,5 @@ __all__ = [
     "GraphEngine",
     "StrategyDslSerializer",
     "StrategyConfigTranslator",
+    "PriceSourceResolver",
 ]
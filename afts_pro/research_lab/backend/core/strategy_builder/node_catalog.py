@@ -60,6 +60,8 @@ class NodeCatalog:
                     NodeParamDefinition(name="symbol", dtype="string", required=True),
                     NodeParamDefinition(name="timeframe", dtype="string", required=True),
                     NodeParamDefinition(name="aggregation", dtype="string", required=False, default="ohlc"),
+                    NodeParamDefinition(name="session_offset", dtype="string", required=False),
+                    NodeParamDefinition(name="session_tz", dtype="string", required=False),
                 ],
                 tags=["price", "ohlcv", "htf"],
                 version="1.0.0",
@@ -0,0 +1,67 @@
+"""Resolve price source nodes of a strategy graph to OHLCV frames."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from research_lab.backend.core.strategy_builder.models import StrategyNode
+
+PRICE_SOURCE_TYPES = {"price_source", "htf_price_source"}
+
+
+class PriceSourceResolver:
+    """Loads bars for `price_source` / `htf_price_source` nodes through a ParquetFeed.
+
+    Timeframes without a pre-aggregated file are resampled from the base series by the feed.
+    `htf_price_source` additionally accepts optional `session_offset` / `session_tz` params to
+    align its buckets to a trading session.
+    """
+
+    def __init__(self, feed: Optional[Any] = None, data_root: Optional[Path] = None) -> None:
+        if feed is None:
+            from afts_pro.data import ParquetFeed
+
+            feed = ParquetFeed(Path(data_root) if data_root else Path("data"))
+        self.feed = feed
+
+    def describe(self, node: StrategyNode) -> Optional[Any]:
+        """Catalog entry backing the node (pre-aggregated file or resampling base), without reading data.
+
+        Returns None when the feed has no data catalog or the source is not indexed.
+        """
+
+        catalog = getattr(self.feed, "catalog", None)
+        symbol, timeframe = self._symbol_timeframe(node)
+        if catalog is None:
+            return None
+        return catalog.lookup(f"{symbol}_{timeframe}") or catalog.lookup(symbol, folder=self.feed.base_folder)
+
+    def load(self, node: StrategyNode, start: Optional[Any] = None, end: Optional[Any] = None):
+        """Return the OHLCV frame (UTC `timestamp` column, sorted) for the node."""
+
+        symbol, timeframe = self._symbol_timeframe(node)
+        if node.type == "htf_price_source":
+            aggregation = node.params.get("aggregation", "ohlc")
+            if aggregation != "ohlc":
+                raise ValueError(f"Unsupported aggregation '{aggregation}' for node '{node.id}'.")
+            offset = node.params.get("session_offset")
+            tz = node.params.get("session_tz")
+            if offset or tz:
+                path = self.feed.resample(symbol, timeframe, offset=offset, tz=tz)
+                return self.feed.load(str(path), start=start, end=end)
+
+        return self.feed.load(f"{symbol}_{timeframe}", start=start, end=end)
+
+    @staticmethod
+    def _symbol_timeframe(node: StrategyNode) -> Tuple[str, str]:
+        if node.type not in PRICE_SOURCE_TYPES:
+            raise ValueError(f"Node '{node.id}' of type '{node.type}' is not a price source.")
+        symbol = node.params.get("symbol")
+        timeframe = node.params.get("timeframe")
+        if not symbol or not timeframe:
+            raise ValueError(f"Node '{node.id}' requires 'symbol' and 'timeframe' params.")
+        return symbol, timeframe
+
+
+__all__ = ["PRICE_SOURCE_TYPES", "PriceSourceResolver"]
@@ -1,10 +1,4 @@
-from afts_pro.analysis.models import (
-    RollingKpiResult,
-    MonteCarloResult,
-    DriftResult,
-    RegimeResult,
-)
-from afts_pro.analysis.quant_analyzer import QuantAnalyzer, load_quant_config
+from afts_pro.utils.lazy import lazy_exports
 
 __all__ = [
     "QuantAnalyzer",
@@ -14,3 +8,16 @@ __all__ = [
     "RegimeResult",
     "load_quant_config",
 ]
+
+# Submodules are imported on first attribute access (PEP 562).
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "RollingKpiResult": "afts_pro.analysis.models",
+        "MonteCarloResult": "afts_pro.analysis.models",
+        "DriftResult": "afts_pro.analysis.models",
+        "RegimeResult": "afts_pro.analysis.models",
+        "QuantAnalyzer": "afts_pro.analysis.quant_analyzer",
+        "load_quant_config": "afts_pro.analysis.quant_analyzer",
+    },
+)
@@ -2,19 +2,7 @@
 Behaviour guards to protect trading discipline.
 """
 
-from .base_guard import BaseBehaviourGuard, BehaviourDecision, TradeStats
-from .guards import (
-    BigLossCooldownGuard,
-    CooldownAfterLossGuard,
-    DailyPnLGuard,
-    DailyProfitTargetGuard,
-    MaxConsecutiveLossesGuard,
-    MaxOpenPositionsGuard,
-    MaxTradesPerDayGuard,
-    SessionTimeWindowGuard,
-)
-from .manager import BehaviourManager
-from .config import BehaviourConfig, create_guards_from_config, load_behaviour_config
+from afts_pro.utils.lazy import lazy_exports
 
 __all__ = [
     "BehaviourDecision",
@@ -33,3 +21,25 @@ __all__ = [
     "load_behaviour_config",
     "create_guards_from_config",
 ]
+
+# Submodules are imported on first attribute access (PEP 562).
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BaseBehaviourGuard": ".base_guard",
+        "BehaviourDecision": ".base_guard",
+        "TradeStats": ".base_guard",
+        "BigLossCooldownGuard": ".guards",
+        "CooldownAfterLossGuard": ".guards",
+        "DailyPnLGuard": ".guards",
+        "DailyProfitTargetGuard": ".guards",
+        "MaxConsecutiveLossesGuard": ".guards",
+        "MaxOpenPositionsGuard": ".guards",
+        "MaxTradesPerDayGuard": ".guards",
+        "SessionTimeWindowGuard": ".guards",
+        "BehaviourManager": ".manager",
+        "BehaviourConfig": ".config",
+        "create_guards_from_config": ".config",
+        "load_behaviour_config": ".config",
+    },
+)
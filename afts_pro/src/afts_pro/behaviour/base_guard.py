@@ -62,3 +62,17 @@ class BaseBehaviourGuard:
         Decide if new orders are allowed before order construction.
         """
         return BehaviourDecision(allow_new_orders=True)
+
+    def next_wakeup(
+        self,
+        *,
+        ts: datetime,
+        stats: TradeStats,
+        account_state: AccountState,
+        decision: BehaviourDecision,
+    ) -> Optional[datetime]:
+        """
+        Earliest time before_new_orders may return something other than `decision` while no
+        trade closes (None: not at all). The default, ts, means "re-evaluate on every bar".
+        """
+        return ts
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from datetime import time
 from typing import List, Optional
 
 from pydantic import BaseModel
 
 from afts_pro.behaviour.base_guard import BaseBehaviourGuard, BehaviourDecision, TradeStats
+from afts_pro.core.wakeup import next_day_start
 from afts_pro.exec.position_models import AccountState
 
 logger = logging.getLogger(__name__)
@@ -34,6 +35,12 @@ class MaxTradesPerDayGuard(BaseBehaviourGuard):
             )
         return BehaviourDecision(allow_new_orders=True)
 
+    def next_wakeup(
+        self, *, ts: datetime, stats: TradeStats, account_state: AccountState, decision: BehaviourDecision
+    ) -> Optional[datetime]:
+        # Daily stats only change on trade close or at the midnight reset.
+        return None if decision.allow_new_orders else next_day_start(ts)
+
 
 class MaxConsecutiveLossesGuard(BaseBehaviourGuard):
     def __init__(self, max_consecutive_losses: int) -> None:
@@ -74,6 +81,11 @@ class MaxConsecutiveLossesGuard(BaseBehaviourGuard):
             )
         return BehaviourDecision(allow_new_orders=True)
 
+    def next_wakeup(
+        self, *, ts: datetime, stats: TradeStats, account_state: AccountState, decision: BehaviourDecision
+    ) -> Optional[datetime]:
+        return None if decision.allow_new_orders else next_day_start(ts)
+
 
 class CooldownAfterLossGuard(BaseBehaviourGuard):
     def __init__(self, cooldown_minutes: int) -> None:
@@ -113,6 +125,13 @@ class CooldownAfterLossGuard(BaseBehaviourGuard):
 
         return BehaviourDecision(allow_new_orders=True)
 
+    def next_wakeup(
+        self, *, ts: datetime, stats: TradeStats, account_state: AccountState, decision: BehaviourDecision
+    ) -> Optional[datetime]:
+        if decision.allow_new_orders or self.last_loss_ts is None:
+            return None
+        return self.last_loss_ts + timedelta(minutes=self.cooldown_minutes)
+
 
 class DailyPnLGuard(BaseBehaviourGuard):
     def __init__(
@@ -161,6 +180,11 @@ class DailyPnLGuard(BaseBehaviourGuard):
 
         return BehaviourDecision(allow_new_orders=True)
 
+    def next_wakeup(
+        self, *, ts: datetime, stats: TradeStats, account_state: AccountState, decision: BehaviourDecision
+    ) -> Optional[datetime]:
+        return None if decision.allow_new_orders else next_day_start(ts)
+
 
 class DailyProfitTargetGuard(BaseBehaviourGuard):
     def __init__(
@@ -192,6 +216,11 @@ class DailyProfitTargetGuard(BaseBehaviourGuard):
             )
         return BehaviourDecision(allow_new_orders=True)
 
+    def next_wakeup(
+        self, *, ts: datetime, stats: TradeStats, account_state: AccountState, decision: BehaviourDecision
+    ) -> Optional[datetime]:
+        return None if decision.allow_new_orders else next_day_start(ts)
+
 
 class MaxOpenPositionsGuard(BaseBehaviourGuard):
     def __init__(self, max_open_positions: int) -> None:
@@ -211,6 +240,12 @@ class MaxOpenPositionsGuard(BaseBehaviourGuard):
             )
         return BehaviourDecision(allow_new_orders=True)
 
+    def next_wakeup(
+        self, *, ts: datetime, stats: TradeStats, account_state: AccountState, decision: BehaviourDecision
+    ) -> Optional[datetime]:
+        # Open positions only change through fills.
+        return None
+
 
 class SessionTimeWindowConfig(BaseModel):
     name: str
@@ -245,6 +280,22 @@ class SessionTimeWindowGuard(BaseBehaviourGuard):
             meta={"ts": ts.isoformat(), "windows": [w.name for w in self.windows]},
         )
 
+    def next_wakeup(
+        self, *, ts: datetime, stats: TradeStats, account_state: AccountState, decision: BehaviourDecision
+    ) -> Optional[datetime]:
+        # Next window start or end within the coming week (weekday filters repeat weekly).
+        candidates = []
+        for offset in range(8):
+            day = ts.date() + timedelta(days=offset)
+            for window in self.windows:
+                if window.weekdays is not None and day.weekday() not in window.weekdays:
+                    continue
+                for boundary in (window.start_time, window.end_time):
+                    moment = datetime.combine(day, boundary, tzinfo=ts.tzinfo)
+                    if moment > ts:
+                        candidates.append(moment)
+        return min(candidates) if candidates else None
+
 
 class BigLossCooldownGuard(BaseBehaviourGuard):
     def __init__(self, *, initial_balance: float, big_loss_pct_initial: float, cooldown_minutes: int) -> None:
@@ -285,3 +336,10 @@ class BigLossCooldownGuard(BaseBehaviourGuard):
             )
 
         return BehaviourDecision(allow_new_orders=True)
+
+    def next_wakeup(
+        self, *, ts: datetime, stats: TradeStats, account_state: AccountState, decision: BehaviourDecision
+    ) -> Optional[datetime]:
+        if decision.allow_new_orders or self.last_big_loss_ts is None:
+            return None
+        return self.last_big_loss_ts + timedelta(minutes=self.cooldown_minutes)
@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 from typing import List, Optional
 
 from afts_pro.behaviour.base_guard import BaseBehaviourGuard, BehaviourDecision, TradeStats
+from afts_pro.core.wakeup import earliest
 from afts_pro.exec.position_models import AccountState
 
 logger = logging.getLogger(__name__)
@@ -58,3 +59,16 @@ class BehaviourManager:
             )
 
         return BehaviourDecision(allow_new_orders=True)
+
+    def next_wakeup(self, ts: datetime, account_state: AccountState) -> Optional[datetime]:
+        """
+        Earliest time the combined decision at ts may change while no trade closes.
+        """
+        wake: Optional[datetime] = None
+        for guard in self.guards:
+            decision = guard.before_new_orders(ts=ts, stats=self.stats, account_state=account_state)
+            guard_wake = guard.next_wakeup(ts=ts, stats=self.stats, account_state=account_state, decision=decision)
+            if guard_wake is not None and guard_wake <= ts:
+                return ts
+            wake = earliest(wake, guard_wake)
+        return wake
@@ -1,32 +1,4 @@
-from afts_pro.config.asset_config import AssetConfig, AssetSpec
-from afts_pro.config.behaviour_config import BehaviourConfig, create_guards, load_behaviour_config
-from afts_pro.config.environment_config import EnvironmentConfig
-from afts_pro.config.execution_config import ExecutionConfig
-from afts_pro.config.global_config import (
-    GlobalConfig,
-    load_global_config_from_profile,
-    load_all_configs_into_global,
-    load_global_config,
-    validate_global_config,
-)
-from afts_pro.config.loader import load_yaml, reload_global_config, save_yaml
-from afts_pro.config.profile_config import ProfileConfig, ProfileIncludes, list_profile_paths, load_profile
-from afts_pro.config.risk_config import RiskConfig
-from afts_pro.config.strategy_config import StrategyConfig
-from afts_pro.config.global_config import global_config_summary
-from afts_pro.config.feature_config import FeatureConfig, load_feature_config
-from afts_pro.config.extras_config import ExtrasConfig, load_extras_config
-from afts_pro.config.runlogger_config import RunLoggerConfig, load_runlogger_config
-from afts_pro.config.validator import (
-    run_all_validations,
-    validate_assets,
-    validate_behaviour,
-    validate_paths,
-    validate_strategies,
-    validate_features,
-    validate_extras,
-    validate_runlogger,
-)
+from afts_pro.utils.lazy import lazy_exports
 
 __all__ = [
     "AssetConfig",
@@ -44,6 +16,8 @@ __all__ = [
     "load_all_configs_into_global",
     "load_global_config_from_profile",
     "validate_global_config",
+    "reload_config_sections",
+    "ConfigWatcher",
     "load_yaml",
     "reload_global_config",
     "save_yaml",
@@ -66,3 +40,48 @@ __all__ = [
     "load_extras_config",
     "load_runlogger_config",
 ]
+
+# Submodules are imported on first attribute access (PEP 562).
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AssetConfig": "afts_pro.config.asset_config",
+        "AssetSpec": "afts_pro.config.asset_config",
+        "BehaviourConfig": "afts_pro.config.behaviour_config",
+        "create_guards": "afts_pro.config.behaviour_config",
+        "load_behaviour_config": "afts_pro.config.behaviour_config",
+        "EnvironmentConfig": "afts_pro.config.environment_config",
+        "ExecutionConfig": "afts_pro.config.execution_config",
+        "GlobalConfig": "afts_pro.config.global_config",
+        "load_global_config_from_profile": "afts_pro.config.global_config",
+        "load_all_configs_into_global": "afts_pro.config.global_config",
+        "load_global_config": "afts_pro.config.global_config",
+        "reload_config_sections": "afts_pro.config.global_config",
+        "validate_global_config": "afts_pro.config.global_config",
+        "load_yaml": "afts_pro.config.loader",
+        "reload_global_config": "afts_pro.config.loader",
+        "save_yaml": "afts_pro.config.loader",
+        "ProfileConfig": "afts_pro.config.profile_config",
+        "ProfileIncludes": "afts_pro.config.profile_config",
+        "list_profile_paths": "afts_pro.config.profile_config",
+        "load_profile": "afts_pro.config.profile_config",
+        "RiskConfig": "afts_pro.config.risk_config",
+        "StrategyConfig": "afts_pro.config.strategy_config",
+        "global_config_summary": "afts_pro.config.global_config",
+        "FeatureConfig": "afts_pro.config.feature_config",
+        "load_feature_config": "afts_pro.config.feature_config",
+        "ExtrasConfig": "afts_pro.config.extras_config",
+        "load_extras_config": "afts_pro.config.extras_config",
+        "RunLoggerConfig": "afts_pro.config.runlogger_config",
+        "load_runlogger_config": "afts_pro.config.runlogger_config",
+        "ConfigWatcher": "afts_pro.config.watcher",
+        "run_all_validations": "afts_pro.config.validator",
+        "validate_assets": "afts_pro.config.validator",
+        "validate_behaviour": "afts_pro.config.validator",
+        "validate_paths": "afts_pro.config.validator",
+        "validate_strategies": "afts_pro.config.validator",
+        "validate_features": "afts_pro.config.validator",
+        "validate_extras": "afts_pro.config.validator",
+        "validate_runlogger": "afts_pro.config.validator",
+    },
+)
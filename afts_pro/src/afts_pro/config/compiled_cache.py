@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - typing only; global_config imports this module
+    from afts_pro.config.global_config import GlobalConfig
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+# Files changed this close to the moment they were recorded may share an mtime with a later
+# write, so their stat signature is not trusted and the content is hashed instead.
+_RACY_WINDOW_NS = 2_000_000_000
+MAX_ENTRIES = 256
+# Model code the compiled objects depend on: editing it invalidates every entry.
+_MODEL_SOURCES = (Path(__file__).resolve().parent, Path(__file__).resolve().parents[1] / "behaviour" / "config.py")
+
+Dependency = Tuple[int, int, str]  # size, mtime_ns, content hash
+
+
+def _content_hash(path: Path) -> str:
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+def _models_fingerprint() -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(CACHE_VERSION).encode())
+    for source in _MODEL_SOURCES:
+        files = sorted(source.glob("*.py")) if source.is_dir() else [source]
+        for path in files:
+            stat = path.stat()
+            digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()
+
+
+class CompiledConfigCache:
+    """
+    GlobalConfig cache keyed by the content of every file the config was built from.
+
+    An entry holds the pickled GlobalConfig plus (size, mtime, content hash) of the profile
+    and each include. It is used while every file still matches: an unchanged stat
+    signature is trusted, otherwise the content hash decides. Entries live in memory and in
+    `<cache_dir>/<profile key>.pkl`, so a new process skips YAML parsing and pydantic
+    validation as well; each hit unpickles a fresh, independent GlobalConfig.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = Path(cache_dir)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._models: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def load(self, profile_path: str, build: Callable[[str], "GlobalConfig"]) -> "GlobalConfig":
+        profile = Path(profile_path).resolve()
+        key = hashlib.blake2b(str(profile).encode("utf-8"), digest_size=12).hexdigest()
+        if self._models is None:
+            self._models = _models_fingerprint()
+        with self._lock:
+            entry = self._entries.get(key) or self._read(key)
+            if entry is not None and self._is_valid(key, entry):
+                self.hits += 1
+                logger.debug("CONFIG_CACHE_HIT | profile=%s", profile)
+                return pickle.loads(entry["config"])
+
+        started = time.perf_counter()
+        config = build(str(profile))
+        entry = {
+            "version": CACHE_VERSION,
+            "models": self._models,
+            "recorded_ns": time.time_ns(),
+            "deps": self._dependencies(profile, config),
+            "config": pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL),
+        }
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = entry
+            self._write(key, entry)
+        logger.info(
+            "CONFIG_CACHE_COMPILED | profile=%s | files=%d | build_ms=%.1f",
+            profile,
+            len(entry["deps"]),
+            (time.perf_counter() - started) * 1000,
+        )
+        return config
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            for path in self.cache_dir.glob("*.pkl"):
+                path.unlink(missing_ok=True)
+
+    def _dependencies(self, profile: Path, config: "GlobalConfig") -> Dict[str, Dependency]:
+        paths = {profile, *(Path(p).resolve() for p in (config.source_paths or {}).values())}
+        deps: Dict[str, Dependency] = {}
+        for path in sorted(paths):
+            stat = path.stat()
+            deps[str(path)] = (stat.st_size, stat.st_mtime_ns, _content_hash(path))
+        return deps
+
+    def _is_valid(self, key: str, entry: Dict[str, Any]) -> bool:
+        if entry.get("version") != CACHE_VERSION or entry.get("models") != self._models:
+            return False
+        trusted_before = entry["recorded_ns"] - _RACY_WINDOW_NS
+        refreshed = False
+        for name, (size, mtime_ns, digest) in entry["deps"].items():
+            path = Path(name)
+            try:
+                stat = path.stat()
+            except OSError:
+                return False
+            if stat.st_size == size and stat.st_mtime_ns == mtime_ns and mtime_ns < trusted_before:
+                continue
+            if stat.st_size != size or _content_hash(path) != digest:
+                return False
+            # Same content under a new (or racy) stat signature: record it to skip hashing next time.
+            entry["deps"][name] = (size, stat.st_mtime_ns, digest)
+            refreshed = True
+        if refreshed:
+            entry["recorded_ns"] = time.time_ns()
+            self._write(key, entry)
+        self._entries[key] = entry
+        return True
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with self._entry_path(key).open("rb") as fh:
+                return pickle.load(fh)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as exc:
+            logger.debug("CONFIG_CACHE_UNREADABLE | key=%s | error=%s", key, exc)
+            return None
+
+    def _write(self, key: str, entry: Dict[str, Any]) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self._entry_path(key).with_name(f".{key}.tmp-{os.getpid()}")
+            tmp.write_bytes(pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp, self._entry_path(key))
+            self._prune()
+        except OSError as exc:  # read-only checkout: keep the in-memory entry only
+            logger.debug("CONFIG_CACHE_WRITE_FAILED | dir=%s | error=%s", self.cache_dir, exc)
+
+    def _prune(self) -> None:
+        entries = list(self.cache_dir.glob("*.pkl"))
+        if len(entries) <= MAX_ENTRIES:
+            return
+        entries.sort(key=lambda path: path.stat().st_mtime_ns)
+        for path in entries[: len(entries) - MAX_ENTRIES]:
+            path.unlink(missing_ok=True)
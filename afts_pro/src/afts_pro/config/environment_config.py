@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Literal, Optional
 
+from pydantic import Field
+
 from afts_pro.config.base_models import BaseConfigModel
 
 
@@ -13,5 +15,10 @@ class EnvironmentConfig(BaseConfigModel):
     live_api_key: Optional[str] = None
     live_api_secret: Optional[str] = None
     config_hot_reload_enabled: bool = False
-    config_hot_reload_interval_bars: int = 0
+    # Ignored: reloads are event-driven (ConfigWatcher). Still accepted so older YAML validates.
+    config_hot_reload_interval_bars: int = Field(
+        0, deprecated="config_hot_reload_interval_bars is ignored; reloads are driven by ConfigWatcher"
+    )
+    # Stat interval of the polling fallback where inotify is unavailable.
+    config_hot_reload_poll_interval_s: float = 1.0
     config_hot_reload_scope: list[Literal["behaviour", "strategy", "execution"]] = ["behaviour", "strategy"]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Literal
+from typing import Literal, Optional
 
 from afts_pro.config.base_models import BaseConfigModel
 
@@ -15,3 +15,6 @@ class ExecutionConfig(BaseConfigModel):
     allow_partial_fills: bool
     tick_size: float
     min_notional: float
+    # Finer series ("15T", "5T", ... or "base") used to order SL/TP fills that land in the same
+    # bar; None keeps the single-bar high/low logic.
+    intrabar_timeframe: Optional[str] = None
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, Iterable, Set, Tuple
 
 from afts_pro.config.asset_config import AssetConfig
 from afts_pro.config.behaviour_config import BehaviourConfig, create_guards, load_behaviour_config
 from afts_pro.config.base_models import BaseConfigModel
+from afts_pro.config.compiled_cache import CompiledConfigCache
 from afts_pro.config.environment_config import EnvironmentConfig
 from afts_pro.config.execution_config import ExecutionConfig
 from afts_pro.config.feature_config import FeatureConfig, load_feature_config
@@ -21,6 +23,7 @@ logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 CONFIG_ROOT = PROJECT_ROOT / "configs"
+COMPILED_CONFIG_CACHE = CompiledConfigCache(CONFIG_ROOT / ".compiled")
 
 
 class GlobalConfig(BaseConfigModel):
@@ -195,7 +198,17 @@ def _build_risk_config(include_path: Path) -> RiskConfig:
     return RiskConfig(policy_type=policy_type, policy_path=str(resolved_policy_path))
 
 
-def load_global_config_from_profile(profile_path: str) -> GlobalConfig:
+def load_global_config_from_profile(profile_path: str, use_cache: bool = True) -> GlobalConfig:
+    """
+    GlobalConfig for a profile, served from the compiled config cache while the profile and
+    every include are unchanged (disable with use_cache=False or AFTS_CONFIG_CACHE=0).
+    """
+    if use_cache and os.getenv("AFTS_CONFIG_CACHE", "1") != "0":
+        return COMPILED_CONFIG_CACHE.load(profile_path, _build_global_config_from_profile)
+    return _build_global_config_from_profile(profile_path)
+
+
+def _build_global_config_from_profile(profile_path: str) -> GlobalConfig:
     profile = load_profile(profile_path)
     includes = profile.includes
     profile_path_obj = Path(profile_path).resolve()
@@ -253,3 +266,40 @@ def load_global_config_from_profile(profile_path: str) -> GlobalConfig:
         behaviour_cfg.enabled,
     )
     return global_cfg
+
+
+def _section_loaders(from_profile: bool) -> Dict[str, Callable[[Path], BaseConfigModel]]:
+    return {
+        "environment": _load_environment_config,
+        "execution": _load_execution_config,
+        "assets": _load_asset_config,
+        "strategy": _load_strategy_config,
+        "risk": _build_risk_config if from_profile else _load_risk_config,
+        "behaviour": _load_behaviour_config,
+        "features": lambda path: load_feature_config(str(path)),
+        "extras": lambda path: load_extras_config(str(path)),
+        "runlogger": lambda path: load_runlogger_config(str(path)),
+    }
+
+
+def reload_config_sections(global_config: GlobalConfig, changed_paths: Iterable[Path]) -> Tuple[GlobalConfig, Set[str]]:
+    """
+    Re-parse only the sections whose source file is in `changed_paths`.
+
+    Unchanged sections are carried over as the same objects. A changed profile file can
+    re-point any include, so it reloads the whole profile. Returns the new config and the
+    names of the reloaded sections.
+    """
+    sources = {name: Path(path).resolve() for name, path in (global_config.source_paths or {}).items()}
+    changed = {Path(path).resolve() for path in changed_paths}
+    if "profile" in sources and sources["profile"] in changed:
+        return load_global_config_from_profile(str(sources["profile"])), set(_section_loaders(True))
+    loaders = _section_loaders("profile" in sources)
+    sections = {name for name, path in sources.items() if path in changed and name in loaders}
+    if Path(global_config.risk.policy_path).resolve() in changed:
+        sections.add("risk")
+    if not sections:
+        return global_config, set()
+    updates = {name: loaders[name](sources[name]) for name in sorted(sections)}
+    logger.info("CONFIG_SECTIONS_RELOADED | sections=%s", sorted(sections))
+    return global_config.model_copy(update=updates), sections
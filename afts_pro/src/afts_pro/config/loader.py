@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict
 
 import yaml
 
@@ -33,12 +33,3 @@ def reload_global_config():
     logger.info("Reloading GlobalConfig from disk.")
     return load_all_configs_into_global()
 
-
-def get_file_mtimes(paths: List[Path]) -> Dict[Path, float]:
-    mtimes: Dict[Path, float] = {}
-    for path in paths:
-        try:
-            mtimes[path] = path.stat().st_mtime
-        except FileNotFoundError:
-            mtimes[path] = 0.0
-    return mtimes
@@ -57,29 +57,27 @@ def list_profile_paths(base_dir: str = "configs/profiles") -> Dict[str, str]:
     return profiles
 
 
+def _resolve_include(include: str, profile_path: Path) -> Path:
+    path_obj = Path(include)
+    if not path_obj.is_absolute():
+        path_obj = (profile_path.parent / path_obj).resolve()
+    if not path_obj.exists():
+        path_obj = (Path(__file__).resolve().parents[3] / include).resolve()
+    return path_obj
+
+
+def get_profile_include_path(profile_path: str, section: str) -> Path:
+    """
+    Resolved include path of a single profile section (e.g. "runlogger"), for callers that
+    need one section without building the whole GlobalConfig.
+    """
+    profile = load_profile(profile_path)
+    return _resolve_include(getattr(profile.includes, section), Path(profile_path).resolve())
+
+
 def get_profile_include_paths(profile_path: str) -> List[Path]:
     profile = load_profile(profile_path)
     base = Path(profile_path).resolve()
-    project_root = Path(__file__).resolve().parents[3]
-    includes = [
-        profile.includes.environment,
-        profile.includes.execution,
-        profile.includes.assets,
-        profile.includes.strategy,
-        profile.includes.risk,
-        profile.includes.behaviour,
-        profile.includes.features,
-        profile.includes.extras,
-        profile.includes.runlogger,
-    ]
-    resolved_paths: List[Path] = []
-    for inc in includes:
-        path_obj = Path(inc)
-        if not path_obj.is_absolute():
-            path_obj = (base.parent / path_obj).resolve()
-        if not path_obj.exists():
-            alt = (project_root / inc).resolve()
-            path_obj = alt
-        resolved_paths.append(path_obj)
+    resolved_paths = [_resolve_include(include, base) for include in profile.includes.model_dump().values()]
     resolved_paths.append(base)
     return resolved_paths
@@ -21,6 +21,9 @@ class RunLoggerConfig(BaseModel):
             "equity_curve": "equity_curve.parquet",
             "positions": "positions.parquet",
             "metrics": "metrics.json",
+            "throughput": "throughput.json",
+            "journal": "events.parquet",
+            "profile": "profile.folded",
         }
     )
     retention: Dict[str, Optional[int]] = Field(default_factory=lambda: {"keep_last_n_runs": None})
@@ -34,6 +37,11 @@ class RunLoggerConfig(BaseModel):
         }
     )
 
+    # Equity points buffered in memory before being appended to the equity parquet file.
+    equity_spill_rows: int = Field(default=50_000)
+    # Events per parquet row group of the per-bar event journal.
+    journal_batch_rows: int = Field(default=10_000)
+
     model_config = {"populate_by_name": True}
 
 
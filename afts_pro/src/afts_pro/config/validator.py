@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from afts_pro.config.global_config import GlobalConfig
 from afts_pro.strategies import StrategyRegistry
 from afts_pro.config.extras_config import ExtrasConfig
 
+if TYPE_CHECKING:
+    from afts_pro.data.catalog import DataCatalog
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,12 +39,26 @@ def validate_paths(global_config: GlobalConfig) -> List[str]:
     return messages
 
 
-def validate_assets(global_config: GlobalConfig, data_root: Path) -> List[str]:
+def validate_assets(global_config: GlobalConfig, data_root: Path, catalog: Optional["DataCatalog"] = None) -> List[str]:
     messages: List[str] = []
     data_root = data_root.resolve()
+    folder = None
+    if catalog is not None:
+        try:
+            folder = data_root.relative_to(catalog.data_root.resolve()).as_posix()
+        except ValueError:
+            folder = None
     for symbol in global_config.assets.assets.keys():
-        pattern = f"{symbol}*.parquet"
-        matches = list((data_root).glob(pattern))
+        matches = []
+        if folder is not None:
+            matches = [
+                e
+                for e in catalog.entries()
+                if e.folder == folder and e.name.startswith(symbol) and (catalog.data_root / e.path).exists()
+            ]
+        if not matches:
+            # The catalog may be missing or stale (it is not refreshed here); check the files.
+            matches = list(data_root.glob(f"{symbol}*.parquet"))
         if not matches:
             messages.append(_as_warn(f"No parquet files found for asset symbol={symbol} under {data_root}"))
     return messages
@@ -207,10 +224,14 @@ def validate_runlogger(global_config: GlobalConfig) -> List[str]:
     return messages
 
 
-def run_all_validations(global_config: GlobalConfig, data_root: Path) -> Tuple[bool, List[str]]:
+def run_all_validations(
+    global_config: GlobalConfig,
+    data_root: Path,
+    catalog: Optional["DataCatalog"] = None,
+) -> Tuple[bool, List[str]]:
     messages: List[str] = []
     messages.extend(validate_paths(global_config))
-    messages.extend(validate_assets(global_config, data_root))
+    messages.extend(validate_assets(global_config, data_root, catalog=catalog))
     messages.extend(validate_strategies(global_config))
     messages.extend(validate_behaviour(global_config))
     messages.extend(validate_features(global_config))
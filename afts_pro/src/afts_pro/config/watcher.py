@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+# Directories are watched (not the files): editors and deploy tools replace files by rename.
+# Only completed writes count; IN_MODIFY fires on every write() of a file still being written.
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_DELETE
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_inotify() -> Optional[ctypes.CDLL]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class ConfigWatcher:
+    """
+    Background watcher that flags changes to a set of config files.
+
+    A daemon thread waits on inotify (Linux) or, where that is unavailable, stats the files
+    every `poll_interval_s`. A changed path is only posted once it has been quiet for
+    `debounce_s`, so a burst of writes (or several files saved together) yields one reload of
+    the finished files. Posted paths are collected under a lock and `pending` is set, so the
+    engine loop only reads one attribute per bar and calls drain() when it is True.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[Path],
+        poll_interval_s: float = 1.0,
+        use_inotify: bool = True,
+        debounce_s: float = 0.25,
+    ) -> None:
+        self.paths: Set[Path] = {Path(p).resolve() for p in paths}
+        self.poll_interval_s = max(float(poll_interval_s), 0.01)
+        self.debounce_s = max(float(debounce_s), 0.0)
+        self.pending = False
+        self.backend = "inotify" if use_inotify and _load_inotify() is not None else "poll"
+        self._changed: Set[Path] = set()
+        self._settling: Dict[Path, float] = {}
+        self._mtimes: Dict[Path, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._wake: Optional[Tuple[int, int]] = None
+
+    def start(self) -> "ConfigWatcher":
+        if self._thread is not None:
+            return self
+        args: Tuple = ()
+        if self.backend == "inotify":
+            try:
+                args = self._open_inotify()
+            except OSError as exc:
+                logger.warning("CONFIG_WATCHER_INOTIFY_UNAVAILABLE | error=%s | falling back to polling", exc)
+                self.backend = "poll"
+        if self.backend == "poll":
+            self._mtimes = self._stat_all()
+        target = self._run_inotify if self.backend == "inotify" else self._run_poll
+        self._thread = threading.Thread(target=target, args=args, name="config-watcher", daemon=True)
+        self._thread.start()
+        logger.info("CONFIG_WATCHER_STARTED | backend=%s | files=%d", self.backend, len(self.paths))
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._wake is not None:
+            os.write(self._wake[1], b"\0")
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def __enter__(self) -> "ConfigWatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def drain(self) -> Set[Path]:
+        """
+        Paths changed since the previous drain(); clears `pending`.
+        """
+        with self._lock:
+            changed, self._changed = self._changed, set()
+            self.pending = False
+        return changed
+
+    def _post(self, paths: Iterable[Path]) -> None:
+        with self._lock:
+            self._changed.update(paths)
+            self.pending = bool(self._changed)
+
+    def _touch(self, paths: Iterable[Path]) -> None:
+        now = time.monotonic()
+        for path in paths:
+            self._settling[path] = now
+
+    def _settle(self) -> Optional[float]:
+        """
+        Post the paths quiet for `debounce_s`; return seconds until the next one settles.
+        """
+        if not self._settling:
+            return None
+        now = time.monotonic()
+        settled = [path for path, touched in self._settling.items() if now - touched >= self.debounce_s]
+        for path in settled:
+            del self._settling[path]
+        if settled:
+            self._post(settled)
+        if not self._settling:
+            return None
+        return max(min(self._settling.values()) + self.debounce_s - now, 0.0)
+
+    def _stat_all(self) -> Dict[Path, Tuple[int, int]]:
+        stats: Dict[Path, Tuple[int, int]] = {}
+        for path in self.paths:
+            try:
+                stat = path.stat()
+                stats[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                stats[path] = (0, -1)
+        return stats
+
+    def _run_poll(self) -> None:
+        wait_s = self.poll_interval_s
+        while not self._stop.wait(wait_s):
+            current = self._stat_all()
+            # A file still being written keeps changing between stats and so keeps settling.
+            self._touch(path for path, stat in current.items() if self._mtimes.get(path) != stat)
+            self._mtimes = current
+            remaining = self._settle()
+            wait_s = self.poll_interval_s if remaining is None else min(self.poll_interval_s, remaining)
+
+    def _open_inotify(self) -> Tuple[int, Dict[int, Path]]:
+        libc = _load_inotify()
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        watches: Dict[int, Path] = {}
+        for directory in sorted({path.parent for path in self.paths}):
+            wd = libc.inotify_add_watch(fd, os.fsencode(directory), _WATCH_MASK)
+            if wd < 0:
+                os.close(fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+            watches[wd] = directory
+        self._wake = os.pipe()
+        return fd, watches
+
+    def _run_inotify(self, fd: int, watches: Dict[int, Path]) -> None:
+        try:
+            remaining: Optional[float] = None
+            while not self._stop.is_set():
+                ready, _, _ = select.select([fd, self._wake[0]], [], [], remaining)
+                if fd not in ready:
+                    remaining = self._settle()
+                    continue
+                try:
+                    buffer = os.read(fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+                changed = []
+                offset = 0
+                while offset < len(buffer):
+                    wd, _mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                    offset += _EVENT_HEADER.size
+                    name = buffer[offset : offset + length].rstrip(b"\0")
+                    offset += length
+                    directory = watches.get(wd)
+                    if directory is not None and name:
+                        path = directory / os.fsdecode(name)
+                        if path in self.paths:
+                            changed.append(path)
+                self._touch(changed)
+                remaining = self._settle()
+        finally:
+            os.close(fd)
+            for wake_fd in self._wake:
+                os.close(wake_fd)
+            self._wake = None
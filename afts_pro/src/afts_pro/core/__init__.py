@@ -2,8 +2,7 @@
 Core orchestration layer for AFTS-PRO.
 """
 
-from .mode_dispatcher import Mode, ModeDispatcher
-from .models import ApplicationMetadata, MarketState, PositionState, StrategyDecision
+from afts_pro.utils.lazy import lazy_exports
 
 __all__ = [
     "Mode",
@@ -12,4 +11,21 @@ __all__ = [
     "MarketState",
     "PositionState",
     "StrategyDecision",
+    "BarState",
+    "to_market_state",
 ]
+
+# Submodules are imported on first attribute access (PEP 562).
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Mode": ".mode_dispatcher",
+        "ModeDispatcher": ".mode_dispatcher",
+        "ApplicationMetadata": ".models",
+        "MarketState": ".models",
+        "PositionState": ".models",
+        "StrategyDecision": ".models",
+        "BarState": ".fast_models",
+        "to_market_state": ".fast_models",
+    },
+)
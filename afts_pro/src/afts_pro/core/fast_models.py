@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from afts_pro.core.models import OHLCV, MarketState, PositionState
+
+
+class BarState:
+    """
+    Slotted, unvalidated stand-in for MarketState on the simulation hot path.
+
+    Exposes the same attributes as MarketState (extras/features dicts are created on first
+    access), so strategies, features and execution code accept either type. Convert with
+    to_model() before handing a bar to an API or persistence layer that needs pydantic.
+    """
+
+    __slots__ = (
+        "timestamp",
+        "symbol",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "ohlcv",
+        "regime",
+        "position",
+        "_extras",
+        "_features",
+    )
+
+    def __init__(
+        self,
+        timestamp: Optional[datetime] = None,
+        symbol: str = "",
+        open: float = 0.0,
+        high: float = 0.0,
+        low: float = 0.0,
+        close: float = 0.0,
+        volume: float = 0.0,
+        ohlcv: Optional[OHLCV] = None,
+        extras: Optional[Dict[str, Any]] = None,
+        regime: Optional[int] = None,
+        features: Optional[Dict[str, Any]] = None,
+        position: Optional[PositionState] = None,
+    ) -> None:
+        self.timestamp = timestamp
+        self.symbol = symbol
+        if ohlcv is not None:
+            open, high, low, close, volume = ohlcv.open, ohlcv.high, ohlcv.low, ohlcv.close, ohlcv.volume
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.ohlcv = ohlcv
+        self.regime = regime
+        self.position = position
+        self._extras = extras
+        self._features = features
+
+    @property
+    def extras(self) -> Dict[str, Any]:
+        if self._extras is None:
+            self._extras = {}
+        return self._extras
+
+    @extras.setter
+    def extras(self, value: Dict[str, Any]) -> None:
+        self._extras = value
+
+    @property
+    def features(self) -> Dict[str, Any]:
+        if self._features is None:
+            self._features = {}
+        return self._features
+
+    @features.setter
+    def features(self, value: Dict[str, Any]) -> None:
+        self._features = value
+
+    def to_model(self) -> MarketState:
+        return MarketState(
+            timestamp=self.timestamp,
+            symbol=self.symbol,
+            open=self.open,
+            high=self.high,
+            low=self.low,
+            close=self.close,
+            volume=self.volume,
+            ohlcv=self.ohlcv,
+            extras=dict(self._extras or {}),
+            regime=self.regime,
+            features=dict(self._features or {}),
+            position=self.position,
+        )
+
+    @classmethod
+    def from_model(cls, state: MarketState) -> "BarState":
+        return cls(
+            timestamp=state.timestamp,
+            symbol=state.symbol,
+            open=state.open,
+            high=state.high,
+            low=state.low,
+            close=state.close,
+            volume=state.volume,
+            ohlcv=state.ohlcv,
+            extras=state.extras,
+            regime=state.regime,
+            features=state.features,
+            position=state.position,
+        )
+
+    def model_dump(self) -> Dict[str, Any]:
+        return self.to_model().model_dump()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (BarState, MarketState)):
+            return self.model_dump() == other.model_dump()
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"BarState(timestamp={self.timestamp!r}, symbol={self.symbol!r}, open={self.open!r}, "
+            f"high={self.high!r}, low={self.low!r}, close={self.close!r}, volume={self.volume!r})"
+        )
+
+
+def to_market_state(state: Any) -> MarketState:
+    """
+    Boundary helper: pydantic MarketState for either representation.
+    """
+    return state.to_model() if isinstance(state, BarState) else state
@@ -5,8 +5,12 @@ from dataclasses import dataclass
 from datetime import datetime, time
 from typing import Dict, Optional
 
+import numpy as np
+
 from afts_pro.core.models import StrategyDecision
 from afts_pro.core import MarketState
+from afts_pro.core.signal_backtest import SignalArrays
+from afts_pro.core.wakeup import DAY_NS, first_true
 from afts_pro.strategies.base import BaseStrategy
 
 logger = logging.getLogger(__name__)
@@ -66,6 +70,76 @@ class ORBStrategy(BaseStrategy):
             self.state_by_symbol[symbol] = state
         return state
 
+    def next_event_index(self, bars, start: int) -> Optional[int]:
+        """
+        Next bar inside the session window; out-of-session bars only reset the day state.
+        """
+        session_start = time.fromisoformat(self.session.session_start)
+        session_end = time.fromisoformat(self.session.session_end)
+        start_ns = _time_of_day_ns(session_start)
+        end_ns = _time_of_day_ns(session_end)
+        timestamps = bars.timestamp
+
+        def in_session(lo: int, hi: int) -> np.ndarray:
+            tod = np.asarray(timestamps[lo:hi], dtype=np.int64) % DAY_NS
+            return (tod >= start_ns) & (tod <= end_ns)
+
+        return first_true(in_session, start, len(bars))
+
+    def signal_arrays(self, bars) -> SignalArrays:
+        """
+        The decisions on_bar would emit over a whole BarArrays timeline, computed with NumPy.
+
+        Long/short entries and their range-based SL/TP (the "sl_price"/"tp_price" updates) are
+        set on the bars where on_bar would return an entry; the strategy state is not touched.
+        """
+        timestamps = np.asarray(bars.timestamp, dtype=np.int64)
+        highs = np.asarray(bars.high, dtype=float)
+        lows = np.asarray(bars.low, dtype=float)
+        closes = np.asarray(bars.close, dtype=float)
+        n = timestamps.shape[0]
+        session_start = time.fromisoformat(self.session.session_start)
+        tod = timestamps % DAY_NS
+        in_session = (tod >= _time_of_day_ns(session_start)) & (
+            tod <= _time_of_day_ns(time.fromisoformat(self.session.session_end))
+        )
+        minutes = tod // 60_000_000_000 - (session_start.hour * 60 + session_start.minute)
+        building = in_session & (minutes < self.cfg.range_minutes)
+
+        # Per-day range over the building bars, broadcast back to every bar of the day.
+        day = timestamps // DAY_NS
+        range_high = np.full(n, np.nan)
+        range_low = np.full(n, np.nan)
+        build_idx = np.flatnonzero(building)
+        if build_idx.shape[0]:
+            build_days, starts = np.unique(day[build_idx], return_index=True)
+            day_high = np.maximum.reduceat(highs[build_idx], starts)
+            day_low = np.minimum.reduceat(lows[build_idx], starts)
+            slot = np.clip(np.searchsorted(build_days, day), 0, build_days.shape[0] - 1)
+            known = build_days[slot] == day
+            range_high = np.where(known, day_high[slot], np.nan)
+            range_low = np.where(known, day_low[slot], np.nan)
+
+        with np.errstate(invalid="ignore"):
+            width = range_high - range_low
+            ready = in_session & ~building & ~np.isnan(range_high) & ~(width * 10000 < self.cfg.min_range_pips)
+            long_hit = ready & (highs >= range_high + self.cfg.breakout_buffer_pips / 10000) & self.cfg.allow_long
+            short_hit = ready & ~long_hit & (lows <= range_low - self.cfg.breakout_buffer_pips / 10000) & self.cfg.allow_short
+        # Only the first max_entries_per_day candidates of a day become entries.
+        candidate = long_hit | short_hit
+        count = np.cumsum(candidate)
+        new_day = np.ones(n, dtype=bool)
+        new_day[1:] = day[1:] != day[:-1]
+        day_offset = np.maximum.accumulate(np.where(new_day, count - candidate, 0))
+        taken = candidate & (count - day_offset <= self.cfg.max_entries_per_day)
+
+        long_entry = taken & long_hit
+        short_entry = taken & short_hit
+        direction = np.where(long_entry, 1.0, np.where(short_entry, -1.0, np.nan))
+        sl = closes - direction * self.cfg.range_rr_sl_mult * width
+        tp = closes + direction * self.cfg.range_rr_tp_mult * width
+        return SignalArrays(long_entry=long_entry, short_entry=short_entry, sl=sl, tp=tp)
+
     def on_bar(self, bar: MarketState, features: Optional[Any] = None, atr: Optional[float] = None) -> StrategyDecision:
         state = self._reset_state_if_new_day(bar.symbol, bar.timestamp)
         if not self.session.contains(bar.timestamp):
@@ -121,3 +195,8 @@ class ORBStrategy(BaseStrategy):
             return decision
 
         return StrategyDecision(action="none", side=None, confidence=0.0)
+
+
+def _time_of_day_ns(value: time) -> int:
+    seconds = value.hour * 3600 + value.minute * 60 + value.second
+    return (seconds * 1_000_000 + value.microsecond) * 1_000
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:  # behaviour guards import this module on the config-only startup path
+    import numpy as np
+
+# Wake-up protocol used by the SIM fast path: components report the earliest time (or bar
+# index) at which they could act or change state while the account is flat and no fill
+# happens. None means "not before the data ends"; returning the current time/index means
+# "ask me on every bar" and disables skipping, which is the safe default for components
+# that cannot tell.
+
+DAY_NS = 86_400 * 1_000_000_000
+
+
+def next_day_start(ts: datetime) -> datetime:
+    """
+    Midnight after ts, in ts's timezone (the point where daily counters reset).
+    """
+    return datetime.combine(ts.date() + timedelta(days=1), datetime.min.time(), tzinfo=ts.tzinfo)
+
+
+def earliest(*values: Optional[datetime]) -> Optional[datetime]:
+    present = [value for value in values if value is not None]
+    return min(present) if present else None
+
+
+def first_true(
+    predicate: Callable[[int, int], np.ndarray],
+    start: int,
+    stop: int,
+    chunk: int = 256,
+) -> Optional[int]:
+    """
+    First index in [start, stop) where predicate(lo, hi) (a bool array for rows lo:hi) is set.
+
+    Scans in doubling chunks so an early hit costs little and a long quiet stretch stays
+    vectorized; None if no row matches.
+    """
+    import numpy as np
+
+    lo = start
+    while lo < stop:
+        hi = min(lo + chunk, stop)
+        hits = np.flatnonzero(predicate(lo, hi))
+        if hits.shape[0]:
+            return lo + int(hits[0])
+        lo = hi
+        chunk *= 2
+    return None
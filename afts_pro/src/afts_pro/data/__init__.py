@@ -2,16 +2,50 @@
 Data access layer for AFTS-PRO.
 """
 
-from .repositories import BaseRepository
-from .parquet_feed import MissingColumnsError, ParquetFeed
-from .market_state_builder import MarketStateBuilder
-from .extras_loader import ExtrasLoader, ExtrasSeries
+from afts_pro.utils.lazy import lazy_exports
 
 __all__ = [
     "BaseRepository",
+    "BarArrays",
+    "BarStore",
     "ParquetFeed",
     "MarketStateBuilder",
+    "MultiSymbolFeed",
+    "merge_market_states",
+    "PrefetchingIterator",
+    "QualityReport",
+    "scan_bars",
     "MissingColumnsError",
+    "UnorderedDataError",
+    "CatalogEntry",
+    "DataCatalog",
     "ExtrasLoader",
     "ExtrasSeries",
+    "LazyExtrasMap",
+    "clear_extras_cache",
 ]
+
+# Submodules are imported on first attribute access (PEP 562).
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BaseRepository": ".repositories",
+        "BarArrays": ".bar_store",
+        "BarStore": ".bar_store",
+        "MissingColumnsError": ".parquet_feed",
+        "ParquetFeed": ".parquet_feed",
+        "UnorderedDataError": ".parquet_feed",
+        "MarketStateBuilder": ".market_state_builder",
+        "MultiSymbolFeed": ".multi_feed",
+        "merge_market_states": ".multi_feed",
+        "PrefetchingIterator": ".prefetch",
+        "QualityReport": ".quality",
+        "scan_bars": ".quality",
+        "CatalogEntry": ".catalog",
+        "DataCatalog": ".catalog",
+        "ExtrasLoader": ".extras_loader",
+        "ExtrasSeries": ".extras_loader",
+        "LazyExtrasMap": ".extras_loader",
+        "clear_extras_cache": ".extras_loader",
+    },
+)
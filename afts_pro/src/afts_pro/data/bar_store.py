@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+STORE_VERSION = 1
+PRICE_COLUMNS: Tuple[str, ...] = ("open", "high", "low", "close", "volume")
+META_FILENAME = "meta.json"
+
+
+@dataclass(frozen=True)
+class BarArrays:
+    """
+    Columnar OHLCV view: int64 UTC nanosecond timestamps plus float64 price/volume arrays.
+
+    Arrays opened from a BarStore are read-only memory maps; slicing returns views, never copies.
+    """
+
+    symbol: str
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.timestamp.shape[0])
+
+    def slice(self, start: int, stop: int) -> "BarArrays":
+        return BarArrays(
+            symbol=self.symbol,
+            timestamp=self.timestamp[start:stop],
+            open=self.open[start:stop],
+            high=self.high[start:stop],
+            low=self.low[start:stop],
+            close=self.close[start:stop],
+            volume=self.volume[start:stop],
+        )
+
+    def fingerprint(self, rows: Optional[int] = None) -> str:
+        """
+        Content hash of the first `rows` bars (all by default).
+
+        Equal fingerprints over a prefix identify a dataset that only had bars appended since.
+        """
+        n = len(self) if rows is None else min(int(rows), len(self))
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.symbol.encode("utf-8"))
+        for column in ("timestamp",) + PRICE_COLUMNS:
+            digest.update(np.ascontiguousarray(getattr(self, column)[:n]).tobytes())
+        return digest.hexdigest()
+
+    def iter_rows(self, chunk_size: int = 4096) -> Iterator[Tuple[pd.Timestamp, float, float, float, float, float]]:
+        """
+        Yield (timestamp, open, high, low, close, volume) tuples, converting one chunk at a time.
+        """
+        n = len(self)
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            timestamps = pd.DatetimeIndex(self.timestamp[start:stop].astype("datetime64[ns]"), tz="UTC").to_pydatetime()
+            yield from zip(
+                timestamps,
+                self.open[start:stop].tolist(),
+                self.high[start:stop].tolist(),
+                self.low[start:stop].tolist(),
+                self.close[start:stop].tolist(),
+                self.volume[start:stop].tolist(),
+            )
+
+    def to_frame(self) -> pd.DataFrame:
+        data: Dict[str, object] = {"timestamp": pd.to_datetime(self.timestamp, unit="ns", utc=True)}
+        for col in PRICE_COLUMNS:
+            data[col] = getattr(self, col)
+        df = pd.DataFrame(data)
+        df["symbol"] = self.symbol
+        return df
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, symbol: str) -> "BarArrays":
+        """
+        Build arrays from a normalised feed frame (UTC timestamp column, sorted).
+        """
+        timestamps = df["timestamp"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+        columns = {col: df[col].to_numpy(dtype=np.float64, na_value=np.nan) for col in PRICE_COLUMNS}
+        return cls(symbol=symbol, timestamp=np.ascontiguousarray(timestamps), **columns)
+
+
+def _source_signature(source_path: Path) -> Dict[str, int]:
+    stat = source_path.stat()
+    return {"size": int(stat.st_size), "mtime_ns": int(stat.st_mtime_ns)}
+
+
+class BarStore:
+    """
+    Write-once, memory-mapped cache of OHLCV bars keyed by source parquet file.
+
+    Layout: <store_root>/<folder>/<file stem>/{meta.json, timestamp.npy, open.npy, ...}.
+    An entry is rebuilt automatically when the source file size or mtime changes.
+    """
+
+    def __init__(self, store_root: Path) -> None:
+        self._store_root = Path(store_root)
+
+    @property
+    def store_root(self) -> Path:
+        return self._store_root
+
+    def entry_dir(self, source_path: Path, folder: str) -> Path:
+        return self._store_root / folder / Path(source_path).stem
+
+    def read_meta(self, source_path: Path, folder: str) -> Optional[Dict]:
+        meta_path = self.entry_dir(source_path, folder) / META_FILENAME
+        if not meta_path.exists():
+            return None
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            logger.warning("BAR_STORE_META_UNREADABLE | path=%s", meta_path)
+            return None
+
+    def is_fresh(self, source_path: Path, folder: str) -> bool:
+        meta = self.read_meta(source_path, folder)
+        if meta is None or meta.get("version") != STORE_VERSION:
+            return False
+        return meta.get("source") == _source_signature(Path(source_path))
+
+    def open(self, source_path: Path, folder: str) -> Optional[BarArrays]:
+        """
+        Memory-map a fresh entry; returns None when the entry is missing or stale.
+        """
+        if not self.is_fresh(source_path, folder):
+            return None
+        entry = self.entry_dir(source_path, folder)
+        meta = self.read_meta(source_path, folder) or {}
+        arrays = {
+            name: np.load(entry / f"{name}.npy", mmap_mode="r", allow_pickle=False)
+            for name in ("timestamp", *PRICE_COLUMNS)
+        }
+        return BarArrays(symbol=str(meta.get("symbol", "")), **arrays)
+
+    def update_meta(self, source_path: Path, folder: str, fields: Dict) -> None:
+        """
+        Merge fields into the meta.json of an existing entry (atomic replace).
+        """
+        meta = self.read_meta(source_path, folder)
+        if meta is None:
+            return
+        meta.update(fields)
+        meta_path = self.entry_dir(source_path, folder) / META_FILENAME
+        tmp_path = meta_path.with_name(f".{META_FILENAME}.tmp-{os.getpid()}")
+        tmp_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        os.replace(tmp_path, meta_path)
+
+    def write(self, source_path: Path, folder: str, bars: BarArrays, extra_meta: Optional[Dict] = None) -> Path:
+        """
+        Persist bars for source_path atomically (tmp dir + rename) and return the entry directory.
+        """
+        source_path = Path(source_path)
+        entry = self.entry_dir(source_path, folder)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir = entry.parent / f".{entry.name}.tmp-{os.getpid()}"
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        tmp_dir.mkdir()
+
+        np.save(tmp_dir / "timestamp.npy", np.ascontiguousarray(bars.timestamp, dtype=np.int64), allow_pickle=False)
+        for col in PRICE_COLUMNS:
+            np.save(tmp_dir / f"{col}.npy", np.ascontiguousarray(getattr(bars, col), dtype=np.float64), allow_pickle=False)
+        meta = {
+            "version": STORE_VERSION,
+            "symbol": bars.symbol,
+            "rows": len(bars),
+            "source": _source_signature(source_path),
+            "source_path": str(source_path),
+        }
+        if extra_meta:
+            meta.update(extra_meta)
+        (tmp_dir / META_FILENAME).write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+        if entry.exists():
+            shutil.rmtree(entry)
+        os.replace(tmp_dir, entry)
+        logger.info("BAR_STORE_WRITTEN | source=%s | rows=%d | dir=%s", source_path, len(bars), entry)
+        return entry
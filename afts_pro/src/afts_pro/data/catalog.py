@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+# pyarrow and pandas are imported where files are described, so reading the persisted catalog
+# (config validate, lookups) stays light.
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import pyarrow as pa
+
+    from afts_pro.data.parquet_feed import TimestampLike
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION = 1
+CATALOG_FILENAME = ".catalog.json"
+_TIMESTAMP_COLUMNS = ("timestamp", "time")
+
+
+class RowGroupInfo(BaseModel):
+    rows: int
+    first_ts: Optional[datetime] = None
+    last_ts: Optional[datetime] = None
+
+
+class CatalogEntry(BaseModel):
+    """
+    Footer-level description of one parquet file under the data root.
+    """
+
+    path: str
+    folder: str
+    name: str
+    symbol: str
+    timeframe: Optional[str] = None
+    rows: int
+    first_ts: Optional[datetime] = None
+    last_ts: Optional[datetime] = None
+    row_groups: List[RowGroupInfo] = Field(default_factory=list)
+    columns: Dict[str, str] = Field(default_factory=dict)
+    content_hash: str
+    size: int
+    mtime_ns: int
+
+
+class DataCatalog:
+    """
+    Persisted index of every parquet file under data_root (dot-directories such as caches excluded).
+
+    refresh() only re-reads files whose size or mtime changed, and only their parquet footer
+    (schema, row counts, timestamp statistics) plus a content hash. Lookups never open data files.
+    """
+
+    def __init__(self, data_root: Path, catalog_path: Optional[Path] = None) -> None:
+        self._data_root = Path(data_root)
+        self._path = Path(catalog_path) if catalog_path else self._data_root / CATALOG_FILENAME
+        self._entries: Dict[str, CatalogEntry] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @property
+    def catalog_path(self) -> Path:
+        return self._path
+
+    def entries(self) -> List[CatalogEntry]:
+        return sorted(self._entries.values(), key=lambda e: e.path)
+
+    def get(self, rel_path: str) -> Optional[CatalogEntry]:
+        """
+        Entry for a path relative to the data root, e.g. "final_agg/EURUSD_1H.parquet".
+        """
+        return self._entries.get(Path(rel_path).as_posix())
+
+    @property
+    def data_root(self) -> Path:
+        return self._data_root
+
+    def entry_for(self, file_path: Path) -> Optional[CatalogEntry]:
+        """
+        Entry for an absolute path if it lies under the data root and is unchanged since indexing.
+        """
+        try:
+            rel = Path(file_path).resolve().relative_to(self._data_root.resolve()).as_posix()
+            stat = Path(file_path).stat()
+        except (ValueError, OSError):
+            return None
+        entry = self._entries.get(rel)
+        if entry is None or entry.size != stat.st_size or entry.mtime_ns != stat.st_mtime_ns:
+            return None
+        return entry
+
+    def lookup(self, name: str, folder: str = "final_agg") -> Optional[CatalogEntry]:
+        """
+        Entry for a file stem (or file name) inside folder, as used by ParquetFeed.
+        """
+        filename = name if name.endswith(".parquet") else f"{name}.parquet"
+        return self.get(f"{folder}/{filename}")
+
+    def find(
+        self,
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        folder: Optional[str] = None,
+    ) -> List[CatalogEntry]:
+        matches = []
+        for entry in self.entries():
+            if symbol is not None and symbol not in (entry.symbol, entry.name):
+                continue
+            if timeframe is not None and entry.timeframe != timeframe:
+                continue
+            if folder is not None and entry.folder != folder:
+                continue
+            matches.append(entry)
+        return matches
+
+    def refresh(self) -> "DataCatalog":
+        """
+        Re-index changed files, drop deleted ones and persist the catalog if anything changed.
+        """
+        import pyarrow as pa
+
+        with self._lock:
+            seen: Dict[str, CatalogEntry] = {}
+            updated = 0
+            for file_path in self._iter_files():
+                rel = file_path.relative_to(self._data_root).as_posix()
+                stat = file_path.stat()
+                current = self._entries.get(rel)
+                if current is not None and current.size == stat.st_size and current.mtime_ns == stat.st_mtime_ns:
+                    seen[rel] = current
+                    continue
+                try:
+                    seen[rel] = _describe(file_path, rel, stat)
+                except (OSError, pa.ArrowException) as exc:
+                    logger.warning("DATA_CATALOG_SKIP | path=%s | error=%s", file_path, exc)
+                    continue
+                updated += 1
+            removed = len(set(self._entries) - set(seen))
+            self._entries = seen
+            if updated or removed or not self._path.exists():
+                self._save()
+            logger.info(
+                "DATA_CATALOG_REFRESH | root=%s | files=%d | updated=%d | removed=%d",
+                self._data_root,
+                len(seen),
+                updated,
+                removed,
+            )
+        return self
+
+    def _iter_files(self):
+        if not self._data_root.exists():
+            return
+        for dirpath, dirnames, filenames in os.walk(self._data_root):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+            for filename in sorted(filenames):
+                if filename.endswith(".parquet") and not filename.startswith("."):
+                    yield Path(dirpath) / filename
+
+    def _load(self) -> None:
+        if not self._path.exists():
+            return
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("DATA_CATALOG_UNREADABLE | path=%s | error=%s", self._path, exc)
+            return
+        if payload.get("version") != CATALOG_VERSION:
+            return
+        self._entries = {item["path"]: CatalogEntry(**item) for item in payload.get("entries", [])}
+
+    def _save(self) -> None:
+        payload = {
+            "version": CATALOG_VERSION,
+            "data_root": str(self._data_root),
+            "entries": [entry.model_dump(mode="json") for entry in self.entries()],
+        }
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_name(f"{self._path.name}.tmp-{os.getpid()}")
+        tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(tmp, self._path)
+
+
+def window_rows(entry: CatalogEntry, start: Optional[TimestampLike] = None, end: Optional[TimestampLike] = None) -> int:
+    """
+    Upper bound of rows within [start, end] from row-group boundaries (no file access).
+    """
+    from afts_pro.data.parquet_feed import to_utc_timestamp
+
+    start_ts = to_utc_timestamp(start)
+    end_ts = to_utc_timestamp(end)
+    total = 0
+    for rg in entry.row_groups:
+        if rg.first_ts is not None and end_ts is not None and rg.first_ts > end_ts:
+            continue
+        if rg.last_ts is not None and start_ts is not None and rg.last_ts < start_ts:
+            continue
+        total += rg.rows
+    return total
+
+
+def _describe(file_path: Path, rel: str, stat: os.stat_result) -> CatalogEntry:
+    import pyarrow.parquet as pq
+
+    from afts_pro.data.resample import file_hash, split_timeframe
+
+    parquet_file = pq.ParquetFile(file_path)
+    schema = parquet_file.schema_arrow
+    metadata = parquet_file.metadata
+    ts_column = next((c for c in _TIMESTAMP_COLUMNS if c in schema.names), None)
+    ts_idx = schema.get_field_index(ts_column) if ts_column else -1
+    symbol_idx = schema.get_field_index("symbol") if "symbol" in schema.names else -1
+    ts_type = schema.field(ts_idx).type if ts_idx >= 0 else None
+
+    row_groups: List[RowGroupInfo] = []
+    symbols = set()
+    for rg in range(metadata.num_row_groups):
+        row_group = metadata.row_group(rg)
+        info = RowGroupInfo(rows=row_group.num_rows)
+        if ts_idx >= 0:
+            stats = row_group.column(ts_idx).statistics
+            if stats is not None and stats.has_min_max:
+                info.first_ts = _stat_to_datetime(stats.min, ts_type)
+                info.last_ts = _stat_to_datetime(stats.max, ts_type)
+        if symbol_idx >= 0:
+            stats = row_group.column(symbol_idx).statistics
+            if stats is not None and stats.has_min_max:
+                symbols.update({stats.min, stats.max})
+        row_groups.append(info)
+
+    stem = file_path.stem
+    name_symbol, timeframe = split_timeframe(stem)
+    symbol = next(iter(symbols)) if len(symbols) == 1 else name_symbol
+    if isinstance(symbol, bytes):
+        symbol = symbol.decode("utf-8", "replace")
+    firsts = [rg.first_ts for rg in row_groups if rg.first_ts is not None]
+    lasts = [rg.last_ts for rg in row_groups if rg.last_ts is not None]
+    folder = Path(rel).parent.as_posix()
+    return CatalogEntry(
+        path=rel,
+        folder="" if folder == "." else folder,
+        name=stem,
+        symbol=str(symbol),
+        timeframe=timeframe,
+        rows=metadata.num_rows,
+        first_ts=min(firsts) if firsts else None,
+        last_ts=max(lasts) if lasts else None,
+        row_groups=row_groups,
+        columns={field.name: str(field.type) for field in schema},
+        content_hash=file_hash(file_path),
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+    )
+
+
+def _stat_to_datetime(value, field_type: Optional["pa.DataType"]) -> Optional[datetime]:
+    from afts_pro.data.parquet_feed import _stat_to_utc
+
+    ts = _stat_to_utc(value, field_type)
+    return None if ts is None else ts.to_pydatetime()
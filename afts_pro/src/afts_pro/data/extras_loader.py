@@ -1,16 +1,25 @@
 from __future__ import annotations
 
 import logging
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator, Optional, Tuple
 
 import pandas as pd
 from pydantic import BaseModel, ConfigDict
 
 from afts_pro.config.extras_config import ExtraDatasetConfig, ExtrasConfig
+from afts_pro.data.catalog import CatalogEntry, DataCatalog
 
 logger = logging.getLogger(__name__)
 
+# (symbol, dataset, path, mtime_ns, column_map, timestamp_column) -> sorted frame
+_FrameKey = Tuple[str, str, str, int, Tuple[Tuple[str, str], ...], str]
+_FRAME_CACHE: Dict[_FrameKey, pd.DataFrame] = {}
+_FRAME_CACHE_LOCK = threading.Lock()
+
 
 class ExtrasSeries(BaseModel):
     symbol: str
@@ -30,45 +39,184 @@ def _build_final_path(config: ExtrasConfig, symbol: str, dataset_cfg: ExtraDatas
     return base_dir / path_rel
 
 
+def clear_extras_cache() -> None:
+    """
+    Drop all cached extras frames (e.g. after rewriting files within the same mtime tick).
+    """
+    with _FRAME_CACHE_LOCK:
+        _FRAME_CACHE.clear()
+
+
+def _read_frame(path: Path, ds_cfg: ExtraDatasetConfig, ts_col: str) -> Optional[pd.DataFrame]:
+    try:
+        df = pd.read_parquet(path)
+    except Exception as e:  # pragma: no cover - IO path
+        logger.error("Failed to load extras for %s from %s: %s", ds_cfg.name, path, e)
+        return None
+
+    if ds_cfg.column_map:
+        df = df.rename(columns=ds_cfg.column_map)
+
+    if ts_col not in df.columns:
+        if "time" in df.columns:
+            df = df.rename(columns={"time": ts_col})
+        else:
+            logger.error("No timestamp column found in extras %s (expected '%s')", path, ts_col)
+            return None
+
+    return df.sort_values(ts_col, kind="mergesort").reset_index(drop=True)
+
+
+class LazyExtrasMap(Mapping):
+    """
+    Read-only mapping dataset -> ExtrasSeries whose frames are read on first access.
+
+    Keys are the enabled datasets whose file exists; a dataset that fails to load is logged and
+    dropped from the mapping. Sorted frames are shared through a process-wide cache keyed by
+    (symbol, dataset, path, mtime), so callers must treat `series.df` as read-only.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        sources: Dict[str, Tuple[Path, ExtraDatasetConfig]],
+        timestamp_column: str,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self.symbol = symbol
+        self._sources = dict(sources)
+        self._ts_col = timestamp_column
+        self._max_workers = max_workers
+        self._loaded: Dict[str, ExtrasSeries] = {}
+        self._failed: set = set()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> ExtrasSeries:
+        series = self._load(name)
+        if series is None:
+            raise KeyError(name)
+        return series
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([name for name in self._sources if name not in self._failed])
+
+    def __len__(self) -> int:
+        return len(self._sources) - len(self._failed)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._sources and name not in self._failed
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._loaded
+
+    def items(self):
+        self.load_all()
+        return [(name, self._loaded[name]) for name in self._sources if name in self._loaded]
+
+    def values(self):
+        return [series for _, series in self.items()]
+
+    def load_all(self) -> Dict[str, ExtrasSeries]:
+        """
+        Load every pending dataset concurrently and return the successfully loaded ones.
+        """
+        pending = [name for name in self._sources if name not in self._loaded and name not in self._failed]
+        if len(pending) == 1:
+            self._load(pending[0])
+        elif pending:
+            workers = self._max_workers or min(8, len(pending))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="afts-extras") as pool:
+                list(pool.map(self._load, pending))
+        return {name: self._loaded[name] for name in self._sources if name in self._loaded}
+
+    def _load(self, name: str) -> Optional[ExtrasSeries]:
+        series = self._loaded.get(name)
+        if series is not None or name in self._failed:
+            return series
+        if name not in self._sources:
+            raise KeyError(name)
+        path, ds_cfg = self._sources[name]
+        df = _cached_frame(self.symbol, path, ds_cfg, self._ts_col)
+        with self._lock:
+            if df is None:
+                self._failed.add(name)
+                return None
+            series = self._loaded.setdefault(name, ExtrasSeries(symbol=self.symbol, dataset=name, df=df))
+        return series
+
+
+def _cached_frame(symbol: str, path: Path, ds_cfg: ExtraDatasetConfig, ts_col: str) -> Optional[pd.DataFrame]:
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        logger.warning("Extras file missing for symbol=%s dataset=%s path=%s", symbol, ds_cfg.name, path)
+        return None
+    key: _FrameKey = (
+        symbol,
+        ds_cfg.name,
+        str(path.resolve()),
+        mtime_ns,
+        tuple(sorted(ds_cfg.column_map.items())),
+        ts_col,
+    )
+    with _FRAME_CACHE_LOCK:
+        cached = _FRAME_CACHE.get(key)
+    if cached is not None:
+        logger.debug("EXTRAS_CACHE_HIT | symbol=%s | dataset=%s", symbol, ds_cfg.name)
+        return cached
+
+    df = _read_frame(path, ds_cfg, ts_col)
+    if df is None:
+        return None
+    with _FRAME_CACHE_LOCK:
+        # Older versions of the same file are unreachable once the mtime moved on.
+        for stale in [k for k in _FRAME_CACHE if k[:3] == key[:3] and k[3] != mtime_ns]:
+            del _FRAME_CACHE[stale]
+        df = _FRAME_CACHE.setdefault(key, df)
+    logger.debug("EXTRAS_LOADED | symbol=%s | dataset=%s | rows=%d", symbol, ds_cfg.name, len(df))
+    return df
+
+
 class ExtrasLoader:
-    def __init__(self, config: ExtrasConfig) -> None:
+    def __init__(
+        self,
+        config: ExtrasConfig,
+        max_workers: Optional[int] = None,
+        catalog: Optional[DataCatalog] = None,
+    ) -> None:
         self.config = config
+        self.max_workers = max_workers
+        self.catalog = catalog
+
+    def describe_for_symbol(self, symbol: str) -> Dict[str, Optional[CatalogEntry]]:
+        """
+        Catalog entry per enabled dataset whose file exists (None when the file is not indexed).
+        """
+        result: Dict[str, Optional[CatalogEntry]] = {}
+        for ds_cfg in self.config.get_enabled_datasets():
+            path = _build_final_path(self.config, symbol, ds_cfg)
+            entry = self.catalog.entry_for(path) if self.catalog is not None else None
+            if entry is not None or path.exists():
+                result[ds_cfg.name] = entry
+        return result
 
-    def load_for_symbol(self, symbol: str) -> Dict[str, ExtrasSeries]:
-        result: Dict[str, ExtrasSeries] = {}
+    def load_for_symbol(self, symbol: str) -> LazyExtrasMap:
+        """
+        Resolve the enabled datasets for `symbol`; frames are read lazily (see LazyExtrasMap).
+        """
+        sources: Dict[str, Tuple[Path, ExtraDatasetConfig]] = {}
         if not self.config.enabled:
             logger.info("ExtrasLoader disabled, returning empty extras for %s", symbol)
-            return result
+            return LazyExtrasMap(symbol, sources, self.config.timestamp_column)
 
         for ds_cfg in self.config.get_enabled_datasets():
             path = _build_final_path(self.config, symbol, ds_cfg)
             if not path.exists():
                 logger.warning("Extras file missing for symbol=%s dataset=%s path=%s", symbol, ds_cfg.name, path)
                 continue
+            sources[ds_cfg.name] = (path, ds_cfg)
 
-            try:
-                df = pd.read_parquet(path)
-            except Exception as e:  # pragma: no cover - IO path
-                logger.error("Failed to load extras for %s/%s from %s: %s", symbol, ds_cfg.name, path, e)
-                continue
-
-            if ds_cfg.column_map:
-                df = df.rename(columns=ds_cfg.column_map)
-
-            ts_col = self.config.timestamp_column
-            if ts_col not in df.columns:
-                if "time" in df.columns:
-                    df = df.rename(columns={"time": ts_col})
-                else:
-                    logger.error("No timestamp column found in extras %s (expected '%s')", path, ts_col)
-                    continue
-
-            df = df.sort_values(ts_col).reset_index(drop=True)
-
-            series = ExtrasSeries(symbol=symbol, dataset=ds_cfg.name, df=df)
-            result[ds_cfg.name] = series
-
-        return result
+        return LazyExtrasMap(symbol, sources, self.config.timestamp_column, max_workers=self.max_workers)
 
     def has_dataset(self, symbol: str, dataset_name: str) -> bool:
         ds_cfgs = {d.name for d in self.config.get_enabled_datasets()}
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable, Iterator, Optional
+from typing import Iterable, Iterator, Optional, Union
 
-from afts_pro.core import MarketState
-from afts_pro.data.parquet_feed import ParquetFeed
+from afts_pro.core import BarState, MarketState
+from afts_pro.data.bar_store import BarArrays
+from afts_pro.data.parquet_feed import ParquetFeed, TimestampLike
 
 
 class MarketStateBuilder:
@@ -15,13 +16,45 @@ class MarketStateBuilder:
     def __init__(self, feed: ParquetFeed) -> None:
         self._feed = feed
 
-    def iter_market_states(self, symbol: str, folder: str = "final_agg") -> Iterator[MarketState]:
-        df = self._feed.load(symbol, folder=folder)
+    def iter_market_states(
+        self,
+        symbol: str,
+        folder: str = "final_agg",
+        start: Optional[TimestampLike] = None,
+        end: Optional[TimestampLike] = None,
+        stream: bool = False,
+        batch_size: Optional[int] = None,
+        lightweight: bool = False,
+    ) -> Iterator[Union[MarketState, BarState]]:
+        """
+        Yield bars within the optional inclusive [start, end] window.
+
+        Only the OHLCV (+ symbol) columns and the row groups overlapping the window are decoded.
+        With stream=True bars are decoded row group by row group (or in batch_size chunks), so
+        memory stays flat and the first bar is available after the first batch; the file must
+        already be sorted by timestamp. With lightweight=True unvalidated slotted BarState objects
+        are yielded instead of pydantic MarketState (same attributes, convert with to_model()).
+        """
+        if stream:
+            for batch in self._feed.iter_bar_batches(symbol, folder=folder, start=start, end=end, batch_size=batch_size):
+                yield from self.iter_bar_arrays(batch, lightweight=lightweight)
+            return
+
+        if self._feed.use_bar_store:
+            bars = self._feed.load_bars(symbol, folder=folder, start=start, end=end)
+            yield from self.iter_bar_arrays(bars, lightweight=lightweight)
+            return
+
+        columns = list(self._feed.REQUIRED_COLUMNS)
+        if "symbol" in self._feed.available_columns(symbol, folder):
+            columns.append("symbol")
+        df = self._feed.load(symbol, folder=folder, start=start, end=end, columns=columns)
         base_symbol = self._normalize_symbol(symbol)
+        state_cls = BarState if lightweight else MarketState
 
         for row in df.itertuples(index=False):
             row_symbol: Optional[str] = getattr(row, "symbol", None)
-            yield MarketState(
+            yield state_cls(
                 timestamp=row.timestamp.to_pydatetime(),
                 symbol=row_symbol or base_symbol,
                 open=float(row.open),
@@ -31,6 +64,26 @@ class MarketStateBuilder:
                 volume=float(row.volume),
             )
 
+    def iter_bar_arrays(self, bars: BarArrays, lightweight: bool = False) -> Iterator[Union[MarketState, BarState]]:
+        """
+        Build MarketStates (or BarStates) straight from columnar (memory-mapped) bars.
+        """
+        symbol = bars.symbol
+        if lightweight:
+            for ts, open_, high, low, close, volume in bars.iter_rows():
+                yield BarState(ts, symbol, open_, high, low, close, volume)
+            return
+        for ts, open_, high, low, close, volume in bars.iter_rows():
+            yield MarketState(
+                timestamp=ts,
+                symbol=symbol,
+                open=open_,
+                high=high,
+                low=low,
+                close=close,
+                volume=volume,
+            )
+
     def _normalize_symbol(self, symbol: str) -> str:
         """
         Accept both full filenames and bare symbols.
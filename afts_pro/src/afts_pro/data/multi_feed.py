@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import heapq
+import logging
+from datetime import datetime
+from itertools import groupby
+from operator import attrgetter
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from afts_pro.core import MarketState
+from afts_pro.data.market_state_builder import MarketStateBuilder
+from afts_pro.data.parquet_feed import TimestampLike
+
+logger = logging.getLogger(__name__)
+
+BarGroup = Tuple[datetime, List[MarketState]]
+
+_by_timestamp = attrgetter("timestamp")
+
+
+def merge_market_states(streams: Sequence[Iterable[MarketState]]) -> Iterator[BarGroup]:
+    """
+    Lazily k-way merge timestamp-ordered MarketState streams into (timestamp, bars) groups.
+
+    Only the head bar of every stream is held in the heap. Bars sharing a timestamp are emitted
+    together, ordered like `streams` (heapq.merge is stable across inputs).
+    """
+    merged = heapq.merge(*streams, key=_by_timestamp)
+    for ts, bars in groupby(merged, key=_by_timestamp):
+        yield ts, list(bars)
+
+
+class MultiSymbolFeed:
+    """
+    Timestamp-ordered event stream over several per-symbol parquet files.
+
+    Each symbol is read through MarketStateBuilder (streaming by default, so memory is bounded by
+    one batch per symbol rather than one DataFrame per symbol) and merged lazily.
+    """
+
+    def __init__(
+        self,
+        builder: MarketStateBuilder,
+        symbols: Sequence[str],
+        folder: str = "final_agg",
+        start: Optional[TimestampLike] = None,
+        end: Optional[TimestampLike] = None,
+        stream: bool = True,
+        batch_size: Optional[int] = None,
+        lightweight: bool = False,
+    ) -> None:
+        if not symbols:
+            raise ValueError("MultiSymbolFeed needs at least one symbol")
+        if len(set(symbols)) != len(symbols):
+            raise ValueError(f"Duplicate symbols in MultiSymbolFeed: {list(symbols)}")
+        self.builder = builder
+        self.symbols = list(symbols)
+        self.folder = folder
+        self.start = start
+        self.end = end
+        self.stream = stream
+        self.batch_size = batch_size
+        self.lightweight = lightweight
+
+    def __iter__(self) -> Iterator[BarGroup]:
+        logger.info(
+            "MULTI_FEED_START | symbols=%s | folder=%s | stream=%s",
+            self.symbols,
+            self.folder,
+            self.stream,
+        )
+        streams = [
+            self.builder.iter_market_states(
+                symbol,
+                folder=self.folder,
+                start=self.start,
+                end=self.end,
+                stream=self.stream,
+                batch_size=self.batch_size,
+                lightweight=self.lightweight,
+            )
+            for symbol in self.symbols
+        ]
+        return merge_market_states(streams)
@@ -1,13 +1,40 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Sequence, Union
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from afts_pro.data.bar_store import PRICE_COLUMNS as BAR_PRICE_COLUMNS
+from afts_pro.data.bar_store import BarArrays, BarStore
+from afts_pro.data.quality import QUALITY_VERSION, QualityReport, log_report, scan_bars
+from afts_pro.data.resample import ResampleCache, split_timeframe
+
+if TYPE_CHECKING:
+    from afts_pro.data.catalog import DataCatalog
 
 logger = logging.getLogger(__name__)
 
+TimestampLike = Union[str, datetime, pd.Timestamp]
+
+
+def to_utc_timestamp(value: Optional[TimestampLike]) -> Optional[pd.Timestamp]:
+    """
+    Normalise a user-supplied bound to a tz-aware UTC Timestamp (naive values are taken as UTC).
+    """
+    if value is None:
+        return None
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is None:
+        return ts.tz_localize("UTC")
+    return ts.tz_convert("UTC")
+
 
 class MissingColumnsError(ValueError):
     """
@@ -15,6 +42,12 @@ class MissingColumnsError(ValueError):
     """
 
 
+class UnorderedDataError(ValueError):
+    """
+    Raised when streamed bars are not in non-decreasing timestamp order.
+    """
+
+
 class ParquetFeed:
     """
     Loads OHLCV bars from parquet files.
@@ -22,34 +55,397 @@ class ParquetFeed:
 
     REQUIRED_COLUMNS: Sequence[str] = ("timestamp", "open", "high", "low", "close", "volume")
 
-    def __init__(self, data_root: Path) -> None:
+    def __init__(
+        self,
+        data_root: Path,
+        use_bar_store: bool = False,
+        bar_store_root: Optional[Path] = None,
+        resample_missing: bool = True,
+        resample_root: Optional[Path] = None,
+        base_folder: str = "final",
+        catalog: Optional["DataCatalog"] = None,
+    ) -> None:
         self._data_root = Path(data_root)
+        self.use_bar_store = use_bar_store
+        self._bar_store = BarStore(Path(bar_store_root) if bar_store_root else self._data_root / ".bar_store")
+        self.resample_missing = resample_missing
+        self.base_folder = base_folder
+        self._resample_cache = ResampleCache(Path(resample_root) if resample_root else self._data_root / ".resample_cache")
+        self.catalog = catalog
+
+    @property
+    def bar_store(self) -> BarStore:
+        return self._bar_store
+
+    @property
+    def resample_cache(self) -> ResampleCache:
+        return self._resample_cache
+
+    def resolve_path(self, symbol: str, folder: str = "final_agg") -> Path:
+        """
+        Path of the parquet file for symbol.
 
-    def load(self, symbol: str, folder: str = "final_agg") -> pd.DataFrame:
+        When `<BASE>_<TF>` (e.g. BTCUSDT_4H) has no file but `<base_folder>/<BASE>.parquet` does,
+        the timeframe is resampled from the base series and the cached file is returned.
+        """
         filename = symbol if symbol.endswith(".parquet") else f"{symbol}.parquet"
         file_path = self._data_root / folder / filename
+        if file_path.exists():
+            return file_path
+        if self.resample_missing:
+            resampled = self._resample_fallback(Path(filename).stem)
+            if resampled is not None:
+                return resampled
+        raise FileNotFoundError(f"Parquet file not found: {file_path}")
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"Parquet file not found: {file_path}")
+    def resample(
+        self,
+        symbol: str,
+        timeframe: str,
+        offset: Optional[str] = None,
+        tz: Optional[str] = None,
+    ) -> Path:
+        """
+        Resample `<base_folder>/<symbol>.parquet` to timeframe (cached) and return the file path.
 
-        logger.info("Loading parquet feed from %s", file_path)
-        df = pd.read_parquet(file_path)
-        if "timestamp" not in df.columns and "time" in df.columns:
-            df = df.rename(columns={"time": "timestamp"})
-        self._validate_columns(df, file_path)
+        offset/tz control session alignment, see resample_bars. The returned path can be passed
+        as `symbol` to load/load_bars/iter_bar_batches.
+        """
+        source = self._data_root / self.base_folder / f"{symbol}.parquet"
+        if not source.exists():
+            raise FileNotFoundError(f"Parquet file not found: {source}")
+        return self._resample_cache.resample_file(source, f"{symbol}_{timeframe}", timeframe, offset=offset, tz=tz)
+
+    def _resample_fallback(self, stem: str) -> Optional[Path]:
+        base, timeframe = split_timeframe(stem)
+        if timeframe is None:
+            return None
+        if not (self._data_root / self.base_folder / f"{base}.parquet").exists():
+            return None
+        return self.resample(base, timeframe)
+
+    def available_columns(self, symbol: str, folder: str = "final_agg") -> List[str]:
+        """
+        Column names of the parquet file (schema read only), with `time` reported as `timestamp`.
+        """
+        file_path = self.resolve_path(symbol, folder)
+        entry = self.catalog.entry_for(file_path) if self.catalog is not None else None
+        names = list(entry.columns) if entry is not None else pq.read_schema(file_path).names
+        if "timestamp" not in names and "time" in names:
+            names = ["timestamp" if n == "time" else n for n in names]
+        return list(names)
+
+    def load(
+        self,
+        symbol: str,
+        folder: str = "final_agg",
+        start: Optional[TimestampLike] = None,
+        end: Optional[TimestampLike] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Load bars sorted by UTC timestamp.
+
+        start/end (both inclusive) are pushed down to the parquet reader: row groups whose
+        timestamp statistics lie outside the window are never decoded. `columns` restricts
+        which columns are decoded; the timestamp column is always included.
+        """
+        file_path = self.resolve_path(symbol, folder)
+        start_ts = to_utc_timestamp(start)
+        end_ts = to_utc_timestamp(end)
+
+        parquet_file = pq.ParquetFile(file_path)
+        ts_column = self._timestamp_column(parquet_file.schema_arrow, file_path)
+        read_columns = self._projected_columns(parquet_file.schema_arrow, ts_column, columns, file_path)
+        row_groups = self.select_row_groups(parquet_file, ts_column, start_ts, end_ts)
+
+        logger.info(
+            "Loading parquet feed from %s | row_groups=%d/%d | columns=%s",
+            file_path,
+            len(row_groups),
+            parquet_file.num_row_groups,
+            "all" if read_columns is None else len(read_columns),
+        )
+        if row_groups:
+            table = parquet_file.read_row_groups(row_groups, columns=read_columns, use_pandas_metadata=True)
+        else:
+            table = parquet_file.schema_arrow.empty_table()
+            if read_columns is not None:
+                table = table.select(read_columns)
+        df = table.to_pandas()
+        if ts_column != "timestamp":
+            df = df.rename(columns={ts_column: "timestamp"})
+        self._validate_columns(df, file_path, required=self._required_for(columns))
 
-        df = df.copy()
         timestamp_series = df["timestamp"]
         if pd.api.types.is_numeric_dtype(timestamp_series):
             df["timestamp"] = pd.to_datetime(timestamp_series, unit="ms", utc=True)
         else:
             df["timestamp"] = pd.to_datetime(timestamp_series, utc=True)
+        if start_ts is not None or end_ts is not None:
+            mask = np.ones(len(df), dtype=bool)
+            if start_ts is not None:
+                mask &= (df["timestamp"] >= start_ts).to_numpy()
+            if end_ts is not None:
+                mask &= (df["timestamp"] <= end_ts).to_numpy()
+            df = df.loc[mask]
         df = df.sort_values("timestamp", kind="mergesort").reset_index(drop=True)
         return df
 
-    def _validate_columns(self, df: pd.DataFrame, file_path: Path) -> None:
-        missing = [col for col in self.REQUIRED_COLUMNS if col not in df.columns]
+    def load_bars(
+        self,
+        symbol: str,
+        folder: str = "final_agg",
+        start: Optional[TimestampLike] = None,
+        end: Optional[TimestampLike] = None,
+    ) -> BarArrays:
+        """
+        Return columnar bars for symbol, memory-mapped from the bar store.
+
+        The store entry is written on first access (or when the parquet file changed) and
+        opened without copying afterwards. start/end (inclusive) slice the mapped arrays.
+        """
+        file_path = self.resolve_path(symbol, folder)
+        bars = self._bar_store.open(file_path, folder)
+        if bars is None:
+            columns = ["open", "high", "low", "close", "volume"]
+            if "symbol" in self.available_columns(symbol, folder):
+                columns.append("symbol")
+            df = self.load(symbol, folder=folder, columns=columns)
+            built = BarArrays.from_frame(df, self._frame_symbol(df, file_path))
+            report = scan_bars(built, timeframe=_timeframe_of(file_path))
+            log_report(report, str(file_path))
+            self._bar_store.write(file_path, folder, built, extra_meta={"quality": report.model_dump(mode="json")})
+            bars = self._bar_store.open(file_path, folder)
+            if bars is None:  # pragma: no cover - source changed while writing
+                raise RuntimeError(f"Bar store entry for {file_path} is stale right after writing.")
+        else:
+            logger.debug("BAR_STORE_HIT | path=%s | rows=%d", file_path, len(bars))
+        return slice_bars(bars, start, end)
+
+    def quality_report(self, symbol: str, folder: str = "final_agg") -> QualityReport:
+        """
+        Data-quality report of the whole file, cached in the bar store entry next to the arrays.
+
+        Builds the store entry when needed; entries written before reports existed are scanned
+        once and their meta is updated.
+        """
+        file_path = self.resolve_path(symbol, folder)
+        bars = self.load_bars(symbol, folder=folder)
+        meta = self._bar_store.read_meta(file_path, folder) or {}
+        cached = meta.get("quality")
+        if cached and cached.get("version") == QUALITY_VERSION:
+            return QualityReport(**cached)
+        report = scan_bars(bars, timeframe=_timeframe_of(file_path))
+        log_report(report, str(file_path))
+        self._bar_store.update_meta(file_path, folder, {"quality": report.model_dump(mode="json")})
+        return report
+
+    def iter_bar_batches(
+        self,
+        symbol: str,
+        folder: str = "final_agg",
+        start: Optional[TimestampLike] = None,
+        end: Optional[TimestampLike] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[BarArrays]:
+        """
+        Stream bars as columnar batches without materialising the whole file.
+
+        Reads one row group at a time (or fixed-size batches when batch_size is set), restricted
+        to row groups overlapping [start, end]. Streamed data cannot be re-sorted, so timestamp
+        order is validated within and across batch boundaries; a decrease raises
+        UnorderedDataError.
+        """
+        file_path = self.resolve_path(symbol, folder)
+        start_ts = to_utc_timestamp(start)
+        end_ts = to_utc_timestamp(end)
+        parquet_file = pq.ParquetFile(file_path)
+        schema = parquet_file.schema_arrow
+        ts_column = self._timestamp_column(schema, file_path)
+        columns = [ts_column, *BAR_PRICE_COLUMNS]
+        missing = [col for col in columns if col not in schema.names]
+        if missing:
+            raise MissingColumnsError(f"Missing columns in {file_path.name}: {', '.join(missing)}")
+        if "symbol" in schema.names:
+            columns.append("symbol")
+        row_groups = self.select_row_groups(parquet_file, ts_column, start_ts, end_ts)
+        logger.info(
+            "Streaming parquet feed from %s | row_groups=%d/%d | batch_size=%s",
+            file_path,
+            len(row_groups),
+            parquet_file.num_row_groups,
+            batch_size or "row_group",
+        )
+
+        if batch_size:
+            batches: Iterable[pa.RecordBatch] = parquet_file.iter_batches(
+                batch_size=batch_size, row_groups=row_groups, columns=columns
+            )
+        else:
+            batches = (parquet_file.read_row_group(rg, columns=columns) for rg in row_groups)
+
+        last_ts: Optional[int] = None
+        fallback_symbol = file_path.stem
+        for batch in batches:
+            bars = _arrow_to_bars(batch, ts_column, fallback_symbol)
+            if start_ts is not None or end_ts is not None:
+                bars = slice_bars(bars, start_ts, end_ts) if _is_sorted(bars.timestamp) else _mask_bars(bars, start_ts, end_ts)
+            if not len(bars):
+                continue
+            if not _is_sorted(bars.timestamp) or (last_ts is not None and bars.timestamp[0] < last_ts):
+                raise UnorderedDataError(
+                    f"Timestamps in {file_path.name} are not in ascending order; streaming requires sorted data."
+                )
+            last_ts = int(bars.timestamp[-1])
+            yield bars
+
+    @staticmethod
+    def select_row_groups(
+        parquet_file: pq.ParquetFile,
+        ts_column: str,
+        start: Optional[pd.Timestamp],
+        end: Optional[pd.Timestamp],
+    ) -> List[int]:
+        """
+        Indices of row groups that may hold rows within [start, end], judged by column statistics.
+
+        Row groups without usable statistics are always kept.
+        """
+        all_groups = list(range(parquet_file.num_row_groups))
+        if start is None and end is None:
+            return all_groups
+        col_idx = parquet_file.schema_arrow.get_field_index(ts_column)
+        field_type = parquet_file.schema_arrow.field(col_idx).type
+        metadata = parquet_file.metadata
+        selected: List[int] = []
+        for rg in all_groups:
+            stats = metadata.row_group(rg).column(col_idx).statistics
+            if stats is None or not stats.has_min_max:
+                selected.append(rg)
+                continue
+            rg_min = _stat_to_utc(stats.min, field_type)
+            rg_max = _stat_to_utc(stats.max, field_type)
+            if rg_min is None or rg_max is None:
+                selected.append(rg)
+                continue
+            if end is not None and rg_min > end:
+                continue
+            if start is not None and rg_max < start:
+                continue
+            selected.append(rg)
+        return selected
+
+    def _frame_symbol(self, df: pd.DataFrame, file_path: Path) -> str:
+        if "symbol" in df.columns and len(df):
+            symbols = df["symbol"].dropna().unique()
+            if len(symbols) == 1:
+                return str(symbols[0])
+            if len(symbols) > 1:
+                logger.warning("BAR_STORE_MULTI_SYMBOL | path=%s | symbols=%s", file_path, list(symbols[:5]))
+        return file_path.stem
+
+    def _timestamp_column(self, schema: pa.Schema, file_path: Path) -> str:
+        if "timestamp" in schema.names:
+            return "timestamp"
+        if "time" in schema.names:
+            return "time"
+        raise MissingColumnsError(f"Missing columns in {file_path.name}: timestamp")
+
+    def _projected_columns(
+        self,
+        schema: pa.Schema,
+        ts_column: str,
+        columns: Optional[Sequence[str]],
+        file_path: Path,
+    ) -> Optional[List[str]]:
+        if columns is None:
+            return None
+        projected = [ts_column]
+        for col in columns:
+            name = ts_column if col in {"timestamp", "time"} else col
+            if name not in projected:
+                projected.append(name)
+        missing = [col for col in projected if col not in schema.names]
+        if missing:
+            raise MissingColumnsError(f"Missing columns in {file_path.name}: {', '.join(missing)}")
+        return projected
+
+    def _required_for(self, columns: Optional[Sequence[str]]) -> Sequence[str]:
+        if columns is None:
+            return self.REQUIRED_COLUMNS
+        return [col for col in self.REQUIRED_COLUMNS if col == "timestamp" or col in columns]
+
+    def _validate_columns(self, df: pd.DataFrame, file_path: Path, required: Optional[Sequence[str]] = None) -> None:
+        missing = [col for col in (required or self.REQUIRED_COLUMNS) if col not in df.columns]
         if missing:
             raise MissingColumnsError(
                 f"Missing columns in {file_path.name}: {', '.join(missing)}"
             )
+
+
+def slice_bars(bars: BarArrays, start: Optional[TimestampLike] = None, end: Optional[TimestampLike] = None) -> BarArrays:
+    """
+    Restrict bars to [start, end] (inclusive) via binary search; returns views, no copies.
+    """
+    start_ts = to_utc_timestamp(start)
+    end_ts = to_utc_timestamp(end)
+    if start_ts is None and end_ts is None:
+        return bars
+    lo = 0 if start_ts is None else int(np.searchsorted(bars.timestamp, start_ts.value, side="left"))
+    hi = len(bars) if end_ts is None else int(np.searchsorted(bars.timestamp, end_ts.value, side="right"))
+    return bars.slice(lo, max(lo, hi))
+
+
+def _timeframe_of(file_path: Path) -> Optional[str]:
+    return split_timeframe(file_path.stem)[1]
+
+
+def _stat_to_utc(value, field_type: pa.DataType) -> Optional[pd.Timestamp]:
+    if value is None:
+        return None
+    if pa.types.is_integer(field_type):
+        # Numeric timestamps are epoch milliseconds, mirroring ParquetFeed.load.
+        return pd.Timestamp(int(value), unit="ms", tz="UTC")
+    try:
+        return to_utc_timestamp(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_sorted(timestamps: np.ndarray) -> bool:
+    return timestamps.shape[0] < 2 or bool(np.all(timestamps[1:] >= timestamps[:-1]))
+
+
+def _mask_bars(bars: BarArrays, start: Optional[pd.Timestamp], end: Optional[pd.Timestamp]) -> BarArrays:
+    mask = np.ones(len(bars), dtype=bool)
+    if start is not None:
+        mask &= bars.timestamp >= start.value
+    if end is not None:
+        mask &= bars.timestamp <= end.value
+    return BarArrays(
+        symbol=bars.symbol,
+        timestamp=bars.timestamp[mask],
+        **{col: getattr(bars, col)[mask] for col in BAR_PRICE_COLUMNS},
+    )
+
+
+def _arrow_to_bars(batch, ts_column: str, fallback_symbol: str) -> BarArrays:
+    ts_array = batch.column(ts_column)
+    if pa.types.is_integer(ts_array.type):
+        timestamps = pc.multiply(ts_array.cast(pa.int64()), 1_000_000)
+    else:
+        timestamps = ts_array.cast(pa.timestamp("ns", tz="UTC")).cast(pa.int64())
+    columns = {
+        col: np.asarray(pc.fill_null(batch.column(col).cast(pa.float64()), np.nan).to_numpy(zero_copy_only=False))
+        for col in BAR_PRICE_COLUMNS
+    }
+    symbol = fallback_symbol
+    if "symbol" in batch.schema.names and batch.num_rows:
+        first = batch.column("symbol")[0].as_py()
+        symbol = first or fallback_symbol
+    return BarArrays(
+        symbol=symbol,
+        timestamp=np.asarray(timestamps.to_numpy(zero_copy_only=False), dtype=np.int64),
+        **columns,
+    )
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import weakref
+from typing import Generic, Iterable, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_END = object()
+
+
+class _ProducerFailure:
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+def _produce(
+    source: Iterable,
+    out: "queue.Queue",
+    stop: threading.Event,
+    batch_size: int,
+    put_timeout: float,
+) -> None:
+    def _put(item) -> bool:
+        # Blocking put with periodic stop checks: a full queue is the backpressure signal.
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=put_timeout)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        batch: List = []
+        for item in source:
+            if stop.is_set():
+                return
+            batch.append(item)
+            if len(batch) >= batch_size:
+                if not _put(batch):
+                    return
+                batch = []
+        if batch and not _put(batch):
+            return
+        _put(_END)
+    except BaseException as exc:  # noqa: BLE001 - re-raised on the consumer thread
+        _put(_ProducerFailure(exc))
+
+
+class PrefetchingIterator(Generic[T]):
+    """
+    Iterates `source` on a background thread, handing over decoded items in batches.
+
+    The producer fills a bounded queue of `queue_depth` batches of `batch_size` items and blocks
+    when the queue is full, so at most (queue_depth + 2) batches are alive at any time
+    (queued, being built, being consumed). Exceptions raised by the source surface on the
+    consuming thread at the position where they occurred. The producer is stopped by close(),
+    by exhausting the iterator, or when the iterator is garbage-collected.
+    """
+
+    def __init__(
+        self,
+        source: Iterable[T],
+        batch_size: int = 256,
+        queue_depth: int = 2,
+        name: str = "afts-prefetch",
+        put_timeout: float = 0.1,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if queue_depth < 1:
+            raise ValueError("queue_depth must be >= 1")
+        self.batch_size = batch_size
+        self.queue_depth = queue_depth
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_depth)
+        self._stop = threading.Event()
+        self._current: List[T] = []
+        self._pos = 0
+        self._done = False
+        self._thread = threading.Thread(
+            target=_produce,
+            args=(source, self._queue, self._stop, batch_size, put_timeout),
+            name=name,
+            daemon=True,
+        )
+        self._finalizer = weakref.finalize(self, self._stop.set)
+        self._thread.start()
+        logger.debug("PREFETCH_STARTED | batch_size=%d | queue_depth=%d", batch_size, queue_depth)
+
+    def __iter__(self) -> "PrefetchingIterator[T]":
+        return self
+
+    def __next__(self) -> T:
+        if self._pos >= len(self._current):
+            self._current = self._next_batch()
+            self._pos = 0
+        item = self._current[self._pos]
+        self._pos += 1
+        return item
+
+    def _next_batch(self) -> List[T]:
+        if self._done:
+            raise StopIteration
+        item = self._queue.get()
+        if item is _END:
+            self._finish()
+            raise StopIteration
+        if isinstance(item, _ProducerFailure):
+            self._finish()
+            raise item.exc
+        return item
+
+    def _finish(self) -> None:
+        self._done = True
+        self._current = []
+        self._stop.set()
+
+    def close(self, timeout: Optional[float] = 1.0) -> None:
+        """
+        Stop the producer thread and drop any prefetched batches.
+        """
+        self._finish()
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._thread.join(timeout=timeout)
+
+    def __enter__(self) -> "PrefetchingIterator[T]":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
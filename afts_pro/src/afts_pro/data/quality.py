@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from afts_pro.data.bar_store import BarArrays
+from afts_pro.data.resample import parse_timeframe
+
+logger = logging.getLogger(__name__)
+
+QUALITY_VERSION = 1
+MAX_SAMPLES = 20
+
+
+class QualityReport(BaseModel):
+    """
+    Result of one vectorized pass over a bar series.
+
+    sequence_ok means timestamps are strictly increasing, which is exactly what the per-bar
+    PriceValidator.validate_bar_sequence check enforces, so validated series can skip it.
+    Gaps and zero-range bars are informational (weekends, illiquid sessions).
+    """
+
+    version: int = QUALITY_VERSION
+    symbol: str
+    rows: int
+    expected_step_ns: Optional[int] = None
+    unordered: int = 0
+    duplicates: int = 0
+    gaps: int = 0
+    largest_gap_ns: int = 0
+    ohlc_violations: int = 0
+    nan_rows: int = 0
+    zero_range: int = 0
+    first_unordered: List[int] = Field(default_factory=list)
+    first_duplicates: List[int] = Field(default_factory=list)
+    first_gaps: List[Tuple[int, int]] = Field(default_factory=list)
+    first_ohlc_violations: List[int] = Field(default_factory=list)
+
+    @property
+    def sequence_ok(self) -> bool:
+        return self.unordered == 0 and self.duplicates == 0
+
+    @property
+    def values_ok(self) -> bool:
+        return self.ohlc_violations == 0 and self.nan_rows == 0
+
+
+def scan_bars(bars: BarArrays, timeframe: Optional[str] = None) -> QualityReport:
+    """
+    Check monotonicity, duplicates, gaps, OHLC consistency, NaNs and zero-range bars in one pass.
+
+    Gaps are steps larger than the expected bar width, taken from `timeframe` or, when not
+    given, the median timestamp step. Sample lists hold the row indices (or (start, end)
+    timestamps for gaps) of the first few findings.
+    """
+    ts = np.asarray(bars.timestamp, dtype=np.int64)
+    open_ = np.asarray(bars.open, dtype=np.float64)
+    high = np.asarray(bars.high, dtype=np.float64)
+    low = np.asarray(bars.low, dtype=np.float64)
+    close = np.asarray(bars.close, dtype=np.float64)
+
+    report = QualityReport(symbol=bars.symbol, rows=len(bars))
+    if len(bars) == 0:
+        return report
+
+    diffs = np.diff(ts)
+    unordered = np.flatnonzero(diffs < 0) + 1
+    duplicates = np.flatnonzero(diffs == 0) + 1
+    report.unordered = int(unordered.shape[0])
+    report.duplicates = int(duplicates.shape[0])
+    report.first_unordered = unordered[:MAX_SAMPLES].tolist()
+    report.first_duplicates = duplicates[:MAX_SAMPLES].tolist()
+
+    step: Optional[int] = None
+    if timeframe:
+        step = parse_timeframe(timeframe)
+    elif diffs.shape[0]:
+        positive = diffs[diffs > 0]
+        step = int(np.median(positive)) if positive.shape[0] else None
+    report.expected_step_ns = step
+    if step:
+        gap_idx = np.flatnonzero(diffs > step)
+        report.gaps = int(gap_idx.shape[0])
+        if gap_idx.shape[0]:
+            report.largest_gap_ns = int(diffs[gap_idx].max())
+            report.first_gaps = [(int(ts[i]), int(ts[i + 1])) for i in gap_idx[:MAX_SAMPLES]]
+
+    prices = np.column_stack((open_, high, low, close))
+    nan_mask = np.isnan(prices).any(axis=1)
+    report.nan_rows = int(nan_mask.sum())
+    with np.errstate(invalid="ignore"):
+        bad = (high < low) | (high < np.maximum(open_, close)) | (low > np.minimum(open_, close))
+    bad &= ~nan_mask
+    bad_idx = np.flatnonzero(bad)
+    report.ohlc_violations = int(bad_idx.shape[0])
+    report.first_ohlc_violations = bad_idx[:MAX_SAMPLES].tolist()
+    report.zero_range = int(((high == low) & ~nan_mask).sum())
+    return report
+
+
+def log_report(report: QualityReport, source: str) -> None:
+    level = logging.INFO if report.sequence_ok and report.values_ok else logging.WARNING
+    logger.log(
+        level,
+        "DATA_QUALITY | source=%s | rows=%d | unordered=%d | duplicates=%d | gaps=%d | largest_gap_s=%.0f | "
+        "ohlc_violations=%d | nan_rows=%d | zero_range=%d",
+        source,
+        report.rows,
+        report.unordered,
+        report.duplicates,
+        report.gaps,
+        report.largest_gap_ns / 1e9,
+        report.ohlc_violations,
+        report.nan_rows,
+        report.zero_range,
+    )
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+RESAMPLE_VERSION = 1
+
+_NS_PER_UNIT: Dict[str, int] = {
+    "s": 1_000_000_000,
+    "t": 60 * 1_000_000_000,
+    "min": 60 * 1_000_000_000,
+    "m": 60 * 1_000_000_000,
+    "h": 3_600 * 1_000_000_000,
+    "d": 86_400 * 1_000_000_000,
+    "w": 7 * 86_400 * 1_000_000_000,
+}
+# Pandas month aliases; lower-case "m" stays minutes.
+_MONTH_UNITS = {"M", "MS", "ME"}
+_TIMEFRAME_RE = re.compile(r"^\s*(\d+)?\s*([A-Za-z]+)\s*$")
+# The epoch (1970-01-01) is a Thursday; weekly buckets start on Monday 00:00 instead.
+_WEEK_ANCHOR_NS = 4 * _NS_PER_UNIT["d"]
+
+_HASH_MEMO: Dict[Tuple[str, int, int], str] = {}
+_HASH_LOCK = threading.Lock()
+
+
+class TimeframeError(ValueError):
+    """
+    Raised for timeframe strings that cannot be parsed or are finer than the source bars.
+    """
+
+
+def parse_timeframe(timeframe: str) -> int:
+    """
+    Timeframe string ("15T", "15min", "4H", "1D", "1W", ...) to a bucket width in nanoseconds.
+
+    Months are not supported: they have no fixed width.
+    """
+    match = _TIMEFRAME_RE.match(str(timeframe))
+    if not match:
+        raise TimeframeError(f"Invalid timeframe: {timeframe!r}")
+    count = int(match.group(1) or 1)
+    unit = match.group(2).lower()
+    if match.group(2) in _MONTH_UNITS or unit not in _NS_PER_UNIT or count <= 0:
+        raise TimeframeError(f"Invalid timeframe: {timeframe!r}")
+    return count * _NS_PER_UNIT[unit]
+
+
+def split_timeframe(stem: str) -> Tuple[str, Optional[str]]:
+    """
+    "EURUSD_1H" -> ("EURUSD", "1H"); stems without a timeframe suffix map to (stem, None).
+    """
+    base, sep, suffix = stem.rpartition("_")
+    if sep and base:
+        try:
+            parse_timeframe(suffix)
+            return base, suffix
+        except TimeframeError:
+            pass
+    return stem, None
+
+
+def resample_bars(
+    df: pd.DataFrame,
+    timeframe: str,
+    offset: Optional[str] = None,
+    tz: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Aggregate sorted OHLCV bars into `timeframe` buckets (left-labelled, left-closed).
+
+    Buckets are fixed-width slots counted from the UTC epoch (weekly ones from Monday), shifted
+    by `offset` (e.g. "17H" for a session that opens at 17:00). With `tz` the slots are laid out
+    on that zone's wall clock, so a daily session stays at 17:00 local across DST changes; the
+    returned labels are always UTC. Empty buckets produce no row. The output has the feed
+    columns (timestamp, open, high, low, close, volume) plus n_bars and, when present, symbol.
+    """
+    step = parse_timeframe(timeframe)
+    offset_ns = parse_timeframe(offset) if offset else 0
+    if step % _NS_PER_UNIT["w"] == 0:
+        offset_ns += _WEEK_ANCHOR_NS
+
+    ts_column = "timestamp" if "timestamp" in df.columns else "time"
+    ts = df[ts_column]
+    if pd.api.types.is_numeric_dtype(ts):
+        utc_ns = ts.to_numpy(dtype=np.int64) * 1_000_000
+    else:
+        utc_ns = pd.to_datetime(ts, utc=True).to_numpy(dtype="datetime64[ns]").view(np.int64)
+    order = None
+    if utc_ns.shape[0] > 1 and np.any(utc_ns[1:] < utc_ns[:-1]):
+        order = np.argsort(utc_ns, kind="stable")
+        utc_ns = utc_ns[order]
+
+    def column(name: str) -> np.ndarray:
+        values = df[name].to_numpy(dtype=np.float64, na_value=np.nan)
+        return values if order is None else values[order]
+
+    if utc_ns.shape[0] > 1:
+        source_step = int(np.median(np.diff(utc_ns)))
+        if source_step > step:
+            raise TimeframeError(f"Timeframe {timeframe} is finer than the source bars ({source_step} ns).")
+
+    if tz:
+        wall_ns = pd.DatetimeIndex(utc_ns.view("datetime64[ns]"), tz="UTC").tz_convert(tz).tz_localize(None).asi8
+    else:
+        wall_ns = utc_ns
+    bucket = (wall_ns - offset_ns) // step
+
+    n = bucket.shape[0]
+    if n == 0:
+        starts = np.empty(0, dtype=np.int64)
+    else:
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(bucket)) + 1))
+    ends = np.append(starts[1:], n)
+
+    labels = bucket[starts] * step + offset_ns
+    if tz:
+        local = pd.DatetimeIndex(labels.view("datetime64[ns]")).tz_localize(
+            tz, ambiguous=np.ones(labels.shape[0], dtype=bool), nonexistent="shift_forward"
+        )
+        labels = local.tz_convert("UTC").asi8
+
+    out = pd.DataFrame({"timestamp": pd.to_datetime(labels, unit="ns", utc=True)})
+    if n:
+        out["open"] = column("open")[starts]
+        out["high"] = np.maximum.reduceat(column("high"), starts)
+        out["low"] = np.minimum.reduceat(column("low"), starts)
+        out["close"] = column("close")[ends - 1]
+        out["volume"] = np.add.reduceat(column("volume"), starts)
+    else:
+        for name in ("open", "high", "low", "close", "volume"):
+            out[name] = np.empty(0, dtype=np.float64)
+    out["n_bars"] = (ends - starts).astype(np.int32)
+    if "symbol" in df.columns:
+        symbols = df["symbol"].to_numpy()
+        out["symbol"] = (symbols if order is None else symbols[order])[starts] if n else []
+    return out
+
+
+def file_hash(path: Path) -> str:
+    """
+    Content hash of a file, memoised per (path, size, mtime) for the lifetime of the process.
+    """
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+    with _HASH_LOCK:
+        cached = _HASH_MEMO.get(key)
+    if cached is not None:
+        return cached
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    value = digest.hexdigest()
+    with _HASH_LOCK:
+        _HASH_MEMO[key] = value
+    return value
+
+
+class ResampleCache:
+    """
+    On-disk cache of resampled parquet files keyed by (source content hash, timeframe, alignment).
+
+    Layout: <cache_root>/<key>/<name>.parquet, where <name> is the requested symbol (e.g.
+    BTCUSDT_4H) so downstream caches keyed by file stem stay readable.
+    """
+
+    def __init__(self, cache_root: Path) -> None:
+        self._root = Path(cache_root)
+
+    @property
+    def cache_root(self) -> Path:
+        return self._root
+
+    def cache_key(self, source_path: Path, timeframe: str, offset: Optional[str] = None, tz: Optional[str] = None) -> str:
+        parts = f"v{RESAMPLE_VERSION}|{file_hash(source_path)}|{parse_timeframe(timeframe)}|{offset or ''}|{tz or ''}"
+        return hashlib.blake2b(parts.encode("utf-8"), digest_size=10).hexdigest()
+
+    def resample_file(
+        self,
+        source_path: Path,
+        name: str,
+        timeframe: str,
+        offset: Optional[str] = None,
+        tz: Optional[str] = None,
+    ) -> Path:
+        """
+        Return the cached resampled parquet for source_path, building it on a miss.
+        """
+        target = self._root / self.cache_key(source_path, timeframe, offset, tz) / f"{name}.parquet"
+        if target.exists():
+            logger.debug("RESAMPLE_CACHE_HIT | source=%s | timeframe=%s | path=%s", source_path, timeframe, target)
+            return target
+        columns = ["open", "high", "low", "close", "volume"]
+        df = pd.read_parquet(source_path)
+        missing = [col for col in columns if col not in df.columns]
+        if missing or not ({"timestamp", "time"} & set(df.columns)):
+            raise ValueError(f"Cannot resample {source_path.name}: missing OHLCV/timestamp columns {missing}")
+        out = resample_bars(df, timeframe, offset=offset, tz=tz)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.tmp-{os.getpid()}")
+        out.to_parquet(tmp, index=False)
+        os.replace(tmp, target)
+        logger.info(
+            "RESAMPLED | source=%s | timeframe=%s | rows_in=%d | rows_out=%d | path=%s",
+            source_path,
+            timeframe,
+            len(df),
+            len(out),
+            target,
+        )
+        return target
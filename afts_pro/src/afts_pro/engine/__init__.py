@@ -2,6 +2,15 @@
 Engine entrypoints for AFTS-PRO runtime.
 """
 
-from .engine import start
+from afts_pro.utils.lazy import lazy_exports
 
-__all__ = ["start"]
+__all__ = ["set_sampling_profiler", "start"]
+
+# Submodules are imported on first attribute access (PEP 562).
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "set_sampling_profiler": ".engine",
+        "start": ".engine",
+    },
+)
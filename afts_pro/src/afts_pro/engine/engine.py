@@ -1,19 +1,40 @@
+import hashlib
+import json
 import logging
-from datetime import datetime, timezone
+import pickle
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set
+
+from pydantic import ConfigDict, Field
 
 from afts_pro.config import (
     load_all_configs_into_global,
     load_global_config_from_profile,
     load_yaml,
+    reload_config_sections,
 )
-from afts_pro.config.loader import get_file_mtimes
+from afts_pro.config.watcher import ConfigWatcher
 from afts_pro.config.profile_config import get_profile_include_paths
 from afts_pro.core import MarketState, StrategyDecision
 from afts_pro.core.mode_dispatcher import Mode
-from afts_pro.data import MarketStateBuilder, ParquetFeed, ExtrasLoader
+from afts_pro.data import MarketStateBuilder, ParquetFeed, ExtrasLoader, PrefetchingIterator, DataCatalog
+from afts_pro.data.catalog import window_rows
+from afts_pro.data.resample import TimeframeError, parse_timeframe, split_timeframe
+from afts_pro.engine.checkpoint import (
+    END_SNAPSHOT_NAME,
+    CheckpointWriter,
+    find_resumable_run,
+    load_snapshot,
+    snapshot_path,
+    write_snapshot,
+)
+from afts_pro.engine.fast_forward import next_active_index
+from afts_pro.engine.profiler import SamplingProfiler
+from afts_pro.engine.throughput import ThroughputMeter
 from afts_pro.exec import (
     AccountState,
     Fill,
@@ -27,6 +48,7 @@ from afts_pro.exec import (
     SimFillEngine,
 )
 from afts_pro.exec.exit_policy import ExitPolicyApplier, ExitPolicyConfig
+from afts_pro.exec.intrabar import IntrabarResolver
 from afts_pro.exec.position_sizer import PositionSizer, PositionSizerConfig
 from afts_pro.core.strategy_profile import load_strategy_profile
 from afts_pro.core.strategy_orb import ORBStrategy
@@ -53,6 +75,18 @@ DATA_ROOT = PROJECT_ROOT / "data"
 
 
 _PROFILE_PATH: Optional[str] = None
+_SAMPLING_INTERVAL_MS: Optional[float] = None
+
+
+class _NoActionDecision(StrategyDecision):
+    """
+    Immutable "none" decision reused on every bar where behaviour blocks new orders.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    update: Mapping[str, Any] = Field(default_factory=lambda: MappingProxyType({}))
+    meta: Mapping[str, Any] = Field(default_factory=lambda: MappingProxyType({}))
 
 
 def set_profile_path(profile_path: Optional[str]) -> None:
@@ -60,6 +94,14 @@ def set_profile_path(profile_path: Optional[str]) -> None:
     _PROFILE_PATH = profile_path
 
 
+def set_sampling_profiler(interval_ms: Optional[float]) -> None:
+    """
+    Enable the sampling profiler for SIM runs (None disables it).
+    """
+    global _SAMPLING_INTERVAL_MS
+    _SAMPLING_INTERVAL_MS = interval_ms
+
+
 def _build_fill_engine(execution_cfg) -> SimFillEngine:
     return SimFillEngine(
         fee_rate=execution_cfg.taker_fee_pct,
@@ -69,6 +111,29 @@ def _build_fill_engine(execution_cfg) -> SimFillEngine:
     )
 
 
+def _build_intrabar_resolver(feed: ParquetFeed, symbol: str, timeframe: Optional[str]) -> Optional[IntrabarResolver]:
+    """
+    Resolver over the finer series of symbol ("<BASE>_<timeframe>" or the base file), if available.
+    """
+    if not timeframe:
+        return None
+    base, coarse = split_timeframe(symbol)
+    if coarse is None:
+        logger.warning("INTRABAR_DISABLED | symbol=%s | reason=no_timeframe_suffix", symbol)
+        return None
+    try:
+        if timeframe == "base":
+            fine = feed.load_bars(base, folder=feed.base_folder)
+        else:
+            fine = feed.load_bars(f"{base}_{timeframe}")
+        bar_ns = parse_timeframe(coarse)
+    except (FileNotFoundError, TimeframeError) as exc:
+        logger.warning("INTRABAR_DISABLED | symbol=%s | timeframe=%s | reason=%s", symbol, timeframe, exc)
+        return None
+    logger.info("INTRABAR_ENABLED | symbol=%s | timeframe=%s | fine_bars=%d", symbol, timeframe, len(fine))
+    return IntrabarResolver(fine, bar_ns=bar_ns)
+
+
 def _instantiate_strategies(symbol: str, enabled: Sequence[str]) -> List:
     strategies = []
     for name in enabled:
@@ -98,23 +163,66 @@ def _collect_config_paths(profile_path: Optional[str], global_config) -> List[Pa
     return list(unique.keys())
 
 
-async def start(mode: Mode, profile_path: Optional[str] = None) -> None:
+def _log_data_plan(catalog: DataCatalog, symbol: str, data_cfg: Dict[str, Any]) -> None:
+    entry = catalog.lookup(symbol, folder="final_agg")
+    if entry is None:
+        logger.warning("DATA_PLAN | symbol=%s | not in catalog (resampled or missing)", symbol)
+        return
+    start, end = data_cfg.get("start"), data_cfg.get("end")
+    rows = window_rows(entry, start, end)
+    logger.info(
+        "DATA_PLAN | symbol=%s | file=%s | first=%s | last=%s | rows_total=%d | rows_window<=%d",
+        symbol,
+        entry.path,
+        entry.first_ts,
+        entry.last_ts,
+        entry.rows,
+        rows,
+    )
+    if rows == 0:
+        logger.warning("DATA_PLAN | symbol=%s | window start=%s end=%s has no data", symbol, start, end)
+
+
+async def start(
+    mode: Mode,
+    profile_path: Optional[str] = None,
+    symbol: Optional[str] = None,
+    resume: bool = False,
+) -> Optional[Path]:
     """
     Primary asynchronous entrypoint for the trading engine.
+
+    In SIM mode `symbol` overrides the profile's first asset; the run directory is returned
+    when the run logger is enabled. `resume` continues the latest interrupted SIM run of the
+    same profile (and symbol) from its last checkpoint.
     """
     if profile_path is not None:
         set_profile_path(profile_path)
     logger.info("Engine start invoked for mode=%s", mode.value)
 
     if mode == Mode.SIM:
-        await _run_simulation()
+        if not _SAMPLING_INTERVAL_MS:
+            return await _run_simulation(symbol=symbol, resume=resume)
+        profiler = SamplingProfiler(interval_s=_SAMPLING_INTERVAL_MS / 1000.0)
+        with profiler:
+            run_dir = await _run_simulation(profiler=profiler, symbol=symbol, resume=resume)
+        if profiler.output_path is None:
+            # No run directory (run logger disabled or run aborted before finalize).
+            profiler.write(PROJECT_ROOT / "runs" / "profiles", f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}.folded")
+        return run_dir
     elif mode == Mode.TRAIN:
         logger.info("TRAIN mode selected. Use CLI-based TrainController entrypoint for now.")
     elif mode == Mode.LIVE:
         logger.info("LIVE mode stub - no implementation yet.")
+    return None
 
 
-async def _run_simulation() -> None:
+async def _run_simulation(
+    profiler: Optional[SamplingProfiler] = None,
+    symbol: Optional[str] = None,
+    resume: bool = False,
+) -> Optional[Path]:
+    meter = ThroughputMeter()
     _sanity_check_exec_models()
 
     profile_path = _PROFILE_PATH
@@ -126,12 +234,17 @@ async def _run_simulation() -> None:
         global_config = load_all_configs_into_global()
         logger.info("Loaded GlobalConfig: %s", global_config.summary())
 
-    feed = ParquetFeed(DATA_ROOT)
-    builder = MarketStateBuilder(feed)
     asset_specs = global_config.assets.assets
-    symbol = next(iter(asset_specs.keys()), "ETHUSDT_5T")
+    symbol_override = symbol
+    symbol = symbol or next(iter(asset_specs.keys()), "ETHUSDT_5T")
     sim_mode_cfg_path = PROJECT_ROOT / "configs" / "modes" / "sim.yaml"
     sim_mode_cfg = load_yaml(str(sim_mode_cfg_path)) if sim_mode_cfg_path.exists() else {}
+    data_cfg = sim_mode_cfg.get("data", {}) or {}
+    catalog = DataCatalog(DATA_ROOT).refresh() if data_cfg.get("catalog", True) else None
+    feed = ParquetFeed(DATA_ROOT, use_bar_store=bool(data_cfg.get("use_bar_store", False)), catalog=catalog)
+    if catalog is not None:
+        _log_data_plan(catalog, symbol, data_cfg)
+    builder = MarketStateBuilder(feed)
     use_risk_agent = bool(sim_mode_cfg.get("use_risk_agent", False))
     use_exit_agent = bool(sim_mode_cfg.get("use_exit_agent", False))
     agent_paths = sim_mode_cfg.get("agent_paths", {})
@@ -173,13 +286,28 @@ async def _run_simulation() -> None:
     position_manager = PositionManager()
     execution_cfg = global_config.execution
     fill_engine = _build_fill_engine(execution_cfg)
+    intrabar = _build_intrabar_resolver(feed, symbol, getattr(execution_cfg, "intrabar_timeframe", None))
+    fill_engine.intrabar = intrabar
     price_validator = PriceValidator()
     risk_manager = RiskManager(risk_policy, ftmo_engine=ftmo_engine)
+    # Columnar view of the exact bar timeline the loop will walk (bar store only).
+    bar_arrays = None
+    if feed.use_bar_store and not data_cfg.get("stream", False):
+        bar_arrays = feed.load_bars(symbol, folder="final_agg", start=data_cfg.get("start"), end=data_cfg.get("end"))
+    max_bars = data_cfg.get("max_bars")
+    continuation = bool((sim_mode_cfg.get("continuation", {}) or {}).get("enabled", False))
+    if continuation and bar_arrays is None:
+        bar_arrays = feed.load_bars(symbol, folder="final_agg", start=data_cfg.get("start"), end=data_cfg.get("end"))
     run_logger: RunLogger | None = None
+    snapshot: Optional[Dict[str, Any]] = None
+    continued = False
+    config_hash = _config_hash(global_config, sim_mode_cfg)
     if global_config.runlogger.enabled:
-        run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S") + f"_{global_config.environment.mode}_{profile_name}"
+        run_suffix = f"_{global_config.environment.mode}_{profile_name}"
+        if symbol_override:
+            run_suffix += f"_{symbol}"  # parallel per-symbol runs start within the same second
         run_meta = RunMeta(
-            run_id=run_id,
+            run_id=datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S") + run_suffix,
             mode=global_config.environment.mode,
             profile_name=profile_name,
             started_at=datetime.now(timezone.utc),
@@ -187,9 +315,47 @@ async def _run_simulation() -> None:
             symbol=symbol,
             timeframe="unknown",
         )
+        if resume:
+            base_dir = Path(global_config.runlogger.base_dir)
+            resume_dir = find_resumable_run(base_dir if base_dir.is_absolute() else PROJECT_ROOT / base_dir, run_suffix)
+            if resume_dir is None:
+                logger.warning("RESUME_NOT_FOUND | suffix=%s | starting a new run", run_suffix)
+            else:
+                snapshot = load_snapshot(resume_dir)
+                run_meta = RunMeta(**snapshot["run_logger"]["run_meta"])
+                if snapshot.get("config_hash") != config_hash:
+                    logger.warning("RESUME_CONFIG_CHANGED | run_id=%s | config differs from the checkpointed run", run_meta.run_id)
+        elif continuation:
+            base_dir = Path(global_config.runlogger.base_dir)
+            previous_dir = find_resumable_run(
+                base_dir if base_dir.is_absolute() else PROJECT_ROOT / base_dir, run_suffix, name=END_SNAPSHOT_NAME
+            )
+            walked = min(len(bar_arrays), int(max_bars)) if max_bars else len(bar_arrays)
+            if previous_dir is not None:
+                previous = load_snapshot(previous_dir, END_SNAPSHOT_NAME)
+                reason = _continuation_mismatch(previous, bar_arrays, walked, config_hash)
+                if reason is not None:
+                    logger.info("CONTINUATION_SKIPPED | previous=%s | reason=%s | running full history", previous_dir.name, reason)
+                elif previous["bar_index"] == walked:
+                    logger.info("CONTINUATION_UP_TO_DATE | run_id=%s | bars=%d", previous_dir.name, walked)
+                    return previous_dir
+                else:
+                    snapshot = previous
+                    continued = True
+                    run_meta = RunMeta(**snapshot["run_logger"]["run_meta"])
+                    logger.info(
+                        "CONTINUATION | run_id=%s | previous_bars=%d | new_bars=%d",
+                        run_meta.run_id,
+                        previous["bar_index"],
+                        walked - previous["bar_index"],
+                    )
         run_logger = RunLogger(run_meta, global_config.runlogger, PROJECT_ROOT)
+        if profiler is not None:
+            run_logger.attach_profiler(profiler)
     else:
         logger.info("RUNLOGGER_DISABLED")
+        if resume:
+            logger.warning("RESUME_UNAVAILABLE | checkpoints live in the run directory; the run logger is disabled")
     behaviour_manager: BehaviourManager | None = None
     behaviour_guards = create_guards(global_config.behaviour, initial_balance=starting_balance)
     if behaviour_guards:
@@ -211,7 +377,7 @@ async def _run_simulation() -> None:
     extras_loader: ExtrasLoader | None = None
     extras_map = {}
     if global_config.extras.enabled:
-        extras_loader = ExtrasLoader(global_config.extras)
+        extras_loader = ExtrasLoader(global_config.extras, catalog=catalog)
         logger.info(
             "EXTRAS_LOADER_ENABLED | datasets=%s",
             [d.name for d in global_config.extras.get_enabled_datasets()],
@@ -227,7 +393,9 @@ async def _run_simulation() -> None:
     if global_config.features.enabled:
         feature_engine = FeatureEngine(global_config.features)
         if extras_map:
-            feature_engine.attach_extras(extras_map)
+            # Pre-align extras to the bar timeline when it is known up front.
+            bar_timestamps = bar_arrays.timestamp if bar_arrays is not None else None
+            feature_engine.attach_extras(extras_map, bar_timestamps=bar_timestamps)
     else:
         logger.info("FEATURE_ENGINE_DISABLED")
     # RL inference hook (optional)
@@ -254,56 +422,177 @@ async def _run_simulation() -> None:
         ps_cfg = PositionSizerConfig(**position_sizer_cfg) if isinstance(position_sizer_cfg, dict) else PositionSizerConfig()
         position_sizer = PositionSizer(ps_cfg)
 
-    tracked_paths: List[Path] = []
-    config_mtimes: Dict[Path, float] = {}
-    if global_config.environment.config_hot_reload_enabled and global_config.environment.mode in {"sim", "train"}:
-        tracked_paths = _collect_config_paths(profile_path, global_config)
-        config_mtimes = get_file_mtimes(tracked_paths)
+    config_watcher: Optional[ConfigWatcher] = None
+    env_cfg = global_config.environment
+    if env_cfg.config_hot_reload_enabled and env_cfg.mode in {"sim", "train"}:
+        config_watcher = ConfigWatcher(
+            _collect_config_paths(profile_path, global_config),
+            poll_interval_s=env_cfg.config_hot_reload_poll_interval_s,
+        ).start()
 
     last_bar: Optional[MarketState] = None
     pending_orders_for_next_bar: List[Order] = []
-    demo_entry_sent = False
-    market_states = builder.iter_market_states(symbol=symbol, folder="final_agg")
+    # A disabled demo entry counts as already sent (fast-forward waits for it otherwise).
+    demo_entry_sent = not bool(sim_mode_cfg.get("demo_entry", True))
+    no_action_decision = _NoActionDecision(action="none", side=None, confidence=0.0)
     bar_index = 0
-    for state in islice(market_states, 200):
-        price_validator.validate_bar_sequence(last_bar, state)
+    skipped_total = 0
+    data_start = data_cfg.get("start")
+    if snapshot is not None and run_logger is not None:
+        bar_index = snapshot["bar_index"]
+        last_bar = snapshot["last_bar"]
+        demo_entry_sent = snapshot["demo_entry_sent"]
+        skipped_total = snapshot["skipped_total"]
+        pending_orders_for_next_bar = snapshot["pending_orders"]
+        account_state = snapshot["account_state"]
+        position_manager = snapshot["position_manager"]
+        risk_manager = snapshot["risk_manager"]
+        behaviour_manager = snapshot["behaviour_manager"]
+        strategies, bridge = snapshot["strategies"]
+        if feature_engine is not None and snapshot["feature_engine"] is not None:
+            feature_engine.restore(snapshot["feature_engine"])
+        if continued:
+            run_logger.reopen(snapshot["run_logger"])
+        else:
+            run_logger.restore(snapshot["run_logger"])
+        # Bars are at least second-aligned; the next one starts strictly after the last bar.
+        data_start = last_bar.timestamp + timedelta(microseconds=1)
+        logger.info("SIM_RESUMED | run_id=%s | bar=%d | last_ts=%s", run_logger.run_meta.run_id, bar_index, last_bar.timestamp)
+    market_states = builder.iter_market_states(
+        symbol=symbol,
+        folder="final_agg",
+        start=data_start,
+        end=data_cfg.get("end"),
+        stream=bool(data_cfg.get("stream", False)),
+        batch_size=data_cfg.get("batch_size"),
+        lightweight=bool(data_cfg.get("lightweight_bars", True)),
+    )
+    prefetch_cfg = data_cfg.get("prefetch", {}) or {}
+    if prefetch_cfg.get("enabled", False):
+        market_states = PrefetchingIterator(
+            market_states,
+            batch_size=int(prefetch_cfg.get("batch_size", 256)),
+            queue_depth=int(prefetch_cfg.get("queue_depth", 2)),
+        )
         logger.info(
-            "SIM bar | ts=%s | symbol=%s | close=%.4f",
-            state.timestamp.isoformat(),
-            state.symbol,
-            state.close,
+            "DATA_PREFETCH_ENABLED | batch_size=%d | queue_depth=%d",
+            market_states.batch_size,
+            market_states.queue_depth,
         )
-        (
-            global_config,
-            behaviour_manager,
-            strategies,
-            fill_engine,
-            config_mtimes,
-            tracked_paths,
-            bridge,
-            execution_cfg,
-            asset_specs,
-        ) = maybe_reload_config(
-            bar_index=bar_index,
-            profile_path=profile_path,
+    check_sequence = True
+    if feed.use_bar_store and not data_cfg.get("stream", False):
+        # The cached quality scan already proved strict timestamp order for the whole file.
+        quality = feed.quality_report(symbol, folder="final_agg")
+        check_sequence = not quality.sequence_ok
+        logger.info("DATA_QUALITY_GATE | symbol=%s | per_bar_sequence_checks=%s", symbol, check_sequence)
+    logger.info(
+        "SIM_WINDOW | symbol=%s | start=%s | end=%s | max_bars=%s",
+        symbol,
+        data_cfg.get("start"),
+        data_cfg.get("end"),
+        max_bars if max_bars else "full",
+    )
+    # Per-bar lines go to the event journal (or DEBUG text); INFO keeps lifecycle events only.
+    # "off" emits no per-bar text at any log level.
+    bar_logging = str(sim_mode_cfg.get("bar_logging", "journal")).lower()
+    bar_log_level = logging.INFO if bar_logging == "text" else logging.DEBUG
+    log_bars = bar_logging != "off" and logger.isEnabledFor(bar_log_level)
+    debug_bars = bar_logging != "off" and logger.isEnabledFor(logging.DEBUG)
+    journal = run_logger.open_journal() if run_logger is not None and bar_logging == "journal" else None
+    # Fast path: while flat with nothing pending, jump straight to the next bar on which a
+    # strategy, guard, risk policy or resting order can act. A pending config reload is applied
+    # before the jump is planned; one still pending stops the jump.
+    fast_bars = None
+    if sim_mode_cfg.get("fast_forward", False):
+        if bar_arrays is None or rl_hook is not None:
+            logger.info("FAST_FORWARD_DISABLED | reason=%s", "no_bar_arrays" if bar_arrays is None else "rl_hook")
+        else:
+            fast_bars = bar_arrays
+            logger.info("FAST_FORWARD_ENABLED | bars=%d", len(fast_bars))
+    fast_stop = len(fast_bars) if fast_bars is not None else 0
+    if fast_bars is not None and max_bars:
+        fast_stop = min(fast_stop, int(max_bars))
+    checkpoint_every = int((sim_mode_cfg.get("checkpoint", {}) or {}).get("every_bars", 0) or 0)
+    checkpointer: Optional[CheckpointWriter] = None
+    if checkpoint_every > 0 and run_logger is not None:
+        checkpointer = CheckpointWriter(run_logger.run_dir, checkpoint_every)
+        checkpointer.next_bar = bar_index + checkpoint_every
+        logger.info("CHECKPOINT_ENABLED | every_bars=%d | path=%s", checkpoint_every, checkpointer.path)
+
+    def _snapshot() -> Dict[str, Any]:
+        # Growing output (equity, trades, journal) is sealed by run_logger.checkpoint(), not pickled.
+        return {
+            "config_hash": config_hash,
+            "last_bar": last_bar,
+            "demo_entry_sent": demo_entry_sent,
+            "skipped_total": skipped_total,
+            "pending_orders": pending_orders_for_next_bar,
+            "account_state": account_state,
+            "position_manager": position_manager,
+            "risk_manager": risk_manager,
+            "behaviour_manager": behaviour_manager,
+            # Pickled together so references shared between strategies and bridge survive.
+            "strategies": (strategies, bridge),
+            "feature_engine": feature_engine.checkpoint() if feature_engine is not None else None,
+            "run_logger": run_logger.checkpoint(),
+        }
+
+    def _apply_pending_reload() -> None:
+        nonlocal global_config, behaviour_manager, strategies, bridge, fill_engine, config_watcher
+        reload = apply_config_changes(
+            config_watcher.drain(),
             global_config=global_config,
-            current_behaviour_manager=behaviour_manager,
-            current_strategies=strategies,
-            current_execution_engine=fill_engine,
-            current_bridge=bridge,
+            behaviour_manager=behaviour_manager,
+            strategies=strategies,
+            fill_engine=fill_engine,
+            bridge=bridge,
             symbol=symbol,
-            tracked_paths=tracked_paths,
-            last_mtimes=config_mtimes,
             account_state=account_state,
         )
-        order_builder.asset_specs = asset_specs
+        global_config = reload.global_config
+        behaviour_manager = reload.behaviour_manager
+        strategies = reload.strategies
+        bridge = reload.bridge
+        fill_engine = reload.fill_engine
+        order_builder.asset_specs = global_config.assets.assets
+        if fill_engine.intrabar is None and intrabar is not None:
+            fill_engine.intrabar = intrabar  # carried over a hot-reloaded fill engine
+        if reload.reset_watcher:
+            config_watcher.stop()
+            config_watcher = ConfigWatcher(
+                _collect_config_paths(profile_path, global_config),
+                poll_interval_s=global_config.environment.config_hot_reload_poll_interval_s,
+            ).start()
+
+    halted = False
+    bar_iter = iter(islice(market_states, max(int(max_bars) - bar_index, 0)) if max_bars else market_states)
+    meter.start_loop()
+    for state in bar_iter:
+        meter.lap("data")
+        if check_sequence:
+            price_validator.validate_bar_sequence(last_bar, state)
+        if log_bars:
+            logger.log(
+                bar_log_level,
+                "SIM bar | ts=%s | symbol=%s | close=%.4f",
+                state.timestamp.isoformat(),
+                state.symbol,
+                state.close,
+            )
+        if journal is not None:
+            journal.record("BAR", bar_index, state.timestamp, state.symbol, close=state.close)
+        if config_watcher is not None and config_watcher.pending:
+            _apply_pending_reload()
+        meter.lap("validation_reload")
 
         # Activate pending orders only for this bar (generated previous loop)
         if pending_orders_for_next_bar:
             for order in pending_orders_for_next_bar:
                 order.created_at = order.created_at or (last_bar.timestamp if last_bar else state.timestamp)
-                account_state.open_orders[order.id] = order
-            logger.debug("Activated pending orders: %s", [o.id for o in pending_orders_for_next_bar])
+                # A new SL/TP supersedes the one already resting for the symbol.
+                account_state.open_orders.add(order)
+            if debug_bars:
+                logger.debug("Activated pending orders: %s", [o.id for o in pending_orders_for_next_bar])
             pending_orders_for_next_bar.clear()
 
         # Fill existing open orders using current bar; requires at least one prior bar
@@ -327,7 +616,8 @@ async def _run_simulation() -> None:
                     logger.error("Fill timing violated: %s", exc)
                     continue
 
-            logger.debug("Applying fill: %s", fill)
+            if debug_bars:
+                logger.debug("Applying fill: %s", fill)
             try:
                 event = position_manager.apply_fill(fill, account_state)
             except ValueError as exc:
@@ -356,44 +646,84 @@ async def _run_simulation() -> None:
                 reason,
                 fill.fee,
             )
+            if journal is not None:
+                journal.record(
+                    "FILL",
+                    bar_index,
+                    fill.timestamp,
+                    fill.symbol,
+                    side=fill.side.value,
+                    qty=fill.qty,
+                    price=fill.price,
+                    reason=reason,
+                    fee=fill.fee,
+                )
 
         position_manager.update_unrealized_pnl(account_state, market_price=state.close)
+        meter.lap("fills")
 
         risk_decision = risk_manager.before_new_orders(account_state, state.timestamp)
-        logger.info(
-            "RISK | ts=%s | policy=%s | allow_new_orders=%s | hard_stop=%s | reason=%s",
-            state.timestamp.isoformat(),
-            risk_policy.name,
-            risk_decision.allow_new_orders,
-            risk_decision.hard_stop_trading,
-            risk_decision.reason,
-        )
-        logger.debug("RISK_META | %s", risk_decision.meta)
+        if log_bars:
+            logger.log(
+                bar_log_level,
+                "RISK | ts=%s | policy=%s | allow_new_orders=%s | hard_stop=%s | reason=%s",
+                state.timestamp.isoformat(),
+                risk_policy.name,
+                risk_decision.allow_new_orders,
+                risk_decision.hard_stop_trading,
+                risk_decision.reason,
+            )
+        if journal is not None:
+            journal.record(
+                "RISK",
+                bar_index,
+                state.timestamp,
+                state.symbol,
+                allow_new_orders=risk_decision.allow_new_orders,
+                hard_stop=risk_decision.hard_stop_trading,
+                reason=risk_decision.reason,
+            )
+        if debug_bars:
+            logger.debug("RISK_META | %s", risk_decision.meta)
         if risk_decision.hard_stop_trading:
             logger.info("RISK HARD STOP | trading halted by FTMO policy")
-            if run_logger is not None:
-                run_logger.finalize_and_persist(global_config.model_dump())
-            return
+            halted = True
+            break
+        meter.lap("risk")
 
         behaviour_decision = None
         if risk_decision.allow_new_orders and behaviour_manager is not None:
             behaviour_decision = behaviour_manager.before_new_orders(ts=state.timestamp, account_state=account_state)
             meta_short = behaviour_decision.meta if behaviour_decision.meta else {}
-            logger.info(
-                "BEHAVIOUR | ts=%s | allow_new_orders=%s | hard_block=%s | reason=%s | meta_short=%s",
-                state.timestamp.isoformat(),
-                behaviour_decision.allow_new_orders,
-                behaviour_decision.hard_block_trading,
-                behaviour_decision.reason,
-                meta_short,
-            )
+            if log_bars:
+                logger.log(
+                    bar_log_level,
+                    "BEHAVIOUR | ts=%s | allow_new_orders=%s | hard_block=%s | reason=%s | meta_short=%s",
+                    state.timestamp.isoformat(),
+                    behaviour_decision.allow_new_orders,
+                    behaviour_decision.hard_block_trading,
+                    behaviour_decision.reason,
+                    meta_short,
+                )
+            if journal is not None:
+                journal.record(
+                    "BEHAVIOUR",
+                    bar_index,
+                    state.timestamp,
+                    state.symbol,
+                    allow_new_orders=behaviour_decision.allow_new_orders,
+                    hard_block=behaviour_decision.hard_block_trading,
+                    reason=behaviour_decision.reason,
+                    meta=meta_short,
+                )
             if behaviour_decision.hard_block_trading:
                 logger.info("BEHAVIOUR HARD BLOCK | trading halted by guards")
-                if run_logger is not None:
-                    run_logger.finalize_and_persist(global_config.model_dump())
-                return
+                halted = True
+                break
+        meter.lap("behaviour")
         feature_bundle = feature_engine.update(state) if feature_engine is not None else None
-        if feature_bundle and logger.isEnabledFor(logging.DEBUG) and bar_index < 5:
+        meter.lap("features")
+        if feature_bundle and debug_bars and bar_index < 5:
             logger.debug(
                 "FEATURES | ts=%s | raw_keys=%s | model_len=%d",
                 state.timestamp.isoformat(),
@@ -402,31 +732,59 @@ async def _run_simulation() -> None:
             )
 
         if behaviour_decision is not None and not behaviour_decision.allow_new_orders:
-            decision = StrategyDecision(action="none", side=None, confidence=0.0)
+            decision = no_action_decision
             new_orders = []
         else:
             decision = bridge.on_bar(state, features=feature_bundle)
             meta_short = decision.meta.get("strategies", decision.meta)
-            logger.info(
-                "DECISION | ts=%s | action=%s | side=%s | conf=%.3f | meta_short=%s",
-                state.timestamp.isoformat(),
-                decision.action,
-                decision.side,
-                decision.confidence,
-                meta_short,
-            )
+            if log_bars:
+                logger.log(
+                    bar_log_level,
+                    "DECISION | ts=%s | action=%s | side=%s | conf=%.3f | meta_short=%s",
+                    state.timestamp.isoformat(),
+                    decision.action,
+                    decision.side,
+                    decision.confidence,
+                    meta_short,
+                )
+            if journal is not None:
+                journal.record(
+                    "DECISION",
+                    bar_index,
+                    state.timestamp,
+                    state.symbol,
+                    action=decision.action,
+                    side=decision.side,
+                    confidence=decision.confidence,
+                    meta=meta_short,
+                )
+        meter.lap("strategy")
         if rl_hook is not None:
+            if decision is no_action_decision:  # immutable; the hook annotates a copy
+                decision = StrategyDecision(action="none", side=None, confidence=0.0)
             try:
                 pos_state = account_state.positions.get(state.symbol)
                 actions = rl_hook.compute_actions(state, account_state, pos_state, feature_bundle)
                 rl_hook.apply_to_decision(decision, actions)
-                logger.info(
-                    "RL inference applied | risk_pct=%s | exit_action=%s",
-                    actions.get("risk_pct"),
-                    actions.get("exit_action"),
-                )
+                if log_bars:
+                    logger.log(
+                        bar_log_level,
+                        "RL inference applied | risk_pct=%s | exit_action=%s",
+                        actions.get("risk_pct"),
+                        actions.get("exit_action"),
+                    )
+                if journal is not None:
+                    journal.record(
+                        "RL",
+                        bar_index,
+                        state.timestamp,
+                        state.symbol,
+                        risk_pct=actions.get("risk_pct"),
+                        exit_action=actions.get("exit_action"),
+                    )
             except Exception as exc:  # pragma: no cover - defensive
                 logger.warning("RL inference failed: %s", exc)
+        meter.lap("rl")
         if exit_policy_applier is not None and decision.meta.get("exit_action") is not None:
             pos_state = account_state.positions.get(state.symbol)
             exit_policy_applier.apply(decision.meta.get("exit_action"), pos_state, state, decision, atr=None)
@@ -450,13 +808,26 @@ async def _run_simulation() -> None:
             decision.update["position_size"] = sizing_result.size
             decision.meta["effective_risk_pct"] = sizing_result.effective_risk_pct
             decision.meta["risk_capped_by"] = sizing_result.capped_by
-            logger.info(
-                "Position size computed | size=%.4f | eff_risk=%.3f%% | caps=%s",
-                sizing_result.size,
-                sizing_result.effective_risk_pct,
-                sizing_result.capped_by,
-            )
+            if log_bars:
+                logger.log(
+                    bar_log_level,
+                    "Position size computed | size=%.4f | eff_risk=%.3f%% | caps=%s",
+                    sizing_result.size,
+                    sizing_result.effective_risk_pct,
+                    sizing_result.capped_by,
+                )
+            if journal is not None:
+                journal.record(
+                    "SIZING",
+                    bar_index,
+                    state.timestamp,
+                    state.symbol,
+                    size=sizing_result.size,
+                    effective_risk_pct=sizing_result.effective_risk_pct,
+                    capped_by=sizing_result.capped_by,
+                )
 
+        meter.lap("sizing")
         new_orders: List[Order] = []
         if risk_decision.allow_new_orders:
             new_orders.extend(order_builder.build_entry_orders(decision, state, account_state))
@@ -467,19 +838,33 @@ async def _run_simulation() -> None:
                 demo_decision = StrategyDecision(action="entry", side="long", confidence=1.0)
                 new_orders.extend(order_builder.build_entry_orders(demo_decision, state, account_state))
                 demo_entry_sent = True
-        else:
+        elif debug_bars:
             logger.debug("Risk blocked new orders this bar.")
 
         if new_orders:
             pending_orders_for_next_bar.extend(new_orders)
-            logger.info(
-                "ORDERS_BUILT | count=%d | reduce_only_flags=%s",
-                len(new_orders),
-                [o.reduce_only for o in new_orders],
-            )
-            logger.debug("Built orders (pending for next bar): %s", new_orders)
-        else:
+            if log_bars:
+                logger.log(
+                    bar_log_level,
+                    "ORDERS_BUILT | count=%d | reduce_only_flags=%s",
+                    len(new_orders),
+                    [o.reduce_only for o in new_orders],
+                )
+            if journal is not None:
+                journal.record(
+                    "ORDERS",
+                    bar_index,
+                    state.timestamp,
+                    state.symbol,
+                    count=len(new_orders),
+                    order_ids=[o.id for o in new_orders],
+                    reduce_only=[o.reduce_only for o in new_orders],
+                )
+            if debug_bars:
+                logger.debug("Built orders (pending for next bar): %s", new_orders)
+        elif debug_bars:
             logger.debug("ORDERS_BUILT | count=0")
+        meter.lap("orders")
 
         position = account_state.positions.get(state.symbol)
         if position:
@@ -493,8 +878,9 @@ async def _run_simulation() -> None:
                     position.entry_price,
                     position.realized_pnl,
                 )
-            else:
-                logger.info(
+            elif log_bars:
+                logger.log(
+                    bar_log_level,
                     "POSITION | symbol=%s | qty=%.4f | entry=%.4f | realized=%.4f | unrealized=%.4f",
                     position.symbol,
                     position.qty,
@@ -502,6 +888,19 @@ async def _run_simulation() -> None:
                     position.realized_pnl,
                     position.unrealized_pnl,
                 )
+            if journal is not None:
+                journal.record(
+                    "POSITION",
+                    bar_index,
+                    state.timestamp,
+                    state.symbol,
+                    status="opened" if not had_position else "open",
+                    side=position.side.value,
+                    qty=position.qty,
+                    entry=position.entry_price,
+                    realized=position.realized_pnl,
+                    unrealized=position.unrealized_pnl,
+                )
         else:
             if had_position:
                 logger.info(
@@ -510,16 +909,156 @@ async def _run_simulation() -> None:
                     state.symbol,
                     account_state.realized_pnl,
                 )
-            else:
-                logger.info("POSITION | symbol=%s | no open position", state.symbol)
+                if journal is not None:
+                    journal.record(
+                        "POSITION",
+                        bar_index,
+                        state.timestamp,
+                        state.symbol,
+                        status="closed",
+                        realized=account_state.realized_pnl,
+                    )
+            elif log_bars:
+                logger.log(bar_log_level, "POSITION | symbol=%s | no open position", state.symbol)
         if run_logger is not None:
             run_logger.on_bar_equity_snapshot(state.timestamp, account_state, risk_meta=risk_decision.meta)
 
+        meter.lap("logging")
+        meter.bar_done()
+
         last_bar = state
         bar_index += 1
 
+        if fast_bars is not None and config_watcher is not None and config_watcher.pending:
+            # Apply a reload before planning the skip, so the reloaded strategies and guards decide it.
+            _apply_pending_reload()
+        if (
+            fast_bars is not None
+            and demo_entry_sent
+            and not account_state.positions
+            and not pending_orders_for_next_bar
+            and bar_index < fast_stop
+            and (config_watcher is None or not config_watcher.pending)
+        ):
+            next_active = next_active_index(
+                bars=fast_bars,
+                start=bar_index,
+                stop=fast_stop,
+                ts=state.timestamp,
+                strategies=strategies,
+                fill_engine=fill_engine,
+                open_orders=account_state.open_orders.values(),
+                risk_manager=risk_manager,
+                risk_decision=risk_decision,
+                behaviour_manager=behaviour_manager,
+                behaviour_decision=behaviour_decision,
+                account_state=account_state,
+            )
+            skipped = list(islice(bar_iter, next_active - bar_index)) if next_active > bar_index else []
+            if skipped:
+                if check_sequence:
+                    for skipped_state in skipped:
+                        price_validator.validate_bar_sequence(last_bar, skipped_state)
+                        last_bar = skipped_state
+                if feature_engine is not None:
+                    feature_engine.update_batch(skipped)
+                if run_logger is not None:
+                    # Flat and idle: equity is unchanged on every skipped bar.
+                    for skipped_state in skipped:
+                        run_logger.on_bar_equity_snapshot(
+                            skipped_state.timestamp, account_state, risk_meta=risk_decision.meta
+                        )
+                if journal is not None:
+                    journal.record("SKIP", bar_index, skipped[0].timestamp, state.symbol, bars=len(skipped))
+                if debug_bars:
+                    logger.debug("FAST_FORWARD | from_bar=%d | bars=%d", bar_index, len(skipped))
+                last_bar = skipped[-1]
+                bar_index += len(skipped)
+                skipped_total += len(skipped)
+                meter.lap("fast_forward")
+                meter.bar_done(len(skipped))
+
+        if checkpointer is not None and checkpointer.due(bar_index):
+            try:
+                checkpointer.write(bar_index, _snapshot())
+            except (pickle.PicklingError, TypeError, AttributeError) as exc:
+                logger.warning("CHECKPOINT_DISABLED | bar=%d | reason=%s", bar_index, exc)
+                checkpointer = None
+            meter.lap("checkpoint")
+
+    if isinstance(market_states, PrefetchingIterator):
+        market_states.close()
+    if config_watcher is not None:
+        config_watcher.stop()
+    if fast_bars is not None:
+        logger.info("FAST_FORWARD_SUMMARY | bars=%d | skipped=%d", bar_index, skipped_total)
+    if intrabar is not None:
+        logger.info(
+            "INTRABAR_SUMMARY | resolved_bars=%d | reordered_bars=%d",
+            intrabar.resolved_bars,
+            intrabar.reordered_bars,
+        )
+    throughput = meter.log()
     if run_logger is not None:
-        run_logger.finalize_and_persist(global_config.model_dump())
+        end_state = None
+        if continuation and not halted:
+            end_state = _snapshot()
+            end_state["data"] = {"rows": bar_index, "fingerprint": bar_arrays.fingerprint(bar_index)}
+        return _finalize_run(run_logger, global_config, throughput, checkpointer, bar_index, end_state)
+    return None
+
+
+def _finalize_run(
+    run_logger: RunLogger,
+    global_config,
+    throughput: Dict[str, Any],
+    checkpointer: Optional[CheckpointWriter],
+    bar_index: int,
+    end_state: Optional[Dict[str, Any]] = None,
+) -> Path:
+    """
+    Persist the run and drop its resume checkpoint.
+
+    `end_state` (completed runs with continuation enabled) becomes the run's end snapshot;
+    without it a stale end snapshot is removed, as the run output no longer matches it.
+    """
+    run_logger.finalize_and_persist(global_config.model_dump(), throughput=throughput)
+    end_path = snapshot_path(run_logger.run_dir, END_SNAPSHOT_NAME)
+    end_path.unlink(missing_ok=True)
+    if end_state is not None:
+        try:
+            size = write_snapshot(end_path, bar_index, end_state)
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            logger.warning("CONTINUATION_SNAPSHOT_FAILED | run_id=%s | reason=%s", run_logger.run_meta.run_id, exc)
+        else:
+            logger.info("CONTINUATION_SNAPSHOT | run_id=%s | bars=%d | bytes=%d", run_logger.run_meta.run_id, bar_index, size)
+    if checkpointer is not None:
+        checkpointer.clear()
+    return run_logger.run_dir
+
+
+def _config_hash(global_config, sim_mode_cfg: Dict[str, Any]) -> str:
+    """
+    Hash of everything that shapes the simulated results (checkpoint and data-loading knobs excluded).
+    """
+    mode_cfg = {k: v for k, v in sim_mode_cfg.items() if k not in {"checkpoint", "continuation", "data"}}
+    payload = global_config.model_dump_json() + json.dumps(mode_cfg, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _continuation_mismatch(snapshot: Dict[str, Any], bar_arrays, walked: int, config_hash: str) -> Optional[str]:
+    """
+    Why the end snapshot of a previous run cannot be continued over `bar_arrays` (None if it can).
+    """
+    data = snapshot.get("data") or {}
+    rows = int(data.get("rows", -1))
+    if snapshot.get("config_hash") != config_hash:
+        return "config_changed"
+    if rows < 0 or rows > walked:
+        return "fewer_bars"
+    if bar_arrays.fingerprint(rows) != data.get("fingerprint"):
+        return "history_changed"
+    return None
 
 
 def _sanity_check_exec_models() -> None:
@@ -545,115 +1084,113 @@ def _sanity_check_exec_models() -> None:
     )
 
 
-def maybe_reload_config(
+@dataclass
+class ConfigReload:
+    global_config: Any
+    sections: Set[str]
+    behaviour_manager: Optional[BehaviourManager]
+    strategies: List
+    bridge: StrategyBridge
+    fill_engine: SimFillEngine
+    # The set of config files changed (profile include or risk policy re-pointed).
+    reset_watcher: bool = False
+
+
+def apply_config_changes(
+    changed_paths: Set[Path],
     *,
-    bar_index: int,
-    profile_path: Optional[str],
     global_config,
-    current_behaviour_manager: Optional[BehaviourManager],
-    current_strategies: List,
-    current_execution_engine: SimFillEngine,
-    current_bridge: StrategyBridge,
+    behaviour_manager: Optional[BehaviourManager],
+    strategies: List,
+    fill_engine: SimFillEngine,
+    bridge: StrategyBridge,
     symbol: str,
-    tracked_paths: List[Path],
-    last_mtimes: Dict[Path, float],
     account_state: AccountState,
-) -> Tuple:
-    env_cfg = global_config.environment
-    if not env_cfg.config_hot_reload_enabled or env_cfg.mode not in {"sim", "train"}:
-        return (
-            global_config,
-            current_behaviour_manager,
-            current_strategies,
-            current_execution_engine,
-            last_mtimes,
-            tracked_paths,
-            current_bridge,
-            global_config.execution,
-            global_config.assets.assets,
-        )
+) -> ConfigReload:
+    """
+    Apply config files reported by the ConfigWatcher.
 
-    interval = max(env_cfg.config_hot_reload_interval_bars, 0)
-    if interval == 0 or bar_index % interval != 0:
-        return (
-            global_config,
-            current_behaviour_manager,
-            current_strategies,
-            current_execution_engine,
-            last_mtimes,
-            tracked_paths,
-            current_bridge,
-            global_config.execution,
-            global_config.assets.assets,
+    Only the sections whose file changed are re-parsed, and only components whose section
+    changed and is in `config_hot_reload_scope` are rebuilt; everything else is kept as is.
+    A file that fails to parse or validate is logged and the previous config stays in effect.
+    """
+    try:
+        return _apply_config_changes(
+            changed_paths,
+            global_config=global_config,
+            behaviour_manager=behaviour_manager,
+            strategies=strategies,
+            fill_engine=fill_engine,
+            bridge=bridge,
+            symbol=symbol,
+            account_state=account_state,
         )
-
-    if not tracked_paths:
-        tracked_paths = _collect_config_paths(profile_path, global_config)
-    new_mtimes = get_file_mtimes(tracked_paths)
-    changed_files = [str(p) for p in tracked_paths if new_mtimes.get(p) != last_mtimes.get(p)]
-    if not changed_files:
-        return (
-            global_config,
-            current_behaviour_manager,
-            current_strategies,
-            current_execution_engine,
-            new_mtimes,
-            tracked_paths,
-            current_bridge,
-            global_config.execution,
-            global_config.assets.assets,
+    except Exception as exc:
+        logger.error(
+            "CONFIG_HOT_RELOAD_FAILED | changed_files=%s | error=%s | keeping previous config",
+            sorted(map(str, changed_paths)),
+            exc,
+            exc_info=True,
+        )
+        return ConfigReload(
+            global_config=global_config,
+            sections=set(),
+            behaviour_manager=behaviour_manager,
+            strategies=strategies,
+            bridge=bridge,
+            fill_engine=fill_engine,
         )
 
-    logger.info("CONFIG_HOT_RELOAD_TRIGGERED | changed_files=%s", changed_files)
-
-    if profile_path:
-        new_global_config = load_global_config_from_profile(profile_path)
-    else:
-        new_global_config = load_all_configs_into_global()
 
-    scope = set(env_cfg.config_hot_reload_scope or [])
+def _apply_config_changes(
+    changed_paths: Set[Path],
+    *,
+    global_config,
+    behaviour_manager: Optional[BehaviourManager],
+    strategies: List,
+    fill_engine: SimFillEngine,
+    bridge: StrategyBridge,
+    symbol: str,
+    account_state: AccountState,
+) -> ConfigReload:
+    new_global_config, sections = reload_config_sections(global_config, changed_paths)
+    logger.info("CONFIG_HOT_RELOAD_TRIGGERED | changed_files=%s | sections=%s", sorted(map(str, changed_paths)), sorted(sections))
+    scope = set(global_config.environment.config_hot_reload_scope or []) & sections
 
-    new_behaviour_manager = current_behaviour_manager
+    new_behaviour_manager = behaviour_manager
     if "behaviour" in scope:
         behaviour_guards = create_guards(
             new_global_config.behaviour,
             initial_balance=float(account_state.balance),
         )
-        if behaviour_guards:
-            new_behaviour_manager = BehaviourManager(guards=behaviour_guards)
-        else:
-            new_behaviour_manager = None
+        new_behaviour_manager = BehaviourManager(guards=behaviour_guards) if behaviour_guards else None
 
-    new_strategies = current_strategies
+    new_strategies = strategies
+    new_bridge = bridge
     if "strategy" in scope:
         new_strategies = _instantiate_strategies(symbol, new_global_config.strategy.enabled_strategies)
+        new_bridge = StrategyBridge(new_strategies, asset_specs=new_global_config.assets.assets)
 
-    new_execution_engine = current_execution_engine
-    new_execution_cfg = new_global_config.execution
+    new_fill_engine = fill_engine
     if "execution" in scope:
-        new_execution_engine = _build_fill_engine(new_execution_cfg)
-
-    if new_global_config.risk.policy_path != global_config.risk.policy_path or (
-        new_global_config.risk.policy_type != global_config.risk.policy_type
-    ):
-        logger.info("CONFIG_HOT_RELOAD_RISK_CHANGE_IGNORED_IN_V1 | from=%s to=%s", global_config.risk.policy_path, new_global_config.risk.policy_path)
-
-    new_asset_specs = new_global_config.assets.assets
-    new_bridge = current_bridge
-    if new_strategies is not current_strategies:
-        new_bridge = StrategyBridge(new_strategies, asset_specs=new_asset_specs)
-
-    tracked_paths = _collect_config_paths(profile_path, new_global_config)
-    new_mtimes = get_file_mtimes(tracked_paths)
-
-    return (
-        new_global_config,
-        new_behaviour_manager,
-        new_strategies,
-        new_execution_engine,
-        new_mtimes,
-        tracked_paths,
-        new_bridge,
-        new_execution_cfg,
-        new_asset_specs,
+        new_fill_engine = _build_fill_engine(new_global_config.execution)
+
+    if "risk" in sections:
+        logger.info(
+            "CONFIG_HOT_RELOAD_RISK_CHANGE_IGNORED_IN_V1 | from=%s to=%s",
+            global_config.risk.policy_path,
+            new_global_config.risk.policy_path,
+        )
+
+    return ConfigReload(
+        global_config=new_global_config,
+        sections=sections,
+        behaviour_manager=new_behaviour_manager,
+        strategies=new_strategies,
+        bridge=new_bridge,
+        fill_engine=new_fill_engine,
+        reset_watcher=(
+            new_global_config.source_paths != global_config.source_paths
+            or new_global_config.risk.policy_path != global_config.risk.policy_path
+        ),
     )
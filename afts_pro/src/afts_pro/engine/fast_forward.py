@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from afts_pro.behaviour import BehaviourDecision, BehaviourManager
+from afts_pro.data.bar_store import BarArrays
+from afts_pro.exec import AccountState, Order
+from afts_pro.features.extras_alignment import bar_epoch_ns
+from afts_pro.risk import RiskDecision, RiskManager
+
+logger = logging.getLogger(__name__)
+
+
+def bar_index_at(timestamps: np.ndarray, ts: datetime, start: int, stop: int) -> int:
+    """
+    First index in [start, stop) whose bar timestamp is >= ts (stop if there is none).
+    """
+    offset = int(np.searchsorted(timestamps[start:stop], bar_epoch_ns(ts), side="left"))
+    return start + offset
+
+
+def next_active_index(
+    *,
+    bars: BarArrays,
+    start: int,
+    stop: int,
+    ts: datetime,
+    strategies: Sequence,
+    fill_engine,
+    open_orders: Iterable[Order],
+    risk_manager: RiskManager,
+    risk_decision: RiskDecision,
+    behaviour_manager: Optional[BehaviourManager],
+    behaviour_decision: Optional[BehaviourDecision],
+    account_state: AccountState,
+) -> int:
+    """
+    First bar in [start, stop) the SIM loop has to run in full, given the state after the bar
+    at `ts` (start - 1) and a flat account with nothing pending; stop if none has to.
+
+    Every component reports its own next event (see afts_pro.core.wakeup); components that
+    cannot tell are asked on every bar, which makes the result start.
+    """
+    candidates: List[int] = [stop]
+
+    if behaviour_decision is None or behaviour_decision.allow_new_orders:
+        # Strategies only run while the behaviour layer lets them.
+        for strategy in strategies:
+            hook = getattr(strategy, "next_event_index", None)
+            idx = hook(bars, start) if hook is not None else start
+            if idx is not None:
+                candidates.append(idx)
+
+    wakes = [risk_manager.next_wakeup(ts, risk_decision)]
+    if behaviour_manager is not None and risk_decision.allow_new_orders:
+        wakes.append(behaviour_manager.next_wakeup(ts, account_state))
+    for wake in wakes:
+        if wake is not None:
+            candidates.append(bar_index_at(bars.timestamp, wake, start, stop))
+
+    orders = list(open_orders)
+    if orders:
+        hook = getattr(fill_engine, "next_fill_index", None)
+        idx = hook(orders, bars, start) if hook is not None else start
+        if idx is not None:
+            candidates.append(idx)
+
+    return max(min(candidates), start)
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from afts_pro.config import load_global_config_from_profile
+from afts_pro.core import Mode
+from afts_pro.engine import engine
+from afts_pro.runlogger.metrics import EquityStats, build_metrics_snapshot
+from afts_pro.runlogger.models import TradeRecord
+from afts_pro.utils.logging import setup_logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SymbolRun:
+    symbol: str
+    run_dir: Optional[str]
+    elapsed_s: float
+    error: Optional[str] = None
+
+
+@dataclass
+class PortfolioResult:
+    portfolio_dir: Path
+    runs: List[SymbolRun]
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    elapsed_s: float = 0.0
+
+
+def run_symbol(profile_path: str, symbol: str, log_level: str = "WARNING") -> SymbolRun:
+    """
+    Worker entrypoint: one SIM run of `profile_path` over `symbol` in this process.
+
+    Each run gets its own RunLogger directory (the run id carries the symbol).
+    """
+    setup_logging(level=log_level)
+    started = time.perf_counter()
+    try:
+        run_dir = asyncio.run(engine.start(Mode.SIM, profile_path=profile_path, symbol=symbol))
+    except Exception as exc:  # reported in the portfolio summary; the other symbols keep running
+        logger.exception("PORTFOLIO_SYMBOL_FAILED | symbol=%s", symbol)
+        return SymbolRun(symbol=symbol, run_dir=None, elapsed_s=time.perf_counter() - started, error=f"{type(exc).__name__}: {exc}")
+    return SymbolRun(symbol=symbol, run_dir=str(run_dir) if run_dir else None, elapsed_s=time.perf_counter() - started)
+
+
+def run_portfolio(
+    profile_path: str,
+    symbols: Sequence[str],
+    max_workers: Optional[int] = None,
+    log_level: str = "WARNING",
+) -> PortfolioResult:
+    """
+    Simulate `profile_path` over each symbol in a process pool and merge the runs.
+
+    Workers are spawned (not forked) so no engine, pyarrow or logging state leaks between
+    them; at most `max_workers` (default: CPU count) symbols run at once.
+
+    Each symbol trades its own account with the profile's full initial balance; the portfolio
+    equity is the sum of these independent accounts. There is no shared margin or cross-symbol
+    risk limit, so it is not the equity of one account trading all symbols.
+    """
+    started = time.perf_counter()
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(symbols)))
+    logger.info("PORTFOLIO_START | profile=%s | symbols=%s | workers=%d", profile_path, list(symbols), workers)
+    runs: Dict[str, SymbolRun] = {}
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {pool.submit(run_symbol, profile_path, symbol, log_level): symbol for symbol in symbols}
+        for future in as_completed(futures):
+            run = future.result()
+            runs[run.symbol] = run
+            logger.info(
+                "PORTFOLIO_SYMBOL_DONE | symbol=%s | elapsed_s=%.2f | run_dir=%s | error=%s",
+                run.symbol,
+                run.elapsed_s,
+                run.run_dir,
+                run.error,
+            )
+    ordered = [runs[symbol] for symbol in symbols]
+
+    run_cfg = load_global_config_from_profile(profile_path).runlogger
+    base_dir = Path(run_cfg.base_dir)
+    if not base_dir.is_absolute():
+        base_dir = engine.PROJECT_ROOT / base_dir
+    portfolio_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S") + f"_portfolio_{Path(profile_path).stem}"
+    portfolio_dir = base_dir / portfolio_id
+    elapsed = time.perf_counter() - started
+    metrics = merge_runs(
+        ordered,
+        portfolio_dir,
+        run_cfg.filename_patterns,
+        additional={
+            "wall_time_s": elapsed,
+            "sum_symbol_time_s": sum(run.elapsed_s for run in ordered),
+            "max_symbol_time_s": max((run.elapsed_s for run in ordered), default=0.0),
+            "workers": workers,
+        },
+    )
+    logger.info(
+        "PORTFOLIO_DONE | dir=%s | symbols=%d | failed=%d | wall_time_s=%.2f | slowest_symbol_s=%.2f",
+        portfolio_dir,
+        len(ordered),
+        sum(1 for run in ordered if run.error),
+        elapsed,
+        metrics["additional"]["max_symbol_time_s"],
+    )
+    return PortfolioResult(portfolio_dir=portfolio_dir, runs=ordered, metrics=metrics, elapsed_s=elapsed)
+
+
+def merge_runs(
+    runs: Sequence[SymbolRun],
+    portfolio_dir: Path,
+    filename_patterns: Dict[str, str],
+    additional: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Merge per-symbol run directories into a portfolio directory and return its metrics.
+
+    The portfolio equity is the sum of the independent symbol equities, each carried forward
+    between its own bars (and back to its first value before them); trades are concatenated
+    with their run id. Metrics use the RunLogger definitions over the merged curve and trades;
+    `additional` entries are added to metrics["additional"] before metrics.json is written.
+    """
+    portfolio_dir.mkdir(parents=True, exist_ok=True)
+    equity_name = filename_patterns.get("equity_curve", "equity_curve.parquet")
+    trades_name = filename_patterns.get("trades", "trades.parquet")
+    metrics_name = filename_patterns.get("metrics", "metrics.json")
+
+    curves: Dict[str, pd.Series] = {}
+    trade_frames: List[pd.DataFrame] = []
+    per_symbol: Dict[str, Dict[str, Any]] = {}
+    for run in runs:
+        entry: Dict[str, Any] = asdict(run)
+        if run.run_dir is not None:
+            run_dir = Path(run.run_dir)
+            if (run_dir / equity_name).exists():
+                curve = pd.read_parquet(run_dir / equity_name, columns=["timestamp", "equity"])
+                curves[run.symbol] = curve.drop_duplicates("timestamp", keep="last").set_index("timestamp")["equity"]
+            if (run_dir / trades_name).exists():
+                trades = pd.read_parquet(run_dir / trades_name)
+                trades["run_id"] = run_dir.name
+                trade_frames.append(trades)
+            if (run_dir / metrics_name).exists():
+                entry["metrics"] = json.loads((run_dir / metrics_name).read_text())
+        per_symbol[run.symbol] = entry
+
+    equity = pd.DataFrame(curves).sort_index().ffill().bfill() if curves else pd.DataFrame()
+    stats = EquityStats()
+    if not equity.empty:
+        equity["portfolio"] = equity.sum(axis=1)
+        for value in equity["portfolio"].to_numpy():
+            stats.update(float(value))
+        equity.rename_axis("timestamp").reset_index().to_parquet(portfolio_dir / equity_name, index=False)
+
+    trade_records: List[TradeRecord] = []
+    if trade_frames:
+        merged_trades = pd.concat(trade_frames, ignore_index=True).sort_values("exit_timestamp", kind="stable")
+        merged_trades.to_parquet(portfolio_dir / trades_name, index=False)
+        trade_records = [
+            TradeRecord(**{**row, "tags": json.loads(row["tags"]) if isinstance(row.get("tags"), str) else {}})
+            for row in merged_trades.drop(columns=["run_id"]).to_dict("records")
+        ]
+
+    metrics = build_metrics_snapshot(trade_records, [], equity_stats=stats).model_dump()
+    if not equity.empty:
+        metrics["additional"].update(
+            {
+                "initial_equity": float(equity["portfolio"].iloc[0]),
+                "final_equity": float(equity["portfolio"].iloc[-1]),
+                "net_pnl": float(equity["portfolio"].iloc[-1] - equity["portfolio"].iloc[0]),
+            }
+        )
+    metrics["additional"]["symbols"] = per_symbol
+    metrics["additional"].update(additional or {})
+    _write_json(portfolio_dir / metrics_name, metrics)
+    return metrics
+
+
+def _write_json(path: Path, payload: Dict[str, Any]) -> None:
+    with path.open("w", encoding="utf-8") as fh:
+        json.dump(payload, fh, indent=2, default=str)
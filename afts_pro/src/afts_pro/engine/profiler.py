@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAX_DEPTH = 128
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler for one thread (by default the one that creates it).
+
+    A daemon thread wakes every `interval_s`, reads the target's current frame via
+    sys._current_frames() and counts the collapsed call stack. Nothing is hooked into the
+    profiled code, so overhead is bounded by the sampling rate. write() dumps the counts in
+    the folded-stack format understood by flamegraph.pl / speedscope.
+    """
+
+    def __init__(self, interval_s: float = 0.005, thread_id: Optional[int] = None) -> None:
+        self.interval_s = max(float(interval_s), 0.0005)
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_at: Optional[float] = None
+        self._elapsed = 0.0
+        self.output_path: Optional[Path] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> "SamplingProfiler":
+        if self._thread is not None:
+            return self
+        self._stop.clear()
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="afts-sampling-profiler", daemon=True)
+        self._thread.start()
+        logger.info("PROFILER_START | interval_ms=%.2f", self.interval_s * 1000)
+        return self
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._elapsed += time.perf_counter() - (self._started_at or time.perf_counter())
+        logger.info("PROFILER_STOP | samples=%d | elapsed_s=%.3f", self.samples, self._elapsed)
+
+    def __enter__(self) -> "SamplingProfiler":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            self.stacks[_collapse(frame)] += 1
+            self.samples += 1
+
+    def top_functions(self, limit: int = 15) -> List[Tuple[str, int, int]]:
+        """
+        (function, self samples, inclusive samples) of the hottest functions by self samples.
+        """
+        self_counts: Counter = Counter()
+        inclusive: Counter = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")
+            self_counts[frames[-1]] += count
+            for name in set(frames):
+                inclusive[name] += count
+        ranked = sorted(self_counts.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [(name, count, inclusive[name]) for name, count in ranked]
+
+    def write(self, out_dir: Path, filename: str = "profile.folded") -> Path:
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        path = out_dir / filename
+        with path.open("w", encoding="utf-8") as fh:
+            for stack, count in sorted(self.stacks.items(), key=lambda item: -item[1]):
+                fh.write(f"{stack} {count}\n")
+        total = max(self.samples, 1)
+        for name, self_count, inclusive in self.top_functions():
+            logger.info(
+                "PROFILE_TOP | func=%s | self_pct=%.1f | inclusive_pct=%.1f",
+                name,
+                100.0 * self_count / total,
+                100.0 * inclusive / total,
+            )
+        logger.info("PROFILE_WRITTEN | path=%s | samples=%d | stacks=%d", path, self.samples, len(self.stacks))
+        self.output_path = path
+        return path
+
+
+def _collapse(frame: Optional[FrameType]) -> str:
+    names: List[str] = []
+    while frame is not None and len(names) < MAX_DEPTH:
+        code = frame.f_code
+        names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    names.reverse()
+    return ";".join(names)
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import logging
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+try:  # pragma: no cover - unavailable on Windows
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Log-spaced histogram edges from 100 ns to 10 s, 20 buckets per decade (~12% bucket width).
+HISTOGRAM_EDGES_S = np.geomspace(1e-7, 10.0, 8 * 20 + 1)
+PERCENTILES = (50, 95, 99)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Peak resident set size of this process in MiB (None where getrusage is unavailable).
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return peak / divisor
+
+
+class ThroughputMeter:
+    """
+    Wall-clock accounting for a simulation run.
+
+    lap(stage) charges the time since the previous checkpoint to `stage`, so calling it after
+    each section of the bar loop splits the loop time without nested timers. The first lap of
+    an iteration (conventionally "data") absorbs the time spent fetching the bar.
+
+    Per-bar lap durations are buffered in plain lists and folded into fixed log-spaced
+    histograms every `flush_every` bars, so percentiles cost O(1) memory per stage.
+    """
+
+    def __init__(self, flush_every: int = 4096) -> None:
+        self._started = time.perf_counter()
+        self._last = self._started
+        self._loop_started: Optional[float] = None
+        self.stages: Dict[str, float] = defaultdict(float)
+        self.bars = 0
+        self._flush_every = max(int(flush_every), 1)
+        self._samples: Dict[str, List[float]] = defaultdict(list)
+        self._histograms: Dict[str, np.ndarray] = {}
+        self._max: Dict[str, float] = defaultdict(float)
+
+    def start_loop(self) -> None:
+        now = time.perf_counter()
+        # Setup is a one-off, so it is kept out of the per-bar histograms.
+        self.stages["setup"] += now - self._last
+        self._loop_started = self._last = now
+
+    def lap(self, stage: str) -> None:
+        now = time.perf_counter()
+        elapsed = now - self._last
+        self.stages[stage] += elapsed
+        self._samples[stage].append(elapsed)
+        self._last = now
+
+    def bar_done(self, count: int = 1) -> None:
+        before = self.bars
+        self.bars += count
+        if self.bars // self._flush_every != before // self._flush_every:
+            self._flush_samples()
+
+    def _flush_samples(self) -> None:
+        for stage, samples in self._samples.items():
+            if not samples:
+                continue
+            values = np.asarray(samples, dtype=np.float64)
+            idx = np.searchsorted(HISTOGRAM_EDGES_S, values, side="right")
+            counts = np.bincount(idx, minlength=HISTOGRAM_EDGES_S.shape[0] + 1)
+            hist = self._histograms.get(stage)
+            self._histograms[stage] = counts if hist is None else hist + counts
+            self._max[stage] = max(self._max[stage], float(values.max()))
+            samples.clear()
+
+    def stage_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-stage lap count, mean, p50/p95/p99 and max in microseconds.
+
+        Percentiles are the upper edge of the histogram bucket holding the rank (capped at the
+        observed max), i.e. accurate to one bucket width.
+        """
+        self._flush_samples()
+        stats: Dict[str, Dict[str, Any]] = {}
+        for stage, hist in sorted(self._histograms.items()):
+            count = int(hist.sum())
+            cumulative = np.cumsum(hist)
+            entry: Dict[str, Any] = {
+                "count": count,
+                "total_s": self.stages[stage],
+                "mean_us": self.stages[stage] / count * 1e6 if count else None,
+            }
+            upper_edges = np.append(HISTOGRAM_EDGES_S, np.inf)
+            for pct in PERCENTILES:
+                bucket = int(np.searchsorted(cumulative, count * pct / 100.0, side="left"))
+                entry[f"p{pct}_us"] = min(float(upper_edges[bucket]), self._max[stage]) * 1e6
+            entry["max_us"] = self._max[stage] * 1e6
+            stats[stage] = entry
+        return stats
+
+    def histograms(self) -> Dict[str, Any]:
+        """
+        Raw bucket counts (sparse, bucket index -> count) with the shared bucket edges.
+        """
+        self._flush_samples()
+        return {
+            "edges_s": HISTOGRAM_EDGES_S.tolist(),
+            "counts": {
+                stage: {str(i): int(c) for i, c in enumerate(hist) if c}
+                for stage, hist in sorted(self._histograms.items())
+            },
+        }
+
+    def report(self) -> Dict[str, Any]:
+        now = time.perf_counter()
+        loop_s = now - self._loop_started if self._loop_started is not None else 0.0
+        return {
+            "bars": self.bars,
+            "wall_s": now - self._started,
+            "loop_s": loop_s,
+            "bars_per_sec": self.bars / loop_s if loop_s > 0 else None,
+            "stages_s": dict(self.stages),
+            "stage_stats": self.stage_stats(),
+            "stage_histograms": self.histograms(),
+            "peak_rss_mb": peak_rss_mb(),
+        }
+
+    def log(self, report: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        report = report or self.report()
+        logger.info(
+            "THROUGHPUT | bars=%d | wall_s=%.3f | loop_s=%.3f | bars_per_sec=%s | peak_rss_mb=%s | stages=%s",
+            report["bars"],
+            report["wall_s"],
+            report["loop_s"],
+            f"{report['bars_per_sec']:.1f}" if report["bars_per_sec"] else "n/a",
+            f"{report['peak_rss_mb']:.1f}" if report["peak_rss_mb"] is not None else "n/a",
+            {name: round(seconds, 4) for name, seconds in sorted(report["stages_s"].items())},
+        )
+        for stage, stats in report.get("stage_stats", {}).items():
+            logger.info(
+                "STAGE_TIMING | stage=%s | count=%d | mean_us=%.1f | p50_us=%.1f | p95_us=%.1f | p99_us=%.1f | max_us=%.1f",
+                stage,
+                stats["count"],
+                stats["mean_us"] or 0.0,
+                stats["p50_us"],
+                stats["p95_us"],
+                stats["p99_us"],
+                stats["max_us"],
+            )
+        return report
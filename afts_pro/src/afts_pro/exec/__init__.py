@@ -2,18 +2,14 @@
 Execution layer models.
 """
 
-from .order_models import Order, OrderSide, OrderStatus, OrderType, TimeInForce
-from .fill_models import Fill
-from .position_models import AccountState, Position, PositionSide
-from .order_builder import OrderBuilder
-from .position_manager import PositionManager, PositionEvent
-from .execution_sim import SimFillEngine
+from afts_pro.utils.lazy import lazy_exports
 
 __all__ = [
     "Order",
     "OrderSide",
     "OrderStatus",
     "OrderType",
+    "RestingOrderBook",
     "TimeInForce",
     "Fill",
     "AccountState",
@@ -24,3 +20,24 @@ __all__ = [
     "PositionManager",
     "SimFillEngine",
 ]
+
+# Submodules are imported on first attribute access (PEP 562).
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Order": ".order_models",
+        "OrderSide": ".order_models",
+        "OrderStatus": ".order_models",
+        "OrderType": ".order_models",
+        "TimeInForce": ".order_models",
+        "RestingOrderBook": ".order_book",
+        "Fill": ".fill_models",
+        "AccountState": ".position_models",
+        "Position": ".position_models",
+        "PositionSide": ".position_models",
+        "OrderBuilder": ".order_builder",
+        "PositionManager": ".position_manager",
+        "PositionEvent": ".position_manager",
+        "SimFillEngine": ".execution_sim",
+    },
+)
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 
 from afts_pro.core import MarketState
+from afts_pro.core.wakeup import first_true
 from afts_pro.exec.fill_models import Fill
+from afts_pro.exec.intrabar import IntrabarResolver, touches
+from afts_pro.exec.order_book import RestingOrderBook
 from afts_pro.exec.order_models import Order, OrderSide, OrderStatus, OrderType
 from afts_pro.exec.position_models import AccountState, PositionSide
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from afts_pro.data.bar_store import BarArrays
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +36,8 @@ class SimFillEngine:
         self.slippage_ticks = slippage_ticks
         self.tick_size = tick_size
         self.slippage_pct = slippage_pct
+        # Optional finer-timeframe path used to order fills inside ambiguous bars.
+        self.intrabar: Optional[IntrabarResolver] = None
 
     def process_bar(
         self,
@@ -43,14 +51,83 @@ class SimFillEngine:
         if not open_orders:
             return fills
 
-        for order_id, order in list(open_orders.items()):
+        if isinstance(open_orders, RestingOrderBook):
+            candidates = open_orders.triggered(market_state.low, market_state.high)
+        else:
+            candidates = list(open_orders.values())
+        if self.intrabar is not None:
+            candidates = [o for o in candidates if touches(o, market_state.low, market_state.high)]
+            if IntrabarResolver.is_ambiguous(candidates):
+                candidates = self.intrabar.order(candidates, market_state)
+        # Positions are only updated after the bar, so protective fills are tracked here: once
+        # they have closed a symbol's position, later SL/TP/reduce-only orders of this bar skip.
+        reduced: Dict[str, float] = {}
+        for order in candidates:
+            if order.id not in open_orders:
+                continue  # cancelled by an OCO sibling earlier in this bar
+            protective = order.reduce_only or order.is_sl or order.is_tp
+            position = account_state.positions.get(order.symbol) if protective else None
+            remaining = position.qty - reduced.get(order.symbol, 0.0) if position is not None else 0.0
+            if position is not None and remaining <= 0:
+                continue
             fill = self._try_fill_order(order, market_state, last_bar, account_state)
             if fill:
+                if position is not None:
+                    if fill.qty > remaining:
+                        fill = self._build_fill(order, market_state, remaining, fill.price)
+                    reduced[order.symbol] = reduced.get(order.symbol, 0.0) + fill.qty
                 fills.append(fill)
                 order.status = OrderStatus.FILLED
-                open_orders.pop(order_id, None)
+                open_orders.pop(order.id, None)
+                self._cancel_oco_siblings(order, open_orders)
         return fills
 
+    @staticmethod
+    def _cancel_oco_siblings(order: Order, open_orders: Dict[str, Order]) -> None:
+        if not order.oco_group:
+            return
+        if isinstance(open_orders, RestingOrderBook):
+            cancelled = open_orders.cancel_oco(order)
+        else:
+            cancelled = [o for o in list(open_orders.values()) if o.oco_group == order.oco_group]
+            for other in cancelled:
+                open_orders.pop(other.id, None)
+                other.status = OrderStatus.CANCELED
+        if cancelled:
+            logger.debug("OCO_CANCELLED | filled=%s | cancelled=%s", order.id, [o.id for o in cancelled])
+
+    def next_fill_index(self, orders: Iterable[Order], bars: "BarArrays", start: int) -> Optional[int]:
+        """
+        First bar index >= start on which any of `orders` would fill, assuming the account
+        stays flat until then (reduce-only orders cannot fill); None if none does.
+        """
+        first: Optional[int] = None
+        for order in orders:
+            if order.reduce_only:
+                continue
+            if order.type == OrderType.MARKET:
+                return start if start < len(bars) else None
+            if order.type == OrderType.LIMIT:
+                price = order.price or 0
+                hit = first_true(
+                    lambda lo, hi: (bars.low[lo:hi] <= price) & (price <= bars.high[lo:hi]),
+                    start,
+                    len(bars) if first is None else first,
+                )
+            elif order.type == OrderType.STOP_MARKET and order.stop_price is not None:
+                stop = order.stop_price
+                column = bars.high if order.side == OrderSide.BUY else bars.low
+                if order.side == OrderSide.BUY:
+                    predicate = lambda lo, hi: column[lo:hi] >= stop  # noqa: E731
+                else:
+                    predicate = lambda lo, hi: column[lo:hi] <= stop  # noqa: E731
+                hit = first_true(predicate, start, len(bars) if first is None else first)
+            else:
+                continue
+            if hit is not None:
+                first = hit
+        return first
+
     def _try_fill_order(
         self,
         order: Order,
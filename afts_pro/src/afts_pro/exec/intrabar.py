@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from afts_pro.core import MarketState
+from afts_pro.exec.order_models import Order, OrderSide, OrderType
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from afts_pro.data.bar_store import BarArrays
+
+logger = logging.getLogger(__name__)
+
+
+def touches(order: Order, low, high):
+    """
+    Whether a bar (or array of bars) with this low/high reaches the order's trigger.
+
+    Works elementwise on numpy arrays; MARKET orders always trigger, STOP_LIMIT never does.
+    """
+    if order.type == OrderType.MARKET:
+        return np.ones_like(low, dtype=bool) if isinstance(low, np.ndarray) else True
+    if order.type == OrderType.LIMIT:
+        price = order.price or 0
+        return (low <= price) & (price <= high)
+    if order.type == OrderType.STOP_MARKET and order.stop_price is not None:
+        return high >= order.stop_price if order.side == OrderSide.BUY else low <= order.stop_price
+    return np.zeros_like(low, dtype=bool) if isinstance(low, np.ndarray) else False
+
+
+class IntrabarResolver:
+    """
+    Orders the fills of one coarse bar using a finer series of the same instrument.
+
+    A coarse bar only says that its high and low were reached, not in which order. When more
+    than one resting (non-market) order triggers inside a bar, order() looks at the fine bars
+    covering [bar.timestamp, bar.timestamp + bar_ns) and sorts the orders by the first fine bar
+    that reaches each trigger; ties and triggers the fine series never reaches keep their
+    resting order. `fine` is normally memory-mapped from the bar store, so the sub-bars of
+    unambiguous bars are never read.
+    """
+
+    def __init__(self, fine: "BarArrays", bar_ns: int) -> None:
+        self.fine = fine
+        self.bar_ns = int(bar_ns)
+        self.resolved_bars = 0
+        self.reordered_bars = 0
+
+    @staticmethod
+    def is_ambiguous(orders: Sequence[Order]) -> bool:
+        return sum(1 for order in orders if order.type != OrderType.MARKET) > 1
+
+    def order(self, orders: List[Order], bar: MarketState) -> List[Order]:
+        start_ns = pd.Timestamp(bar.timestamp).value
+        timestamps = self.fine.timestamp
+        lo = int(np.searchsorted(timestamps, start_ns, side="left"))
+        hi = int(np.searchsorted(timestamps, start_ns + self.bar_ns, side="left"))
+        self.resolved_bars += 1
+        if hi <= lo:
+            logger.debug("INTRABAR_NO_SUBBARS | ts=%s", bar.timestamp.isoformat())
+            return orders
+        low = np.asarray(self.fine.low[lo:hi])
+        high = np.asarray(self.fine.high[lo:hi])
+        never = hi - lo
+        first_hits = []
+        for order in orders:
+            hits = np.flatnonzero(touches(order, low, high))
+            first_hits.append(int(hits[0]) if hits.shape[0] else never)
+        ranked = [order for _, _, order in sorted(zip(first_hits, range(len(orders)), orders), key=lambda item: item[:2])]
+        if ranked != orders:
+            self.reordered_bars += 1
+            logger.debug(
+                "INTRABAR_REORDERED | ts=%s | order=%s | sub_bars=%d",
+                bar.timestamp.isoformat(),
+                [o.id for o in ranked],
+                hi - lo,
+            )
+        return ranked
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from itertools import count
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from afts_pro.exec.order_models import Order, OrderSide, OrderStatus, OrderType
+
+logger = logging.getLogger(__name__)
+
+_Entry = Tuple[float, int, str]  # (trigger price, insertion seq, order id)
+_INF = float("inf")
+
+
+class RestingOrderBook(Dict[str, Order]):
+    """
+    Open orders keyed by id, indexed by type and side on their trigger price.
+
+    It is a regular dict for every reader, but each insert/remove also maintains sorted
+    (price, seq, id) lists so triggered() can hand SimFillEngine just the orders a bar can
+    touch: market orders, limits priced inside [low, high], buy stops at or below the high and
+    sell stops at or above the low. Prices are indexed on insert; re-insert an order to
+    reprice it. Orders sharing `oco_group` are cancelled together by cancel_oco().
+    """
+
+    def __init__(self, orders: Iterable[Order] = ()) -> None:
+        super().__init__()
+        self._seq = count()
+        self._entries: Dict[str, Tuple[Optional[Tuple[OrderType, OrderSide]], _Entry, Optional[str]]] = {}
+        self._market: Dict[str, int] = {}
+        self._sorted: Dict[Tuple[OrderType, OrderSide], List[_Entry]] = defaultdict(list)
+        self._groups: Dict[str, Set[str]] = defaultdict(set)
+        for order in orders:
+            self[order.id] = order
+
+    def __reduce__(self):
+        return self.__class__, (list(self.values()),)
+
+    # -- dict mutators -------------------------------------------------------------------
+
+    def __setitem__(self, order_id: str, order: Order) -> None:
+        if order_id in self:
+            self._unindex(order_id)
+        super().__setitem__(order_id, order)
+        self._index(order_id, order)
+
+    def __delitem__(self, order_id: str) -> None:
+        super().__delitem__(order_id)
+        self._unindex(order_id)
+
+    def pop(self, order_id: str, *default):
+        if order_id in self:
+            self._unindex(order_id)
+        return super().pop(order_id, *default)
+
+    def popitem(self) -> Tuple[str, Order]:
+        order_id, order = super().popitem()
+        self._unindex(order_id)
+        return order_id, order
+
+    def clear(self) -> None:
+        super().clear()
+        self._entries.clear()
+        self._market.clear()
+        self._sorted.clear()
+        self._groups.clear()
+
+    def update(self, *args, **kwargs) -> None:
+        for order_id, order in dict(*args, **kwargs).items():
+            self[order_id] = order
+
+    def setdefault(self, order_id: str, default: Order) -> Order:
+        if order_id not in self:
+            self[order_id] = default
+        return self[order_id]
+
+    # -- order book API ------------------------------------------------------------------
+
+    def add(self, order: Order) -> List[Order]:
+        """
+        Rest `order`; a new SL (TP) replaces the resting SL (TP) orders of its symbol.
+
+        A replacement without an OCO group takes over the replaced order's group, so it stays
+        linked to the resting counterpart. Returns the replaced orders, marked CANCELED.
+        """
+        replaced: List[Order] = []
+        if order.is_sl or order.is_tp:
+            replaced = [
+                other
+                for other in self.values()
+                if other.symbol == order.symbol
+                and other.id != order.id
+                and ((order.is_sl and other.is_sl) or (order.is_tp and other.is_tp))
+            ]
+            for other in replaced:
+                self.pop(other.id)
+                other.status = OrderStatus.CANCELED
+            if order.oco_group is None:
+                order.oco_group = next((other.oco_group for other in replaced if other.oco_group), None)
+        self[order.id] = order
+        if replaced:
+            logger.debug("ORDER_REPLACED | new=%s | replaced=%s", order.id, [o.id for o in replaced])
+        return replaced
+
+    def cancel_oco(self, order: Order) -> List[Order]:
+        """
+        Cancel the resting orders that share `order`'s OCO group (order itself excluded).
+        """
+        if not order.oco_group:
+            return []
+        cancelled = [self[oid] for oid in list(self._groups.get(order.oco_group, ())) if oid != order.id]
+        for other in cancelled:
+            self.pop(other.id)
+            other.status = OrderStatus.CANCELED
+        return cancelled
+
+    def triggered(self, low: float, high: float) -> List[Order]:
+        """
+        Orders whose trigger a bar with this low/high reaches, in insertion order.
+        """
+        hits: List[Tuple[int, str]] = [(seq, oid) for oid, seq in self._market.items()]
+        for (order_type, side), entries in self._sorted.items():
+            if not entries:
+                continue
+            if order_type == OrderType.LIMIT:
+                window = entries[bisect_left(entries, (low,)) : bisect_right(entries, (high, _INF))]
+            elif side == OrderSide.BUY:
+                window = entries[: bisect_right(entries, (high, _INF))]
+            else:
+                window = entries[bisect_left(entries, (low,)) :]
+            hits.extend((seq, oid) for _, seq, oid in window)
+        hits.sort()
+        return [self[oid] for _, oid in hits]
+
+    # -- index maintenance ---------------------------------------------------------------
+
+    def _index(self, order_id: str, order: Order) -> None:
+        seq = next(self._seq)
+        key: Optional[Tuple[OrderType, OrderSide]] = None
+        entry: _Entry = (0.0, seq, order_id)
+        if order.type == OrderType.MARKET:
+            self._market[order_id] = seq
+        elif order.type == OrderType.LIMIT:
+            key = (OrderType.LIMIT, OrderSide.BUY)  # limits trigger the same way on both sides
+            entry = (float(order.price or 0), seq, order_id)
+        elif order.type == OrderType.STOP_MARKET and order.stop_price is not None:
+            key = (OrderType.STOP_MARKET, order.side)
+            entry = (float(order.stop_price), seq, order_id)
+        # Anything else (STOP_LIMIT, stops without a price) can never fill in the simulator.
+        if key is not None:
+            insort(self._sorted[key], entry)
+        self._entries[order_id] = (key, entry, order.oco_group)
+        if order.oco_group:
+            self._groups[order.oco_group].add(order_id)
+
+    def _unindex(self, order_id: str) -> None:
+        key, entry, group = self._entries.pop(order_id)
+        self._market.pop(order_id, None)
+        if key is not None:
+            entries = self._sorted[key]
+            del entries[bisect_left(entries, entry)]
+        if group is not None:
+            members = self._groups[group]
+            members.discard(order_id)
+            if not members:
+                del self._groups[group]
@@ -126,6 +126,13 @@ class OrderBuilder:
                 )
             )
 
+        protective = [o for o in orders if o.is_sl or o.is_tp]
+        if any(o.is_sl for o in protective) and any(o.is_tp for o in protective):
+            # SL and TP bracket the same position: whichever fills first cancels the other.
+            group = f"oco-{uuid.uuid4()}"
+            for order in protective:
+                order.oco_group = group
+
         if orders:
             logger.debug("Manage orders built: %s", orders)
         return orders
@@ -44,6 +44,8 @@ class Order(BaseModel):
     reduce_only: bool = Field(default=False)
     is_sl: bool = Field(default=False)
     is_tp: bool = Field(default=False)
+    # Orders sharing a group are one-cancels-other: the first fill cancels the rest.
+    oco_group: Optional[str] = Field(default=None)
     time_in_force: TimeInForce = Field(default=TimeInForce.GTC)
     status: OrderStatus = Field(default=OrderStatus.NEW)
     created_at: datetime
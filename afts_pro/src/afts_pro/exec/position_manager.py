@@ -11,6 +11,8 @@ from afts_pro.exec.position_models import AccountState, Position, PositionSide
 
 logger = logging.getLogger(__name__)
 
+QTY_EPSILON = 1e-9
+
 
 class PositionEvent(BaseModel):
     symbol: str
@@ -84,11 +86,13 @@ class PositionManager:
         logger.debug("Increased position: %s", position)
 
     def _reduce_position(self, position: Position, fill: Fill, account_state: AccountState) -> float:
-        if fill.qty > position.qty:
+        if fill.qty > position.qty + QTY_EPSILON:
             raise ValueError("Position flip attempted; not allowed in v1.")
 
         pnl = self._calculate_pnl(position, fill)
         position.qty -= fill.qty
+        if abs(position.qty) <= QTY_EPSILON:
+            position.qty = 0.0  # float dust left by netting equal add/reduce sizes
         position.realized_pnl += pnl
         account_state.realized_pnl += pnl
 
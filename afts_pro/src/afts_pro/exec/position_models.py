@@ -3,8 +3,9 @@ from __future__ import annotations
 from enum import Enum
 from typing import Dict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
+from afts_pro.exec.order_book import RestingOrderBook
 from afts_pro.exec.order_models import Order
 
 
@@ -35,10 +36,15 @@ class AccountState(BaseModel):
     unrealized_pnl: float
     fees_total: float
     positions: Dict[str, Position] = Field(default_factory=dict)
-    open_orders: Dict[str, Order] = Field(default_factory=dict)
+    open_orders: Dict[str, Order] = Field(default_factory=RestingOrderBook)
 
     model_config = {
         "populate_by_name": True,
         "arbitrary_types_allowed": True,
         "extra": "allow",
     }
+
+    @field_validator("open_orders", mode="after")
+    @classmethod
+    def _as_order_book(cls, value: Dict[str, Order]) -> RestingOrderBook:
+        return value if isinstance(value, RestingOrderBook) else RestingOrderBook(value.values())
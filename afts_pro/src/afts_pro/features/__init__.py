@@ -1,6 +1,4 @@
-from afts_pro.features.state import FeatureBundle, ModelFeatureVector, RawFeatureState
-from afts_pro.features.engine import FeatureEngine
-from afts_pro.config.feature_config import FeatureConfig
+from afts_pro.utils.lazy import lazy_exports
 
 __all__ = [
     "RawFeatureState",
@@ -9,3 +7,15 @@ __all__ = [
     "FeatureEngine",
     "FeatureConfig",
 ]
+
+# Submodules are imported on first attribute access (PEP 562).
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "FeatureBundle": "afts_pro.features.state",
+        "ModelFeatureVector": "afts_pro.features.state",
+        "RawFeatureState": "afts_pro.features.state",
+        "FeatureEngine": "afts_pro.features.engine",
+        "FeatureConfig": "afts_pro.config.feature_config",
+    },
+)
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import abc
-from typing import Optional
+from typing import Optional, Sequence, Tuple
 
 from afts_pro.core import MarketState
 from afts_pro.features.state import ExtrasSnapshot
 
 
 class BaseFeatureCalculator(abc.ABC):
+    # Extras datasets this calculator reads from the snapshot passed to update(). If any calculator
+    # declares some, FeatureEngine.attach_extras loads only those; otherwise all configured ones.
+    extras_datasets: Tuple[str, ...] = ()
+
     def __init__(self, name: str, **params) -> None:
         self.name = name
         self.params = params
@@ -18,6 +22,13 @@ class BaseFeatureCalculator(abc.ABC):
         Consume the latest bar and update internal state. Must be lookahead-safe.
         """
 
+    def update_many(self, bars: Sequence[MarketState]) -> None:
+        """
+        Consume a run of bars without extras (the SIM fast path); equivalent to update() per bar.
+        """
+        for bar in bars:
+            self.update(bar)
+
     @abc.abstractmethod
     def current_value(self):
         """
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
 
 from afts_pro.config.feature_config import FeatureConfig
 from afts_pro.core import MarketState
-from afts_pro.data.extras_loader import ExtrasSeries
 from afts_pro.features.base_calculator import BaseFeatureCalculator
+from afts_pro.features.extras_alignment import AlignedExtras, bar_epoch_ns
 from afts_pro.features.simple_calculators import (
     ATRCalculator,
     CloseReturnCalculator,
@@ -18,6 +20,9 @@ from afts_pro.features.simple_calculators import (
 )
 from afts_pro.features.state import ExtrasSnapshot, FeatureBundle, ModelFeatureVector, RawFeatureState
 
+if TYPE_CHECKING:  # pragma: no cover - typing only; avoids data <-> features import cycle
+    from afts_pro.data.extras_loader import ExtrasSeries
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,8 +41,11 @@ class FeatureEngine:
     def __init__(self, config: FeatureConfig) -> None:
         self.config = config
         self.calculators: Dict[str, BaseFeatureCalculator] = {}
-        self._extras: Dict[str, ExtrasSeries] = {}
-        self._extras_cursors: Dict[str, int] = {}
+        self._aligned: Dict[str, AlignedExtras] = {}
+        # (source mapping, dataset names) attached but not yet read; aligned on first use.
+        self._pending_extras: Optional[Tuple[Mapping[str, ExtrasSeries], List[str]]] = None
+        self._bar_timestamps: Optional[np.ndarray] = None
+        self._bar_cursor = 0
         for feature_def in config.raw_features:
             calculator_cls = CALCULATOR_REGISTRY.get(feature_def.calculator)
             if not calculator_cls:
@@ -50,45 +58,127 @@ class FeatureEngine:
             self.config.model_features.enabled,
         )
 
-    def attach_extras(self, extras_by_dataset: Dict[str, ExtrasSeries]) -> None:
-        self._extras = extras_by_dataset or {}
-        self._extras_cursors = {name: 0 for name in self._extras.keys()}
-        if self._extras:
-            logger.info("FeatureEngine extras attached | datasets=%s", list(self._extras.keys()))
-        else:
-            logger.info("FeatureEngine extras attached | no datasets")
+    @property
+    def extras_datasets(self) -> List[str]:
+        """
+        Extras datasets the configured calculators declare, in first-declared order.
+        """
+        return list(dict.fromkeys(ds for calc in self.calculators.values() for ds in calc.extras_datasets))
+
+    def attach_extras(
+        self,
+        extras_by_dataset: Mapping[str, ExtrasSeries],
+        bar_timestamps: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        Attach extras datasets; each is read and converted once into a float matrix on first use.
+
+        If any calculator declares `extras_datasets`, only those are attached; otherwise every
+        dataset in `extras_by_dataset` is. Nothing is read here, so a LazyExtrasMap loads its
+        frames on the first bar (all of them concurrently when every dataset is attached). When
+        the bar timeline (int64 UTC ns, in iteration order) is known up front, each dataset is
+        pre-aligned with a backward as-of join so the per-bar lookup is a single array row read.
+        Without it, each bar does a binary search on the extras timestamps.
+        """
+        extras_by_dataset = extras_by_dataset or {}
+        self._bar_timestamps = None if bar_timestamps is None else np.asarray(bar_timestamps, dtype=np.int64)
+        self._bar_cursor = 0
+        declared = self.extras_datasets
+        available = list(extras_by_dataset)
+        names = [name for name in declared if name in extras_by_dataset] if declared else available
+        self._aligned = {}
+        self._pending_extras = (extras_by_dataset, names) if names else None
+        logger.info(
+            "FeatureEngine extras attached | datasets=%s | unused=%s | declared=%s | prealigned_bars=%s",
+            names,
+            [name for name in available if name not in names],
+            bool(declared),
+            None if self._bar_timestamps is None else len(self._bar_timestamps),
+        )
+
+    @property
+    def attached_extras(self) -> List[str]:
+        """
+        Extras datasets in use, loading any still pending.
+        """
+        self._align_pending()
+        return list(self._aligned)
+
+    def _align_pending(self) -> None:
+        if self._pending_extras is None:
+            return
+        source, names = self._pending_extras
+        self._pending_extras = None
+        load_all = getattr(source, "load_all", None)
+        if load_all is not None and len(names) == len(source):
+            load_all()
+        for name in names:
+            try:
+                series = source[name]
+            except KeyError:  # LazyExtrasMap drops datasets that fail to load
+                continue
+            self._aligned[name] = AlignedExtras.from_frame(name, series.df, bar_timestamps=self._bar_timestamps)
+
+    def checkpoint(self) -> Dict[str, Any]:
+        """
+        Calculator state for a SIM checkpoint; extras are re-attached from disk on resume.
+        """
+        return {"calculators": self.calculators, "bar_cursor": self._bar_cursor}
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        self.calculators = state["calculators"]
+        self._bar_cursor = state["bar_cursor"]
+
+    def _bar_position(self, bar_ns: int) -> Optional[int]:
+        timeline = self._bar_timestamps
+        if timeline is None:
+            return None
+        pos = self._bar_cursor
+        if pos >= len(timeline) or timeline[pos] != bar_ns:
+            # Off the expected sequence (restart, skipped bars): relocate on the timeline.
+            pos = int(np.searchsorted(timeline, bar_ns, side="left"))
+            if pos >= len(timeline) or timeline[pos] != bar_ns:
+                return None
+        self._bar_cursor = pos + 1
+        return pos
 
     def _snapshot_extras(self, bar: MarketState) -> Optional[ExtrasSnapshot]:
-        if not self._extras:
+        if self._pending_extras is not None:
+            self._align_pending()
+        if not self._aligned:
             return None
+        bar_ns = bar_epoch_ns(bar.timestamp)
+        pos = self._bar_position(bar_ns)
         snapshot: Dict[str, Dict[str, float]] = {}
-        for ds_name, series in self._extras.items():
-            df = series.df
-            ts_column = df.columns[0]
-            cursor = self._extras_cursors.get(ds_name, 0)
-            while cursor < len(df) and pd.to_datetime(df.iloc[cursor][ts_column], utc=True) <= bar.timestamp:
-                cursor += 1
-            if cursor == 0:
-                self._extras_cursors[ds_name] = cursor
+        for ds_name, aligned in self._aligned.items():
+            if pos is not None and aligned.bar_rows is not None:
+                row = int(aligned.bar_rows[pos])
+            else:
+                row = aligned.row_at(bar_ns)
+            if row < 0 or not aligned.columns:
                 continue
-            use_idx = cursor - 1
-            self._extras_cursors[ds_name] = cursor
-            row = df.iloc[use_idx]
-            values: Dict[str, float] = {}
-            for col in df.columns:
-                if col == ts_column:
-                    continue
-                try:
-                    values[col] = float(row[col])
-                except Exception:
-                    continue
-            if values:
-                snapshot[ds_name] = values
+            snapshot[ds_name] = aligned.row_values(row)
 
         if not snapshot:
             return None
         return ExtrasSnapshot(values=snapshot)
 
+    def update_batch(self, bars: Sequence[MarketState]) -> None:
+        """
+        Advance every calculator over `bars` without building bundles (bars nobody reads
+        features for). Calculators see the same extras snapshots as with update().
+        """
+        if self._pending_extras is not None:
+            self._align_pending()
+        if self._aligned:
+            for bar in bars:
+                extras_snapshot = self._snapshot_extras(bar)
+                for calc in self.calculators.values():
+                    calc.update(bar, extras=extras_snapshot)
+            return
+        for calc in self.calculators.values():
+            calc.update_many(bars)
+
     def update(self, bar: MarketState) -> FeatureBundle:
         extras_snapshot = self._snapshot_extras(bar)
 
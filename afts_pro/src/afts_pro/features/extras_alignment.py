@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def to_epoch_ns(values) -> np.ndarray:
+    """
+    Convert a timestamp-like column to int64 UTC nanoseconds (numeric input is epoch milliseconds).
+    """
+    series = pd.Series(values)
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        converted = pd.to_datetime(series, unit="ms", utc=True)
+    else:
+        converted = pd.to_datetime(series, utc=True)
+    return converted.to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+
+def bar_epoch_ns(ts: datetime) -> int:
+    return pd.Timestamp(ts).value
+
+
+@dataclass
+class AlignedExtras:
+    """
+    One extras dataset as a dense float matrix plus a lookahead-safe as-of index.
+
+    `timestamps` are the sorted extras timestamps (int64 ns) and `values[i]` the numeric columns of
+    row i. When a bar timeline was provided, `bar_rows[k]` is the extras row visible at bar k
+    (last row with timestamp <= bar timestamp) or -1 when no row is visible yet.
+    """
+
+    name: str
+    columns: List[str]
+    timestamps: np.ndarray
+    values: np.ndarray
+    bar_rows: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_frame(cls, name: str, df: pd.DataFrame, bar_timestamps: Optional[np.ndarray] = None) -> "AlignedExtras":
+        ts_column = "timestamp" if "timestamp" in df.columns else df.columns[0]
+        timestamps = to_epoch_ns(df[ts_column])
+        columns: List[str] = []
+        matrix: List[np.ndarray] = []
+        for col in df.columns:
+            if col == ts_column:
+                continue
+            series = df[col]
+            if pd.api.types.is_numeric_dtype(series):
+                numeric = series.astype(np.float64)
+            else:
+                numeric = pd.to_numeric(series, errors="coerce")
+                if numeric.isna().all() and series.notna().any():
+                    # Non-numeric payload (e.g. symbol strings) never made it into snapshots.
+                    continue
+            columns.append(str(col))
+            matrix.append(numeric.to_numpy(dtype=np.float64, na_value=np.nan))
+        values = np.column_stack(matrix) if matrix else np.empty((len(timestamps), 0), dtype=np.float64)
+
+        if timestamps.shape[0] > 1 and np.any(timestamps[1:] < timestamps[:-1]):
+            order = np.argsort(timestamps, kind="stable")
+            timestamps = timestamps[order]
+            values = values[order]
+
+        aligned = cls(name=name, columns=columns, timestamps=timestamps, values=values)
+        if bar_timestamps is not None:
+            aligned.bar_rows = aligned.rows_asof(np.asarray(bar_timestamps, dtype=np.int64))
+        return aligned
+
+    def rows_asof(self, bar_ns: np.ndarray) -> np.ndarray:
+        """
+        Backward as-of join: index of the last extras row with timestamp <= each bar timestamp.
+        """
+        return np.searchsorted(self.timestamps, bar_ns, side="right").astype(np.int64) - 1
+
+    def row_at(self, bar_ns: int) -> int:
+        return int(np.searchsorted(self.timestamps, bar_ns, side="right")) - 1
+
+    def row_values(self, row: int) -> Dict[str, float]:
+        return dict(zip(self.columns, self.values[row].tolist()))
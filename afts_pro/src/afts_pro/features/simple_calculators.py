@@ -20,6 +20,9 @@ class CloseReturnCalculator(BaseFeatureCalculator):
     def update(self, bar: MarketState, extras=None) -> None:
         self.closes.append(bar.close)
 
+    def update_many(self, bars) -> None:
+        self.closes.extend(bar.close for bar in bars)
+
     def current_value(self) -> Optional[float]:
         if len(self.closes) <= self.lookback:
             return None
@@ -155,6 +158,9 @@ class TrendScoreCalculator(BaseFeatureCalculator):
     def update(self, bar: MarketState, extras=None) -> None:
         self.closes.append(bar.close)
 
+    def update_many(self, bars) -> None:
+        self.closes.extend(bar.close for bar in bars)
+
     def current_value(self) -> Optional[float]:
         if len(self.closes) <= 1:
             return None
@@ -1,6 +1,4 @@
-from afts_pro.lab.models import LabExperiment, LabResult, LabSweepDefinition, RunResult
-from afts_pro.lab.runner import LabRunner
-from afts_pro.lab.kpi_matrix import build_kpi_matrix, save_kpi_matrix
+from afts_pro.utils.lazy import lazy_exports
 
 __all__ = [
     "LabRunner",
@@ -8,6 +6,28 @@ __all__ = [
     "LabResult",
     "LabSweepDefinition",
     "RunResult",
+    "LockstepSimulator",
+    "LockstepSimApi",
+    "LockstepResult",
+    "VariantParams",
     "build_kpi_matrix",
     "save_kpi_matrix",
 ]
+
+# Submodules are imported on first attribute access (PEP 562).
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "LabExperiment": "afts_pro.lab.models",
+        "LabResult": "afts_pro.lab.models",
+        "LabSweepDefinition": "afts_pro.lab.models",
+        "RunResult": "afts_pro.lab.models",
+        "LabRunner": "afts_pro.lab.runner",
+        "build_kpi_matrix": "afts_pro.lab.kpi_matrix",
+        "save_kpi_matrix": "afts_pro.lab.kpi_matrix",
+        "LockstepResult": "afts_pro.lab.lockstep",
+        "LockstepSimApi": "afts_pro.lab.lockstep",
+        "LockstepSimulator": "afts_pro.lab.lockstep",
+        "VariantParams": "afts_pro.lab.lockstep",
+    },
+)
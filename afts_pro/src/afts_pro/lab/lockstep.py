@@ -0,0 +1,428 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+import uuid
+from dataclasses import asdict, dataclass, field, fields, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from afts_pro.core.strategy_orb import ORBConfig, ORBStrategy, SessionConfig
+from afts_pro.core.wakeup import DAY_NS
+from afts_pro.data.bar_store import BarArrays
+from afts_pro.exec.position_manager import QTY_EPSILON
+from afts_pro.lab.models import RunResult
+
+logger = logging.getLogger(__name__)
+
+# Sweep keys ("<section>.<name>") for each VariantParams field; aliases cover lab.yaml names.
+PARAM_KEYS: Dict[str, str] = {
+    "orb.range_minutes": "range_minutes",
+    "orb.min_range_pips": "min_range_pips",
+    "orb.breakout_buffer_pips": "breakout_buffer_pips",
+    "orb.max_entries_per_day": "max_entries_per_day",
+    "orb.range_rr_sl_mult": "range_rr_sl_mult",
+    "orb.range_rr_tp_mult": "range_rr_tp_mult",
+    "orb.allow_long": "allow_long",
+    "orb.allow_short": "allow_short",
+    "risk.daily_soft_dd_pct": "daily_soft_dd_pct",
+    "risk.daily_hard_dd_pct": "daily_hard_dd_pct",
+    "risk.total_dd_hard_stop_pct": "total_dd_hard_stop_pct",
+    "sizer.fixed_risk_pct": "fixed_risk_pct",
+    "sizer.max_risk_per_trade_pct": "max_risk_per_trade_pct",
+    "sizer.max_risk_per_day_pct": "max_risk_per_day_pct",
+}
+PARAM_ALIASES: Dict[str, str] = {
+    "orb.box_length": "orb.range_minutes",
+    "risk.r_per_trade": "sizer.fixed_risk_pct",
+}
+ORB_FIELDS = tuple(f.name for f in fields(ORBConfig))
+
+
+@dataclass(frozen=True)
+class VariantParams:
+    """
+    One point of a sweep: session-ORB strategy, FTMO drawdown limits and PositionSizer settings.
+    """
+
+    range_minutes: int = 15
+    min_range_pips: float = 1.0
+    breakout_buffer_pips: float = 0.0
+    max_entries_per_day: int = 1
+    atr_sl_mult: float = 1.0
+    atr_tp_mult: float = 2.0
+    range_rr_sl_mult: float = 1.0
+    range_rr_tp_mult: float = 2.0
+    allow_long: bool = True
+    allow_short: bool = True
+    daily_soft_dd_pct: float = 0.035
+    daily_hard_dd_pct: float = 0.04
+    total_dd_hard_stop_pct: float = 0.085
+    fixed_risk_pct: float = 0.5
+    min_risk_pct: float = 0.0
+    max_risk_pct: float = 3.0
+    max_risk_per_trade_pct: float = 1.0
+    max_risk_per_day_pct: Optional[float] = None
+    cost_per_unit: Optional[float] = None
+
+    @classmethod
+    def from_configs(
+        cls,
+        orb: Optional[ORBConfig] = None,
+        risk_config: Optional[Mapping[str, Any]] = None,
+        sizer_config: Optional[Mapping[str, Any]] = None,
+    ) -> "VariantParams":
+        values: Dict[str, Any] = {}
+        if orb is not None:
+            values.update({f.name: getattr(orb, f.name) for f in fields(cls) if hasattr(orb, f.name)})
+        names = {f.name for f in fields(cls)}
+        for source in (risk_config or {}, sizer_config or {}):
+            values.update({k: v for k, v in source.items() if k in names})
+        return cls(**values)
+
+    def with_overrides(self, overrides: Optional[Mapping[str, Any]]) -> "VariantParams":
+        changes: Dict[str, Any] = {}
+        for key, value in (overrides or {}).items():
+            name = PARAM_KEYS.get(PARAM_ALIASES.get(key, key))
+            if name is None:
+                raise ValueError(f"Unknown lockstep parameter: {key!r} (known: {sorted(PARAM_KEYS)})")
+            changes[name] = value
+        return replace(self, **changes)
+
+
+@dataclass
+class LockstepResult:
+    params: List[VariantParams]
+    metrics: List[Dict[str, Any]]
+    bars: int
+    elapsed_s: float
+    timestamps: Optional[np.ndarray] = None
+    equity: Optional[np.ndarray] = field(default=None, repr=False)  # (bars, variants)
+
+
+class LockstepSimulator:
+    """
+    Runs K parameter variants over one pass of the bars.
+
+    Entry signals come from ORBStrategy.signal_arrays, computed once per distinct ORB setting.
+    Per-variant state (position, realized PnL, drawdown anchors) lives in length-K arrays, so
+    each bar costs a fixed number of numpy operations whatever K is.
+
+    Semantics are those of the SIM engine running the session ORBStrategy with an FTMO policy,
+    no behaviour guards and the demo entry off:
+    - an entry on a bar is a market order filled at the next bar's open (with slippage), sized
+      by PositionSizer from the entry's SL distance (or a fixed quantity without the sizer);
+    - fills net into one position per variant like PositionManager: same side adds at the
+      average price, the opposite side reduces or closes, and an opposite fill larger than the
+      position (a flip) is refused. The order builder rests no bracket for entries, so the
+      TP multiple does not change results;
+    - opening fees are booked in `fees` only, closing fees reduce the realized PnL;
+    - the daily drawdown anchor is the equity of the day's first bar; a daily soft drawdown
+      blocks new entries and a daily/total hard drawdown stops the variant (equity frozen, as
+      the engine ends the run).
+    """
+
+    def __init__(
+        self,
+        bars: BarArrays,
+        session: SessionConfig,
+        *,
+        initial_balance: float = 100_000.0,
+        fee_rate: float = 0.0,
+        slippage_pct: float = 0.0,
+        fixed_qty: Optional[float] = None,
+        record_equity: bool = False,
+    ) -> None:
+        self.bars = bars
+        self.session = session
+        self.initial_balance = float(initial_balance)
+        self.fee_rate = float(fee_rate)
+        self.slippage_pct = float(slippage_pct)
+        self.fixed_qty = fixed_qty
+        self.record_equity = record_equity
+
+        day = np.asarray(bars.timestamp, dtype=np.int64) // DAY_NS
+        self._new_day = np.empty(day.shape[0], dtype=bool)
+        if day.shape[0]:
+            self._new_day[0] = True
+            self._new_day[1:] = day[1:] != day[:-1]
+        self._signal_cache: Dict[Tuple[Any, ...], Tuple[np.ndarray, np.ndarray]] = {}
+
+    def signals(self, orb: ORBConfig) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Per-bar entry direction (+1 long, -1 short, 0 none) and SL price for one ORB setting.
+        """
+        key = tuple(getattr(orb, name) for name in ORB_FIELDS)
+        cached = self._signal_cache.get(key)
+        if cached is None:
+            arrays = ORBStrategy(orb, self.session).signal_arrays(self.bars)
+            direction = arrays.long_entry.astype(np.int8) - arrays.short_entry.astype(np.int8)
+            cached = self._signal_cache[key] = (direction, arrays.sl)
+        return cached
+
+    def run(self, variants: Sequence[VariantParams]) -> LockstepResult:
+        started = time.perf_counter()
+        k = len(variants)
+        n = len(self.bars)
+        col = lambda name: np.array([getattr(v, name) for v in variants], dtype=np.float64)  # noqa: E731
+
+        # One column per distinct ORB setting; variants index into it.
+        groups: Dict[Tuple[Any, ...], int] = {}
+        group = np.array([groups.setdefault(tuple(getattr(v, f) for f in ORB_FIELDS), len(groups)) for v in variants], dtype=np.int64)
+        directions = np.zeros((n, len(groups)), dtype=np.int8)
+        stops = np.full((n, len(groups)), np.nan)
+        for key, g in groups.items():
+            directions[:, g], stops[:, g] = self.signals(ORBConfig(*key))
+        any_signal = directions.any(axis=1)
+
+        soft_dd = col("daily_soft_dd_pct")
+        hard_dd = col("daily_hard_dd_pct")
+        total_dd_stop = col("total_dd_hard_stop_pct")
+        risk_pct = np.clip(col("fixed_risk_pct"), col("min_risk_pct"), col("max_risk_pct"))
+        trade_cap_pct = col("max_risk_per_trade_pct")
+        day_cap_pct = np.array([np.inf if v.max_risk_per_day_pct is None else v.max_risk_per_day_pct for v in variants])
+        cost_per_unit = np.array([v.cost_per_unit or 1.0 for v in variants])
+
+        init = self.initial_balance
+        equity = np.full(k, init)
+        realized = np.zeros(k)
+        day_start = equity.copy()
+        peak = equity.copy()
+        mdd = np.zeros(k)
+        side = np.zeros(k, dtype=np.int8)
+        qty = np.zeros(k)
+        entry = np.zeros(k)
+        pend_side = np.zeros(k, dtype=np.int8)
+        pend_qty = np.zeros(k)
+        halted = np.zeros(k, dtype=bool)
+        trades = np.zeros(k, dtype=np.int64)
+        wins = np.zeros(k, dtype=np.int64)
+        gross_win = np.zeros(k)
+        gross_loss = np.zeros(k)
+        fees = np.zeros(k)
+        curve = np.empty((n, k)) if self.record_equity else None
+
+        opens, closes = self.bars.open, self.bars.close
+        slip, fee_rate = self.slippage_pct, self.fee_rate
+        for t in range(n):
+            o, c = float(opens[t]), float(closes[t])
+            active = ~halted
+
+            # Market orders built on the previous bar fill at this open and net into the position.
+            filled = (pend_side != 0) & active
+            if filled.any():
+                price = o * (1.0 + slip * pend_side)
+                fee = np.where(filled, np.abs(pend_qty * price) * fee_rate, 0.0)
+                fees += fee
+                opening = filled & (side == 0)
+                adding = filled & (side == pend_side)
+                reducing = filled & (side == -pend_side) & (pend_qty <= qty + QTY_EPSILON)
+                pnl = np.where(reducing, side * (price - entry) * pend_qty - fee, 0.0)
+                realized += pnl
+                total = qty + pend_qty
+                entry = np.where(opening, price, np.where(adding, (entry * qty + price * pend_qty) / np.where(adding, total, 1.0), entry))
+                qty = np.where(opening | adding, total, np.where(reducing, qty - pend_qty, qty))
+                side = np.where(opening, pend_side, side).astype(np.int8)
+                closed = reducing & (np.abs(qty) <= QTY_EPSILON)
+                if closed.any():
+                    qty = np.where(closed, 0.0, qty)
+                    side = np.where(closed, 0, side).astype(np.int8)
+                    trades += closed
+                    wins += closed & (pnl > 0)
+                    gross_win += np.where(closed & (pnl > 0), pnl, 0.0)
+                    gross_loss += np.where(closed & (pnl < 0), -pnl, 0.0)
+            pend_side.fill(0)
+
+            equity = np.where(active, init + realized + side * (c - entry) * qty, equity)
+            peak = np.maximum(peak, equity)
+            mdd = np.maximum(mdd, (peak - equity) / peak)
+
+            if self._new_day[t]:
+                day_start = np.where(active, equity, day_start)
+            breach = active & (((init - equity) / init >= total_dd_stop) | (equity <= day_start - init * hard_dd))
+            halted |= breach
+
+            if any_signal[t]:
+                direction = directions[t, group]
+                place = (direction != 0) & ~halted & (equity > day_start - init * soft_dd)
+                if place.any():
+                    if self.fixed_qty is not None:
+                        size = np.full(k, float(self.fixed_qty))
+                    else:
+                        # PositionSizer.compute_position_size, entry at the signal bar's close.
+                        risk_amount = np.minimum(equity * risk_pct / 100.0, equity * trade_cap_pct / 100.0)
+                        day_cap = equity * day_cap_pct / 100.0
+                        risk_amount = np.where(-realized + risk_amount > day_cap, np.maximum(day_cap + realized, 0.0), risk_amount)
+                        distance = np.abs(c - stops[t, group]) * cost_per_unit
+                        valid = distance > 0
+                        size = np.where(valid, risk_amount / np.where(valid, distance, 1.0), 0.0)
+                    place &= size > 0
+                    pend_side = np.where(place, direction, 0).astype(np.int8)
+                    pend_qty = np.where(place, size, 0.0)
+
+            if curve is not None:
+                curve[t] = equity
+
+        metrics = [
+            {
+                "final_equity": float(equity[i]),
+                "net_pnl": float(equity[i] - init),
+                "trades": int(trades[i]),
+                "winrate": float(wins[i] / trades[i]) if trades[i] else 0.0,
+                "pf": float(gross_win[i] / gross_loss[i]) if gross_loss[i] > 0 else None,
+                "mdd": float(mdd[i]),
+                "fees": float(fees[i]),
+                "halted": bool(halted[i]),
+                "open_position": bool(side[i] != 0),
+            }
+            for i in range(k)
+        ]
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "LOCKSTEP_DONE | variants=%d | orb_settings=%d | bars=%d | elapsed_s=%.3f | variant_bars_per_sec=%.0f",
+            k,
+            len(groups),
+            n,
+            elapsed,
+            k * n / elapsed if elapsed > 0 else 0.0,
+        )
+        return LockstepResult(
+            params=list(variants),
+            metrics=metrics,
+            bars=n,
+            elapsed_s=elapsed,
+            timestamps=np.asarray(self.bars.timestamp) if curve is not None else None,
+            equity=curve,
+        )
+
+
+class LockstepSimApi:
+    """
+    SIM API for LabRunner that evaluates a whole sweep with one LockstepSimulator pass.
+
+    run_backtests() is picked up by LabRunner.run_sweep; run_backtest() keeps the single-run
+    interface. Each variant gets a run directory with metrics.json (and equity_curve.parquet
+    when the simulator records equity).
+    """
+
+    def __init__(self, simulator: LockstepSimulator, base_params: VariantParams, output_root: Path) -> None:
+        self.simulator = simulator
+        self.base_params = base_params
+        self.output_root = Path(output_root)
+
+    @classmethod
+    def from_profile(
+        cls,
+        profile_path: Path | str,
+        *,
+        project_root: Path,
+        data_root: Path,
+        output_root: Path,
+        symbol: Optional[str] = None,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+        strategy_profile_path: Optional[str] = None,
+        record_equity: bool = False,
+    ) -> "LockstepSimApi":
+        """
+        Build the API from a SIM profile, reading configs the way the engine's SIM run does.
+
+        The strategy profile defaults to sim.yaml's strategy_profile_path and start/end to its
+        data window; the symbol defaults to the profile's first asset.
+        """
+        from afts_pro.config.global_config import load_global_config_from_profile
+        from afts_pro.config.loader import load_yaml
+        from afts_pro.core.strategy_profile import load_strategy_profile
+        from afts_pro.data.parquet_feed import ParquetFeed
+        from afts_pro.risk.factory import load_risk_config
+
+        project_root = Path(project_root)
+        global_config = load_global_config_from_profile(str(profile_path))
+        sim_cfg_path = project_root / "configs" / "modes" / "sim.yaml"
+        sim_cfg = load_yaml(str(sim_cfg_path)) if sim_cfg_path.exists() else {}
+        data_cfg = sim_cfg.get("data", {}) or {}
+        symbol = symbol or next(iter(global_config.assets.assets), None)
+        if symbol is None:
+            raise ValueError(f"Profile {profile_path} lists no assets and no symbol was given.")
+
+        strategy_path = strategy_profile_path or sim_cfg.get("strategy_profile_path")
+        strategy = load_strategy_profile(str(project_root / strategy_path)) if strategy_path else None
+        if strategy is None or strategy.orb is None:
+            raise ValueError("Lockstep runs need a session ORB strategy profile (sim.yaml strategy_profile_path).")
+
+        risk_path = Path(global_config.risk.policy_path)
+        risk_config = load_risk_config(str(risk_path if risk_path.is_absolute() else project_root / risk_path))
+        if str(risk_config.get("type", "")).lower() != "ftmo":
+            raise ValueError(f"Lockstep runs model the FTMO risk policy only (got {risk_config.get('type')!r}).")
+
+        sizer_config = None
+        fixed_qty = None
+        if sim_cfg.get("use_position_sizer", False):
+            sizer_path = sim_cfg.get("position_sizer_config", "configs/exec/position_sizer.yaml")
+            sizer_config = load_yaml(str(project_root / sizer_path))
+        else:
+            spec = global_config.assets.assets.get(symbol)
+            fixed_qty = max(spec.min_qty, 0.01) if spec else 0.01  # OrderBuilder's default quantity
+        if sim_cfg.get("demo_entry", True):
+            logger.warning("LOCKSTEP | demo_entry is on in sim.yaml; lockstep runs trade without it")
+        if global_config.behaviour.enabled:
+            logger.warning("LOCKSTEP | behaviour guards are not modelled; results match SIM runs with them off")
+
+        bars = ParquetFeed(Path(data_root)).load_bars(
+            symbol,
+            folder="final_agg",
+            start=start if start is not None else data_cfg.get("start"),
+            end=end if end is not None else data_cfg.get("end"),
+        )
+        execution = global_config.execution
+        simulator = LockstepSimulator(
+            bars,
+            strategy.session,
+            initial_balance=float(risk_config.get("initial_balance", 100000.0)),
+            fee_rate=execution.taker_fee_pct,
+            slippage_pct=execution.max_slippage_pct,
+            fixed_qty=fixed_qty,
+            record_equity=record_equity,
+        )
+        logger.info(
+            "LOCKSTEP_READY | profile=%s | strategy=%s | symbol=%s | bars=%d | sizer=%s",
+            Path(profile_path).stem,
+            strategy.name,
+            symbol,
+            len(bars),
+            "position_sizer" if fixed_qty is None else f"fixed_qty={fixed_qty}",
+        )
+        return cls(simulator, VariantParams.from_configs(strategy.orb, risk_config, sizer_config), output_root)
+
+    def run_backtest(self, profile_name: str, overrides: Optional[Dict[str, Any]] = None, seed: Optional[int] = None) -> RunResult:
+        return self.run_backtests(profile_name, [overrides or {}], seed=seed)[0]
+
+    def run_backtests(
+        self,
+        profile_name: str,
+        overrides_list: Sequence[Optional[Dict[str, Any]]],
+        seed: Optional[int] = None,
+    ) -> List[RunResult]:
+        variants = [self.base_params.with_overrides(overrides) for overrides in overrides_list]
+        result = self.simulator.run(variants)
+        batch_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S") + f"_lockstep_{profile_name}_{uuid.uuid4().hex[:6]}"
+        runs: List[RunResult] = []
+        for idx, (params, metrics) in enumerate(zip(result.params, result.metrics)):
+            run_id = f"{batch_id}_v{idx:03d}"
+            run_path = self.output_root / batch_id / f"v{idx:03d}"
+            run_path.mkdir(parents=True, exist_ok=True)
+            (run_path / "metrics.json").write_text(json.dumps({**metrics, "params": asdict(params)}, indent=2))
+            if result.equity is not None:
+                pd.DataFrame(
+                    {
+                        "timestamp": pd.to_datetime(result.timestamps, utc=True),
+                        "equity": result.equity[:, idx],
+                    }
+                ).to_parquet(run_path / "equity_curve.parquet", index=False)
+            runs.append(RunResult(run_id=run_id, run_path=str(run_path), metrics=metrics))
+        return runs
@@ -80,6 +80,9 @@ class LabRunner:
         Run a single experiment via the provided SIM API.
         """
         run_result: RunResult = self.sim_api.run_backtest(experiment.base_profile, overrides=experiment.params, seed=experiment.seed)
+        return self._record_result(experiment, run_result, sweep_id)
+
+    def _record_result(self, experiment: LabExperiment, run_result: RunResult, sweep_id: str | None) -> LabResult:
         exp_dir = self._build_experiment_dir(experiment, sweep_id)
         self._write_experiment_snapshot(exp_dir, experiment)
         metrics_path = exp_dir / "metrics.json"
@@ -120,19 +123,29 @@ class LabRunner:
             combos = _generate_random(sweep.params, max_exp, seed=sweep.seed)
         if sweep.max_experiments:
             combos = combos[: sweep.max_experiments]
-        results: List[LabResult] = []
-        for combo in combos:
-            exp = LabExperiment(
+        experiments = [
+            LabExperiment(
                 id=uuid.uuid4().hex[:8],
-                name=f"exp_{len(results)}",
+                name=f"exp_{idx}",
                 mode=self.lab_config.get("default_mode", "strategy_backtest"),
                 base_profile=self.lab_config.get("base_profile", "sim"),
                 params=combo,
                 seed=sweep.seed,
                 meta={"sweep_id": sweep.id},
             )
-            res = self.run_experiment(exp, sweep_id=sweep.id)
-            results.append(res)
+            for idx, combo in enumerate(combos)
+        ]
+        results: List[LabResult] = []
+        if experiments and hasattr(self.sim_api, "run_backtests"):
+            # Batch-capable APIs (e.g. LockstepSimApi) evaluate the whole sweep in one data pass.
+            run_results = self.sim_api.run_backtests(
+                experiments[0].base_profile, [exp.params for exp in experiments], seed=sweep.seed
+            )
+            for exp, run_result in zip(experiments, run_results):
+                results.append(self._record_result(exp, run_result, sweep.id))
+        else:
+            for exp in experiments:
+                results.append(self.run_experiment(exp, sweep_id=sweep.id))
 
         metrics_names = self.lab_config.get("metrics", [])
         output_cfg = self.lab_config.get("output", {})
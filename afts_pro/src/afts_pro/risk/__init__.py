@@ -2,12 +2,7 @@
 Risk management package.
 """
 
-from .base_policy import BaseRiskPolicy, RiskDecision
-from .ftmo_policy import FtmoRiskPolicy
-from .apex_policy import ApexRiskPolicy
-from .equity_policy import EquityMaxDdPolicy
-from .manager import RiskManager
-from .factory import create_risk_policy_from_config, load_risk_config
+from afts_pro.utils.lazy import lazy_exports
 
 __all__ = [
     "BaseRiskPolicy",
@@ -19,3 +14,18 @@ __all__ = [
     "create_risk_policy_from_config",
     "load_risk_config",
 ]
+
+# Submodules are imported on first attribute access (PEP 562).
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BaseRiskPolicy": ".base_policy",
+        "RiskDecision": ".base_policy",
+        "FtmoRiskPolicy": ".ftmo_policy",
+        "ApexRiskPolicy": ".apex_policy",
+        "EquityMaxDdPolicy": ".equity_policy",
+        "RiskManager": ".manager",
+        "create_risk_policy_from_config": ".factory",
+        "load_risk_config": ".factory",
+    },
+)
@@ -38,3 +38,10 @@ class BaseRiskPolicy(ABC):
         """
         Evaluate current risk state and return a decision.
         """
+
+    def next_wakeup(self, *, ts: datetime, decision: RiskDecision) -> Optional[datetime]:
+        """
+        Earliest time evaluate() may return something other than `decision` while equity and
+        balance stay constant (None: not at all). The default, ts, means "evaluate every bar".
+        """
+        return ts
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
+from typing import Optional
 
 from afts_pro.exec.position_models import AccountState
 from afts_pro.risk.base_policy import BaseRiskPolicy, RiskDecision
@@ -67,6 +68,10 @@ class EquityMaxDdPolicy(BaseRiskPolicy):
             meta=meta,
         )
 
+    def next_wakeup(self, *, ts: datetime, decision: RiskDecision) -> Optional[datetime]:
+        # Drawdown against the high-water mark only moves with equity.
+        return None
+
     def _get_equity(self, account_state: AccountState) -> float:
         if self.equity_basis == "full":
             return account_state.equity
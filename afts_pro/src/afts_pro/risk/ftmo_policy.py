@@ -4,6 +4,7 @@ import logging
 from datetime import date, datetime
 from typing import Optional
 
+from afts_pro.core.wakeup import next_day_start
 from afts_pro.exec.position_models import AccountState
 from afts_pro.risk.base_policy import BaseRiskPolicy, RiskDecision
 
@@ -95,6 +96,10 @@ class FtmoRiskPolicy(BaseRiskPolicy):
             meta=meta,
         )
 
+    def next_wakeup(self, *, ts: datetime, decision: RiskDecision) -> Optional[datetime]:
+        # Daily limits are re-anchored to the current equity at midnight, lifting a soft stop.
+        return None if decision.allow_new_orders else next_day_start(ts)
+
     def _get_equity(self, account_state: AccountState) -> float:
         if self.include_unrealized:
             return account_state.equity
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
+from typing import Optional
 
+from afts_pro.core.wakeup import earliest, next_day_start
 from afts_pro.exec.position_models import AccountState
 from afts_pro.risk.base_policy import BaseRiskPolicy, RiskDecision
 
@@ -23,6 +25,18 @@ class RiskManager:
         decision = self._policy.evaluate(account_state=account_state, ts=ts)
         return decision
 
+    def next_wakeup(self, ts: datetime, decision: RiskDecision) -> Optional[datetime]:
+        """
+        Earliest time before_new_orders may change `decision` while the account is flat and idle.
+        """
+        if self.ftmo_plus_engine is not None:
+            # Rolling windows, sessions, news and time fences are clock driven.
+            return ts
+        wake = self._policy.next_wakeup(ts=ts, decision=decision)
+        if self.ftmo_engine is not None and not decision.allow_new_orders:
+            wake = earliest(wake, next_day_start(ts))
+        return wake
+
     def before_new_orders(self, account_state: AccountState, ts: datetime) -> RiskDecision:
         decision = self._policy.evaluate(account_state=account_state, ts=ts)
         if self.ftmo_engine is not None:
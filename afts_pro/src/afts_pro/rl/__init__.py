@@ -1,5 +1,4 @@
-from afts_pro.rl.env import RLBaseEnv, RLTradingEnv, RLObservation, RLStepResult
-from afts_pro.rl.types import RLObsSpec, ActionSpec, RewardSpec, RLContext
+from afts_pro.utils.lazy import lazy_exports
 
 __all__ = [
     "RLBaseEnv",
@@ -11,3 +10,18 @@ __all__ = [
     "RewardSpec",
     "RLContext",
 ]
+
+# Submodules are imported on first attribute access (PEP 562).
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "RLBaseEnv": "afts_pro.rl.env",
+        "RLTradingEnv": "afts_pro.rl.env",
+        "RLObservation": "afts_pro.rl.env",
+        "RLStepResult": "afts_pro.rl.env",
+        "RLObsSpec": "afts_pro.rl.types",
+        "ActionSpec": "afts_pro.rl.types",
+        "RewardSpec": "afts_pro.rl.types",
+        "RLContext": "afts_pro.rl.types",
+    },
+)
@@ -1,10 +1,25 @@
-from afts_pro.runlogger.models import RunMeta, TradeRecord, EquityPoint, MetricsSnapshot
-from afts_pro.runlogger.run_logger import RunLogger
+from afts_pro.utils.lazy import lazy_exports
 
 __all__ = [
+    "EventJournal",
     "RunLogger",
     "RunMeta",
     "TradeRecord",
     "EquityPoint",
     "MetricsSnapshot",
+    "read_journal",
 ]
+
+# Submodules are imported on first attribute access (PEP 562).
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "EventJournal": "afts_pro.runlogger.journal",
+        "read_journal": "afts_pro.runlogger.journal",
+        "RunMeta": "afts_pro.runlogger.models",
+        "TradeRecord": "afts_pro.runlogger.models",
+        "EquityPoint": "afts_pro.runlogger.models",
+        "MetricsSnapshot": "afts_pro.runlogger.models",
+        "RunLogger": "afts_pro.runlogger.run_logger",
+    },
+)
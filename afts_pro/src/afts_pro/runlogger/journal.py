@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from afts_pro.runlogger.segments import SegmentedParquetFile
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SCHEMA = pa.schema(
+    [
+        ("bar", pa.int64()),
+        ("timestamp", pa.timestamp("us", tz="UTC")),
+        ("event", pa.string()),
+        ("symbol", pa.string()),
+        ("data", pa.string()),
+    ]
+)
+
+
+class EventJournal:
+    """
+    Columnar journal of per-bar engine events (RISK, DECISION, FILL, ...).
+
+    record() only appends a tuple; payloads are JSON-encoded and written as one parquet row
+    group per `batch_size` events. The file is written under a hidden partial name and moved
+    into place by close(), so a readable journal is always complete; checkpoint() seals what
+    was written so far so a resumed run can append to it.
+    """
+
+    def __init__(self, path: Path, batch_size: int = 10_000) -> None:
+        self.path = Path(path)
+        self.batch_size = max(int(batch_size), 1)
+        self._rows: List[Tuple[int, Optional[datetime], str, Optional[str], Dict[str, Any]]] = []
+        self._file = SegmentedParquetFile(self.path, JOURNAL_SCHEMA)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def record(self, event: str, bar: int, ts: Optional[datetime], symbol: Optional[str], **data: Any) -> None:
+        self._rows.append((bar, ts, event, symbol, data))
+        self._count += 1
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        rows, self._rows = self._rows, []
+        if not rows:
+            return
+        bars, timestamps, events, symbols, payloads = zip(*rows)
+        table = pa.Table.from_arrays(
+            [
+                pa.array(bars, type=pa.int64()),
+                pa.array(timestamps, type=pa.timestamp("us", tz="UTC")),
+                pa.array(events, type=pa.string()),
+                pa.array(symbols, type=pa.string()),
+                pa.array([json.dumps(p, default=str) if p else None for p in payloads], type=pa.string()),
+            ],
+            schema=JOURNAL_SCHEMA,
+        )
+        self._file.write(table)
+
+    def checkpoint(self) -> Dict[str, int]:
+        self.flush()
+        return {"events": self._count, "segments": self._file.seal()}
+
+    def restore(self, state: Dict[str, int]) -> None:
+        self._rows = []
+        self._file.truncate(state["segments"])
+        self._count = state["events"]
+
+    def reopen(self, state: Dict[str, int]) -> None:
+        """
+        Continue a closed journal from its end-of-run checkpoint() state.
+        """
+        self.restore({**state, "segments": self._file.reopen()})
+
+    def close(self) -> None:
+        self.flush()
+        if not self._file.finish():
+            return
+        logger.info("JOURNAL_WRITTEN | path=%s | events=%d", self.path, self._count)
+
+
+def read_journal(
+    path: Path,
+    events: Optional[Sequence[str]] = None,
+    start_bar: Optional[int] = None,
+    end_bar: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Journal rows as a DataFrame with `data` decoded to dicts; filters are pushed into the parquet read.
+    """
+    filters = []
+    if events:
+        filters.append(("event", "in", [e.upper() for e in events]))
+    if start_bar is not None:
+        filters.append(("bar", ">=", int(start_bar)))
+    if end_bar is not None:
+        filters.append(("bar", "<=", int(end_bar)))
+    table = pq.read_table(path, filters=filters or None)
+    df = table.to_pandas()
+    df["data"] = [json.loads(value) if value else {} for value in df["data"]]
+    return df
+
+
+def format_event(row: Any) -> str:
+    fields = " | ".join(f"{key}={value}" for key, value in row.data.items())
+    line = f"{row.bar} | {row.timestamp.isoformat() if row.timestamp is not None else '-'} | {row.event} | {row.symbol}"
+    return f"{line} | {fields}" if fields else line
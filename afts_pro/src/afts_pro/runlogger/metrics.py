@@ -79,13 +79,73 @@ def compute_basic_sharpe_like(equity_points: Sequence[EquityPoint]) -> Optional[
     return sharpe_like
 
 
-def build_metrics_snapshot(trades: Sequence[TradeRecord], equity_points: Sequence[EquityPoint]) -> MetricsSnapshot:
+class EquityStats:
+    """
+    Running max-drawdown and sharpe-like aggregates, equal to compute_max_drawdown and
+    compute_basic_sharpe_like over the full curve without keeping the points in memory.
+    """
+
+    __slots__ = ("points", "max_equity", "max_dd_abs", "max_dd_pct", "_last", "_n", "_mean", "_m2")
+
+    def __init__(self) -> None:
+        self.points = 0
+        self.max_equity: Optional[float] = None
+        self.max_dd_abs = 0.0
+        self.max_dd_pct = 0.0
+        self._last: Optional[float] = None
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def update(self, equity: float) -> None:
+        self.points += 1
+        if self.max_equity is None or equity > self.max_equity:
+            self.max_equity = equity
+        if self.max_equity and equity < self.max_equity:
+            dd_abs = self.max_equity - equity
+            dd_pct = dd_abs / self.max_equity
+            if dd_abs > self.max_dd_abs:
+                self.max_dd_abs = dd_abs
+            if dd_pct > self.max_dd_pct:
+                self.max_dd_pct = dd_pct
+        if self._last is not None and self._last != 0:
+            ret = (equity - self._last) / self._last
+            # Welford update of mean / population variance.
+            self._n += 1
+            delta = ret - self._mean
+            self._mean += delta / self._n
+            self._m2 += delta * (ret - self._mean)
+        self._last = equity
+
+    def max_drawdown(self) -> tuple[Optional[float], Optional[float]]:
+        if self.max_equity is None:
+            return None, None
+        return self.max_dd_abs, self.max_dd_pct
+
+    def sharpe_like(self) -> Optional[float]:
+        if self.points < 2 or self._n == 0:
+            return None
+        std_ret = math.sqrt(self._m2 / self._n)
+        if std_ret == 0:
+            return None
+        return self._mean / std_ret * math.sqrt(self._n)
+
+
+def build_metrics_snapshot(
+    trades: Sequence[TradeRecord],
+    equity_points: Sequence[EquityPoint],
+    equity_stats: Optional[EquityStats] = None,
+) -> MetricsSnapshot:
     profit_factor = compute_profit_factor(trades)
     winrate = compute_winrate(trades)
     avg_win, avg_loss = compute_avg_win_loss(trades)
     expectancy = compute_expectancy_per_trade(trades)
-    max_dd_abs, max_dd_pct = compute_max_drawdown(equity_points)
-    sharpe_like = compute_basic_sharpe_like(equity_points)
+    if equity_stats is not None:
+        max_dd_abs, max_dd_pct = equity_stats.max_drawdown()
+        sharpe_like = equity_stats.sharpe_like()
+    else:
+        max_dd_abs, max_dd_pct = compute_max_drawdown(equity_points)
+        sharpe_like = compute_basic_sharpe_like(equity_points)
     snapshot = MetricsSnapshot(
         profit_factor=profit_factor,
         winrate=winrate,
@@ -1,26 +1,38 @@
 from __future__ import annotations
 
+import copy
 import json
 import logging
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
+import pyarrow as pa
 import yaml
 
 from afts_pro.exec.position_models import AccountState
 from afts_pro.exec.position_manager import PositionEvent
-from afts_pro.runlogger.metrics import build_metrics_snapshot
+from afts_pro.runlogger.journal import EventJournal
+from afts_pro.runlogger.metrics import EquityStats, build_metrics_snapshot
 from afts_pro.runlogger.models import EquityPoint, MetricsSnapshot, RunMeta, TradeRecord
+from afts_pro.runlogger.segments import SegmentedParquetFile
 
 logger = logging.getLogger(__name__)
 
+_EQUITY_COLUMNS = tuple(EquityPoint.model_fields)
+
 
 class RunLogger:
     """
     Passive, event-driven run logger that captures equity, trades and config snapshots.
+
+    Equity points are buffered as plain rows and appended to the equity parquet file every
+    `equity_spill_rows` points; drawdown and sharpe-like metrics are aggregated on the fly,
+    so memory stays bounded on full-history runs. checkpoint() seals the equity curve, trades
+    and journal written so far and returns the small remaining state; restore() continues a
+    run from it.
     """
 
     def __init__(self, run_meta: RunMeta, config, project_root_path: Path) -> None:
@@ -32,8 +44,15 @@ class RunLogger:
         self.run_dir = base_dir / run_meta.run_id
         self.run_dir.mkdir(parents=True, exist_ok=True)
         self.trades: List[TradeRecord] = []
-        self.equity_points: List[EquityPoint] = []
+        self._equity_rows: List[Tuple[Any, ...]] = []
+        self._equity_stats = EquityStats()
+        self._equity_file = SegmentedParquetFile(self.run_dir / self._pattern("equity_curve", "equity_curve.parquet"))
+        self._trades_file = SegmentedParquetFile(self.run_dir / self._pattern("trades", "trades.parquet"))
+        self._trades_sealed = 0
+        self._spill_rows = max(int(getattr(config, "equity_spill_rows", 50_000) or 0), 0)
         self._max_equity: float = 0.0
+        self.journal: Optional[EventJournal] = None
+        self._profiler: Optional[Any] = None
         logger.info("RUNLOGGER_INIT | run_id=%s | dir=%s", run_meta.run_id, self.run_dir)
 
     def on_bar_equity_snapshot(
@@ -50,17 +69,50 @@ class RunLogger:
         max_equity = self._max_equity or equity
         dd_abs = max(max_equity - equity, 0.0)
         dd_pct = dd_abs / max_equity if max_equity else 0.0
-        point = EquityPoint(
-            timestamp=bar_ts,
-            equity=equity,
-            balance=balance,
-            unrealized_pnl=unrealized,
-            realized_pnl_cum=realized_cum,
-            max_equity_to_date=max_equity,
-            drawdown_abs=dd_abs,
-            drawdown_pct=dd_pct,
-        )
-        self.equity_points.append(point)
+        # Row order follows EquityPoint's fields.
+        self._equity_rows.append((bar_ts, equity, balance, unrealized, realized_cum, max_equity, dd_abs, dd_pct))
+        self._equity_stats.update(equity)
+        if self._spill_rows and len(self._equity_rows) >= self._spill_rows:
+            self._spill_equity()
+
+    @property
+    def equity_points(self) -> List[EquityPoint]:
+        """
+        Equity points still held in memory (everything since the last spill).
+        """
+        return [EquityPoint(**dict(zip(_EQUITY_COLUMNS, row))) for row in self._equity_rows]
+
+    @property
+    def equity_point_count(self) -> int:
+        return self._equity_stats.points
+
+    def open_journal(self) -> EventJournal:
+        """
+        Per-bar event journal in the run dir; closed by finalize_and_persist.
+        """
+        if self.journal is None:
+            self.journal = EventJournal(
+                self.run_dir / self._pattern("journal", "events.parquet"),
+                batch_size=getattr(self.config, "journal_batch_rows", 10_000),
+            )
+        return self.journal
+
+    def attach_profiler(self, profiler: Any) -> None:
+        """
+        Stop `profiler` (a SamplingProfiler) on finalize and dump its profile into the run dir.
+        """
+        self._profiler = profiler
+
+    def _pattern(self, key: str, default: str) -> str:
+        return self.config.filename_patterns.get(key, default)
+
+    def _spill_equity(self) -> None:
+        rows, self._equity_rows = self._equity_rows, []
+        if not rows or not self.config.include.get("equity_curve", True):
+            return
+        table = pa.Table.from_pandas(pd.DataFrame.from_records(rows, columns=_EQUITY_COLUMNS), preserve_index=False)
+        self._equity_file.write(table)
+        logger.debug("RUNLOGGER_EQUITY_SPILL | run_id=%s | rows=%d", self.run_meta.run_id, len(rows))
 
     def on_trade_close(self, position_event: PositionEvent, ts: datetime, extra_tags: Optional[Dict] = None) -> None:
         if position_event.event_type.upper() != "CLOSED":
@@ -81,7 +133,74 @@ class RunLogger:
         )
         self.trades.append(trade)
 
-    def finalize_and_persist(self, global_config_snapshot: Dict) -> MetricsSnapshot:
+    def checkpoint(self) -> Dict[str, Any]:
+        """
+        Seal everything written so far and return the state restore() needs.
+
+        Only rows added since the previous checkpoint are written (equity points, closed
+        trades, journal events), so frequent checkpoints stay cheap.
+        """
+        self._spill_equity()
+        new_trades = self.trades[self._trades_sealed :]
+        if new_trades:
+            self._trades_file.write(pa.Table.from_pandas(_trades_frame(new_trades), preserve_index=False))
+            self._trades_sealed = len(self.trades)
+        return {
+            "run_meta": self.run_meta.model_dump(),
+            "equity_stats": copy.copy(self._equity_stats),
+            "max_equity": self._max_equity,
+            "equity_segments": self._equity_file.seal(),
+            "trades_segments": self._trades_file.seal(),
+            "trades": self._trades_sealed,
+            "journal": self.journal.checkpoint() if self.journal is not None else None,
+        }
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """
+        Continue from a checkpoint() state: output written after it is dropped.
+        """
+        self._equity_rows = []
+        self._equity_stats = state["equity_stats"]
+        self._max_equity = state["max_equity"]
+        self._equity_file.truncate(state["equity_segments"])
+        self._trades_file.truncate(state["trades_segments"])
+        self.trades = []
+        for table in self._trades_file.read_segments():
+            for row in table.to_pandas().to_dict("records"):
+                row["tags"] = json.loads(row["tags"]) if row.get("tags") else {}
+                self.trades.append(TradeRecord(**row))
+        self._trades_sealed = len(self.trades)
+        if state.get("journal") is not None:
+            self.open_journal().restore(state["journal"])
+        logger.info(
+            "RUNLOGGER_RESTORED | run_id=%s | equity_points=%d | trades=%d",
+            self.run_meta.run_id,
+            self._equity_stats.points,
+            len(self.trades),
+        )
+
+    def reopen(self, state: Dict[str, Any]) -> None:
+        """
+        Continue a finalized run from its end-of-run checkpoint() state, appending to the
+        equity curve, trades and journal it already wrote.
+        """
+        journal_state = state.get("journal")
+        self.restore(
+            {
+                **state,
+                "equity_segments": self._equity_file.reopen(),
+                "trades_segments": self._trades_file.reopen(),
+                "journal": None,
+            }
+        )
+        if journal_state is not None:
+            self.open_journal().reopen(journal_state)
+
+    def finalize_and_persist(
+        self,
+        global_config_snapshot: Dict,
+        throughput: Optional[Dict[str, Any]] = None,
+    ) -> MetricsSnapshot:
         self.run_meta.finished_at = datetime.now(timezone.utc)
         patterns = self.config.filename_patterns
         include_map = self.config.include
@@ -94,23 +213,46 @@ class RunLogger:
 
         if include_map.get("trades", True) and self.trades:
             trades_path = self.run_dir / patterns.get("trades", "trades.parquet")
-            df = pd.DataFrame([t.model_dump() for t in self.trades])
-            df.to_parquet(trades_path, index=False)
+            _trades_frame(self.trades).to_parquet(trades_path, index=False)
+        self._trades_file.discard()
 
-        if include_map.get("equity_curve", True) and self.equity_points:
+        if include_map.get("equity_curve", True) and self._equity_stats.points:
             eq_path = self.run_dir / patterns.get("equity_curve", "equity_curve.parquet")
-            df_eq = pd.DataFrame([p.model_dump() for p in self.equity_points])
-            df_eq.to_parquet(eq_path, index=False)
+            if not self._equity_file.has_data:
+                df_eq = pd.DataFrame.from_records(self._equity_rows, columns=_EQUITY_COLUMNS)
+                df_eq.to_parquet(eq_path, index=False)
+            else:
+                self._spill_equity()
+                self._equity_file.finish()
 
         if include_map.get("positions", False):
             positions_path = self.run_dir / patterns.get("positions", "positions.parquet")
             df_pos = pd.DataFrame([])  # placeholder for future position history
             df_pos.to_parquet(positions_path, index=False)
 
-        metrics = build_metrics_snapshot(self.trades, self.equity_points)
+        if self.journal is not None:
+            self.journal.close()
+
+        if self._profiler is not None:
+            self._profiler.stop()
+            self._profiler.write(self.run_dir, patterns.get("profile", "profile.folded"))
+
+        metrics = build_metrics_snapshot(self.trades, [], equity_stats=self._equity_stats)
         if include_map.get("metrics", True):
             metrics_path = self.run_dir / patterns.get("metrics", "metrics.json")
             with metrics_path.open("w", encoding="utf-8") as fh:
                 json.dump(metrics.model_dump(), fh, indent=2, default=str)
 
+        if throughput is not None and include_map.get("throughput", True):
+            throughput_path = self.run_dir / patterns.get("throughput", "throughput.json")
+            with throughput_path.open("w", encoding="utf-8") as fh:
+                json.dump(throughput, fh, indent=2, default=str)
+
         return metrics
+
+
+def _trades_frame(trades: List[TradeRecord]) -> pd.DataFrame:
+    df = pd.DataFrame([t.model_dump() for t in trades])
+    # Free-form tags as JSON text: parquet cannot store an empty struct.
+    df["tags"] = [json.dumps(tags, default=str) for tags in df["tags"]]
+    return df
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+
+class SegmentedParquetFile:
+    """
+    Parquet output that is appended through a hidden partial file and sealed in segments.
+
+    write() appends a table to the open partial. seal() closes it as the next numbered
+    segment (a complete parquet file), so everything written up to a checkpoint survives a
+    crash. finish() moves a lone partial into place, or concatenates the segments and the
+    open partial into `path`. truncate() drops segments written after a checkpoint before a
+    resumed run appends again; reopen() turns a finished `path` back into a segment.
+    """
+
+    def __init__(self, path: Path, schema: Optional[pa.Schema] = None) -> None:
+        self.path = Path(path)
+        self.schema = schema
+        self.segments = 0
+        self._partial = self.path.with_name(f".{self.path.name}.partial")
+        self._writer: Optional[pq.ParquetWriter] = None
+
+    def segment_path(self, index: int) -> Path:
+        return self.path.with_name(f".{self.path.name}.{index:05d}.seg")
+
+    @property
+    def has_data(self) -> bool:
+        return self._writer is not None or self.segments > 0
+
+    def write(self, table: pa.Table) -> None:
+        if self.schema is None:
+            self.schema = table.schema
+        if self._writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(self._partial, self.schema)
+        self._writer.write_table(table.cast(self.schema))
+
+    def seal(self) -> int:
+        """
+        Close the open partial as the next segment; returns the number of segments.
+        """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            os.replace(self._partial, self.segment_path(self.segments))
+            self.segments += 1
+        return self.segments
+
+    def truncate(self, segments: int) -> None:
+        """
+        Keep the first `segments` segments and drop anything written after them.
+        """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._partial.unlink(missing_ok=True)
+        index = segments
+        while self.segment_path(index).exists():
+            self.segment_path(index).unlink()
+            index += 1
+        self.segments = segments
+        if self.schema is None and segments:
+            self.schema = pq.read_schema(self.segment_path(0))
+
+    def reopen(self) -> int:
+        """
+        Adopt a finished `path` as segment 0 so a continued run appends after it.
+
+        Without `path` a previous continuation stopped early: its segment 0 is kept and
+        anything it appended afterwards is dropped. Returns the number of segments.
+        """
+        if self.path.exists():
+            self.truncate(0)
+            os.replace(self.path, self.segment_path(0))
+        self.truncate(1 if self.segment_path(0).exists() else 0)
+        return self.segments
+
+    def read_segments(self) -> List[pa.Table]:
+        return [pq.read_table(self.segment_path(index)) for index in range(self.segments)]
+
+    def finish(self) -> bool:
+        """
+        Write everything to `path`; False if nothing was ever written.
+        """
+        if self.segments == 0:
+            if self._writer is None:
+                return False
+            self._writer.close()
+            self._writer = None
+            os.replace(self._partial, self.path)
+            return True
+        self.seal()
+        writer = pq.ParquetWriter(self._partial, self.schema)
+        try:
+            for index in range(self.segments):
+                writer.write_table(pq.read_table(self.segment_path(index)).cast(self.schema))
+        finally:
+            writer.close()
+        os.replace(self._partial, self.path)
+        self.discard()
+        logger.debug("SEGMENTS_MERGED | path=%s", self.path)
+        return True
+
+    def discard(self) -> None:
+        """
+        Remove the segments (and any open partial) without writing `path`.
+        """
+        self.truncate(0)
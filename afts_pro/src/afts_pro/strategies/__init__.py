@@ -2,11 +2,7 @@
 Trading strategy definitions.
 """
 
-from .base import BaseStrategy
-from .bridge import StrategyBridge
-from .dummy_ml import DummyMLStrategy
-from .orb import OrbStrategy
-from .registry import StrategyRegistry
+from afts_pro.utils.lazy import lazy_exports
 
 __all__ = [
     "BaseStrategy",
@@ -15,3 +11,15 @@ __all__ = [
     "DummyMLStrategy",
     "StrategyRegistry",
 ]
+
+# Submodules are imported on first attribute access (PEP 562).
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BaseStrategy": ".base",
+        "StrategyBridge": ".bridge",
+        "DummyMLStrategy": ".dummy_ml",
+        "OrbStrategy": ".orb",
+        "StrategyRegistry": ".registry",
+    },
+)
@@ -1,10 +1,13 @@
 import abc
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from afts_pro.core import MarketState, StrategyDecision
 from afts_pro.features.state import FeatureBundle
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from afts_pro.data.bar_store import BarArrays
+
 
 class BaseStrategy(abc.ABC):
     """
@@ -17,3 +20,11 @@ class BaseStrategy(abc.ABC):
     @abc.abstractmethod
     def on_bar(self, market_state: MarketState, features: Optional[FeatureBundle] = None) -> StrategyDecision:
         raise NotImplementedError
+
+    def next_event_index(self, bars: "BarArrays", start: int) -> Optional[int]:
+        """
+        First bar index >= start at which on_bar could change state or return a non-"none"
+        decision, assuming it sees every bar from start on (None: no such bar). The default,
+        start, means "call me on every bar" and disables the SIM fast path.
+        """
+        return start
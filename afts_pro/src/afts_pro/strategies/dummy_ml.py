@@ -22,6 +22,10 @@ class DummyMLStrategy(BaseStrategy):
     def set_prior_decisions(self, decisions: Iterable[StrategyDecision]) -> None:
         self._prior_decisions = list(decisions)
 
+    def next_event_index(self, bars, start: int) -> Optional[int]:
+        # Only "manage" alongside another strategy's entry; the unseeded confidence draw is not state.
+        return None
+
     def on_bar(self, market_state: MarketState, features: Optional[FeatureBundle] = None) -> StrategyDecision:
         has_entry = any(decision.action == "entry" for decision in self._prior_decisions)
         action = "manage" if has_entry else "none"
@@ -4,7 +4,10 @@ from typing import Optional
 
 from typing import Optional
 
+import numpy as np
+
 from afts_pro.core import MarketState, StrategyDecision
+from afts_pro.core.wakeup import DAY_NS, first_true
 from afts_pro.features.state import FeatureBundle
 from afts_pro.strategies.base import BaseStrategy
 
@@ -22,6 +25,27 @@ class OrbStrategy(BaseStrategy):
         self._orb_high: Optional[float] = None
         self._orb_low: Optional[float] = None
 
+    def next_event_index(self, bars, start: int) -> Optional[int]:
+        """
+        Next day change (range reset) or close outside the current opening range.
+        """
+        if bars.symbol != self.symbol:
+            return None
+        if self._current_day is None:
+            return start if start < len(bars) else None
+        current = (self._current_day - date(1970, 1, 1)).days
+        timestamps = bars.timestamp
+        close = bars.close
+        orb_high = self._orb_high if self._orb_high is not None else np.inf
+        orb_low = self._orb_low if self._orb_low is not None else -np.inf
+
+        def triggered(lo: int, hi: int) -> np.ndarray:
+            day = np.asarray(timestamps[lo:hi], dtype=np.int64) // DAY_NS
+            closes = np.asarray(close[lo:hi])
+            return (day != current) | (closes > orb_high) | (closes < orb_low)
+
+        return first_true(triggered, start, len(bars))
+
     def on_bar(self, market_state: MarketState, features: Optional[FeatureBundle] = None) -> StrategyDecision:
         if market_state.symbol != self.symbol:
             return StrategyDecision(action="none", side=None, confidence=0.0)
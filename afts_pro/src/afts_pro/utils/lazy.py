@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    PEP 562 `__getattr__`/`__dir__` pair for a package that re-exports names from submodules.
+
+    `exports` maps each public name to the module defining it (absolute or relative to
+    `package`). The module is imported on first attribute access and the value is cached in
+    the package namespace, so `import afts_pro.config` stays cheap until a name is used.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
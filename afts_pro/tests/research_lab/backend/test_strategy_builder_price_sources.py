@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from afts_pro.data import ParquetFeed
+from research_lab.backend.core.strategy_builder import PriceSourceResolver
+from research_lab.backend.core.strategy_builder.models import StrategyNode
+
+
+def _write_base(root):
+    (root / "final").mkdir()
+    ts = pd.date_range("2024-01-01", periods=3 * 24 * 60, freq="1min", tz="UTC")
+    close = np.linspace(100.0, 110.0, len(ts))
+    pd.DataFrame(
+        {"time": ts.asi8 // 1_000_000, "open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1.0}
+    ).to_parquet(root / "final" / "BTCUSDT.parquet", index=False)
+
+
+def test_htf_price_source_is_resampled_from_base_series(tmp_path) -> None:
+    _write_base(tmp_path)
+    resolver = PriceSourceResolver(ParquetFeed(tmp_path))
+
+    node = StrategyNode(id="htf", type="htf_price_source", params={"symbol": "BTCUSDT", "timeframe": "4H"})
+    df = resolver.load(node)
+    assert len(df) == 18
+    assert df["volume"].iloc[0] == 240
+
+    session = StrategyNode(
+        id="htf_session",
+        type="htf_price_source",
+        params={"symbol": "BTCUSDT", "timeframe": "1D", "session_offset": "17H", "session_tz": "America/New_York"},
+    )
+    daily = resolver.load(session)
+    assert set(daily["timestamp"].dt.tz_convert("America/New_York").dt.hour) == {17}
+
+
+def test_non_source_node_is_rejected(tmp_path) -> None:
+    resolver = PriceSourceResolver(ParquetFeed(tmp_path))
+    with pytest.raises(ValueError):
+        resolver.load(StrategyNode(id="sma", type="indicator_sma", params={"length": 5}))
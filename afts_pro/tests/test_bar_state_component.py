@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from afts_pro.core import BarState, MarketState, to_market_state
+from afts_pro.core.models import OHLCV
+from afts_pro.data import MarketStateBuilder, ParquetFeed
+
+
+def _write_bars(root, rows=5):
+    folder = root / "final_agg"
+    folder.mkdir(parents=True, exist_ok=True)
+    times = 1_700_000_000_000 + np.arange(rows, dtype=np.int64) * 3_600_000
+    pd.DataFrame(
+        {"time": times, "open": 1.0, "high": 2.0, "low": 0.5, "close": np.arange(rows, dtype=float), "volume": 3.0, "symbol": "TEST"}
+    ).to_parquet(folder / "TEST_1H.parquet", index=False)
+
+
+def test_bar_state_mirrors_market_state():
+    ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    bar = BarState(ts, "EURUSD", ohlcv=OHLCV(open=1.0, high=2.0, low=0.5, close=1.5, volume=10.0))
+    model = MarketState(timestamp=ts, symbol="EURUSD", ohlcv=OHLCV(open=1.0, high=2.0, low=0.5, close=1.5, volume=10.0))
+
+    assert (bar.open, bar.high, bar.low, bar.close, bar.volume) == (1.0, 2.0, 0.5, 1.5, 10.0)
+    assert bar.to_model() == model
+    assert bar == model
+    assert BarState.from_model(model) == bar
+    assert to_market_state(bar) == model and to_market_state(model) is model
+
+    bar.features["atr"] = 1.2
+    assert bar.to_model().features == {"atr": 1.2}
+    with pytest.raises(AttributeError):
+        bar.unknown = 1
+
+
+@pytest.mark.parametrize("use_bar_store", [False, True])
+def test_builder_lightweight_states_match_models(tmp_path, use_bar_store):
+    _write_bars(tmp_path)
+    builder = MarketStateBuilder(ParquetFeed(tmp_path, use_bar_store=use_bar_store))
+
+    models = list(builder.iter_market_states("TEST_1H"))
+    light = list(builder.iter_market_states("TEST_1H", lightweight=True))
+    assert all(isinstance(s, BarState) for s in light)
+    assert [s.to_model() for s in light] == models
@@ -0,0 +1,61 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from afts_pro.data import MarketStateBuilder, ParquetFeed
+
+
+def _write_bars(root, name="TEST_1H", rows=6):
+    folder = root / "final_agg"
+    folder.mkdir(parents=True, exist_ok=True)
+    times = 1_700_000_000_000 + np.arange(rows, dtype=np.int64) * 3_600_000
+    df = pd.DataFrame(
+        {
+            "time": times[::-1],
+            "open": np.arange(rows, dtype=float)[::-1] + 1.0,
+            "high": np.arange(rows, dtype=float)[::-1] + 2.0,
+            "low": np.arange(rows, dtype=float)[::-1],
+            "close": np.arange(rows, dtype=float)[::-1] + 1.5,
+            "volume": np.full(rows, 10.0),
+            "symbol": "TEST",
+        }
+    )
+    path = folder / f"{name}.parquet"
+    df.to_parquet(path, index=False)
+    return path
+
+
+def test_load_bars_writes_memory_mapped_store(tmp_path):
+    _write_bars(tmp_path)
+    feed = ParquetFeed(tmp_path, use_bar_store=True)
+
+    bars = feed.load_bars("TEST_1H")
+    assert isinstance(bars.close, np.memmap)
+    assert bars.timestamp.dtype == np.int64
+    assert np.all(np.diff(bars.timestamp) > 0)
+    assert bars.symbol == "TEST"
+    assert (tmp_path / ".bar_store" / "final_agg" / "TEST_1H" / "meta.json").exists()
+
+    reopened = feed.load_bars("TEST_1H")
+    np.testing.assert_array_equal(reopened.close, bars.close)
+
+
+def test_bar_store_rebuilds_when_source_changes(tmp_path):
+    path = _write_bars(tmp_path, rows=4)
+    feed = ParquetFeed(tmp_path, use_bar_store=True)
+    assert len(feed.load_bars("TEST_1H")) == 4
+
+    _write_bars(tmp_path, rows=7)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert len(feed.load_bars("TEST_1H")) == 7
+
+
+def test_builder_yields_same_states_from_store_and_frame(tmp_path):
+    _write_bars(tmp_path)
+    legacy = list(MarketStateBuilder(ParquetFeed(tmp_path)).iter_market_states("TEST_1H"))
+    stored = list(MarketStateBuilder(ParquetFeed(tmp_path, use_bar_store=True)).iter_market_states("TEST_1H"))
+
+    assert [s.model_dump() for s in stored] == [s.model_dump() for s in legacy]
+    assert stored[0].timestamp.tzinfo is not None
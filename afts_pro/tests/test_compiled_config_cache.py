@@ -0,0 +1,63 @@
+import shutil
+
+import yaml
+
+from afts_pro.config.compiled_cache import CompiledConfigCache
+from afts_pro.config.global_config import CONFIG_ROOT, _build_global_config_from_profile
+
+INCLUDES = {
+    "environment": "environment.yaml",
+    "execution": "execution.yaml",
+    "assets": "assets.yaml",
+    "strategy": "strategy.yaml",
+    "risk": "risk/risk.yaml",
+    "behaviour": "behaviour/default.yaml",
+    "features": "features.yaml",
+    "extras": "extras.yaml",
+    "runlogger": "runlogger.yaml",
+}
+
+
+def _profile(tmp_path):
+    env_path = tmp_path / "environment.yaml"
+    shutil.copy(CONFIG_ROOT / "environment.yaml", env_path)
+    includes = {name: str(CONFIG_ROOT / rel) for name, rel in INCLUDES.items()}
+    includes["environment"] = str(env_path)
+    profile_path = tmp_path / "profile.yaml"
+    profile_path.write_text(yaml.safe_dump({"profile": {"name": "cache_test", "includes": includes}}))
+    return profile_path, env_path
+
+
+def test_hit_returns_equal_independent_config(tmp_path):
+    profile_path, _ = _profile(tmp_path)
+    cache = CompiledConfigCache(tmp_path / "cache")
+
+    first = cache.load(str(profile_path), _build_global_config_from_profile)
+    second = cache.load(str(profile_path), _build_global_config_from_profile)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert second == first and second is not first
+    assert second == _build_global_config_from_profile(str(profile_path))
+
+
+def test_edited_include_invalidates_entry(tmp_path):
+    profile_path, env_path = _profile(tmp_path)
+    cache = CompiledConfigCache(tmp_path / "cache")
+    before = cache.load(str(profile_path), _build_global_config_from_profile)
+
+    data = yaml.safe_load(env_path.read_text())
+    data["environment"]["config_hot_reload_poll_interval_s"] = before.environment.config_hot_reload_poll_interval_s + 4.0
+    env_path.write_text(yaml.safe_dump(data))
+    after = cache.load(str(profile_path), _build_global_config_from_profile)
+
+    assert cache.misses == 2
+    assert after.environment.config_hot_reload_poll_interval_s == before.environment.config_hot_reload_poll_interval_s + 4.0
+
+
+def test_entry_is_shared_across_cache_instances(tmp_path):
+    profile_path, _ = _profile(tmp_path)
+    expected = CompiledConfigCache(tmp_path / "cache").load(str(profile_path), _build_global_config_from_profile)
+
+    fresh = CompiledConfigCache(tmp_path / "cache")
+    assert fresh.load(str(profile_path), _build_global_config_from_profile) == expected
+    assert (fresh.hits, fresh.misses) == (1, 0)
@@ -0,0 +1,87 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from afts_pro.config import ConfigWatcher, load_global_config_from_profile, reload_config_sections
+from afts_pro.engine.engine import apply_config_changes
+
+PROFILE = Path(__file__).resolve().parents[1] / "configs" / "profiles" / "sim.yaml"
+
+
+def _wait_pending(watcher, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not watcher.pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return watcher.pending
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_watcher_flags_changed_files(tmp_path, use_inotify):
+    watched = tmp_path / "execution.yaml"
+    other = tmp_path / "notes.txt"
+    watched.write_text("a: 1\n")
+    with ConfigWatcher([watched], poll_interval_s=0.05, use_inotify=use_inotify) as watcher:
+        other.write_text("ignored")
+        time.sleep(0.2)
+        assert not watcher.pending
+
+        # Replace by rename, the way editors and deploy tools write files.
+        staged = tmp_path / ".execution.yaml.tmp"
+        staged.write_text("a: 2\nb: 3\n")
+        staged.replace(watched)
+        assert _wait_pending(watcher)
+        assert watcher.drain() == {watched.resolve()}
+        assert not watcher.pending
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_watcher_posts_once_writes_settle(tmp_path, use_inotify):
+    watched = tmp_path / "execution.yaml"
+    watched.write_text("a: 1\n")
+    with ConfigWatcher([watched], poll_interval_s=0.02, use_inotify=use_inotify, debounce_s=0.3) as watcher:
+        for i in range(5):
+            watched.write_text("a: 1\n" + "b: 2\n" * (i + 1))
+            time.sleep(0.1)
+            assert not watcher.pending
+        assert _wait_pending(watcher)
+        assert watcher.drain() == {watched.resolve()}
+        time.sleep(0.4)
+        assert not watcher.pending
+
+
+def test_reload_reparses_only_changed_sections():
+    config = load_global_config_from_profile(str(PROFILE))
+
+    unchanged, sections = reload_config_sections(config, [PROFILE.parent / "does_not_exist.yaml"])
+    assert unchanged is config and sections == set()
+
+    reloaded, sections = reload_config_sections(config, [Path(config.source_paths["execution"])])
+    assert sections == {"execution"}
+    assert reloaded.execution is not config.execution and reloaded.execution == config.execution
+    for name in ("environment", "assets", "strategy", "risk", "behaviour", "features", "extras", "runlogger"):
+        assert getattr(reloaded, name) is getattr(config, name)
+
+    _, sections = reload_config_sections(config, [PROFILE])
+    assert {"execution", "strategy", "behaviour"} <= sections
+
+
+def test_failed_reload_keeps_previous_config(tmp_path):
+    broken = tmp_path / "execution.yaml"
+    broken.write_text("execution: {taker_fee_pct: [unclosed\n")
+    base = load_global_config_from_profile(str(PROFILE))
+    config = base.model_copy(update={"source_paths": {**base.source_paths, "execution": str(broken)}})
+    fill_engine, bridge = object(), object()
+
+    reload = apply_config_changes(
+        {broken},
+        global_config=config,
+        behaviour_manager=None,
+        strategies=[],
+        fill_engine=fill_engine,
+        bridge=bridge,
+        symbol="TEST",
+        account_state=None,
+    )
+    assert reload.global_config is config and reload.sections == set()
+    assert reload.fill_engine is fill_engine and reload.bridge is bridge and not reload.reset_watcher
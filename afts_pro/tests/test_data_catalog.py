@@ -0,0 +1,97 @@
+import json
+import os
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+from afts_pro.config.validator import validate_assets
+from afts_pro.data import DataCatalog, ParquetFeed
+from afts_pro.data.catalog import window_rows
+
+
+def _write(path, hours, symbol="EURUSD"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    times = 1_700_000_000_000 + np.asarray(hours, dtype=np.int64) * 3_600_000
+    n = len(hours)
+    pd.DataFrame(
+        {"time": times, "open": np.ones(n), "high": np.ones(n), "low": np.ones(n), "close": np.ones(n), "volume": np.ones(n), "symbol": symbol}
+    ).to_parquet(path, index=False, row_group_size=4)
+
+
+def test_catalog_indexes_footers(tmp_path):
+    _write(tmp_path / "final_agg" / "EURUSD_1H.parquet", range(10))
+    _write(tmp_path / "final" / "BTCUSDT.parquet", range(3), symbol="BTCUSDT")
+    _write(tmp_path / ".bar_store" / "ignored.parquet", range(3))
+
+    catalog = DataCatalog(tmp_path).refresh()
+    assert [e.path for e in catalog.entries()] == ["final/BTCUSDT.parquet", "final_agg/EURUSD_1H.parquet"]
+
+    entry = catalog.lookup("EURUSD_1H")
+    assert (entry.symbol, entry.timeframe, entry.rows) == ("EURUSD", "1H", 10)
+    assert [rg.rows for rg in entry.row_groups] == [4, 4, 2]
+    assert entry.first_ts == pd.Timestamp(1_700_000_000_000, unit="ms", tz="UTC")
+    assert entry.last_ts == pd.Timestamp(1_700_000_000_000 + 9 * 3_600_000, unit="ms", tz="UTC")
+    assert "close" in entry.columns and len(entry.content_hash) == 32
+    assert catalog.find(symbol="BTCUSDT")[0].timeframe is None
+
+    start = pd.Timestamp(1_700_000_000_000 + 5 * 3_600_000, unit="ms", tz="UTC")
+    assert window_rows(entry, start=start) == 6
+
+    payload = json.loads((tmp_path / ".catalog.json").read_text())
+    assert len(payload["entries"]) == 2
+
+
+def test_catalog_refresh_is_incremental(tmp_path, monkeypatch):
+    path = tmp_path / "final_agg" / "EURUSD_1H.parquet"
+    _write(path, range(4))
+    _write(tmp_path / "final_agg" / "GBPUSD_1H.parquet", range(4), symbol="GBPUSD")
+    DataCatalog(tmp_path).refresh()
+
+    from afts_pro.data import catalog as catalog_module
+
+    described = []
+    original = catalog_module._describe
+    monkeypatch.setattr(catalog_module, "_describe", lambda *a: described.append(a[1]) or original(*a))
+
+    reopened = DataCatalog(tmp_path).refresh()
+    assert described == []
+
+    _write(path, range(6))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    (tmp_path / "final_agg" / "GBPUSD_1H.parquet").unlink()
+    reopened.refresh()
+    assert described == ["final_agg/EURUSD_1H.parquet"]
+    assert [e.name for e in reopened.entries()] == ["EURUSD_1H"]
+    assert reopened.lookup("EURUSD_1H").rows == 6
+
+
+def test_feed_reads_columns_from_catalog(tmp_path, monkeypatch):
+    _write(tmp_path / "final_agg" / "EURUSD_1H.parquet", range(4))
+    feed = ParquetFeed(tmp_path, catalog=DataCatalog(tmp_path).refresh())
+
+    import pyarrow.parquet as pq
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("schema should come from the catalog")
+
+    monkeypatch.setattr(pq, "read_schema", _fail)
+    assert "timestamp" in feed.available_columns("EURUSD_1H")
+
+
+def test_validate_assets_uses_persisted_catalog_without_refresh(tmp_path, monkeypatch):
+    indexed = tmp_path / "final_agg" / "EURUSD_1H.parquet"
+    _write(indexed, range(4))
+    _write(tmp_path / "final_agg" / "USDJPY_1H.parquet", range(4), symbol="USDJPY")
+    DataCatalog(tmp_path).refresh()
+    indexed.unlink()
+    _write(tmp_path / "final_agg" / "GBPUSD_1H.parquet", range(4), symbol="GBPUSD")
+
+    from afts_pro.data import catalog as catalog_module
+
+    monkeypatch.setattr(catalog_module, "_describe", None)  # any footer read or hash would fail
+    config = SimpleNamespace(assets=SimpleNamespace(assets=dict.fromkeys(["EURUSD", "GBPUSD", "USDJPY"])))
+    messages = validate_assets(config, tmp_path / "final_agg", catalog=DataCatalog(tmp_path))
+    # The stale entry for the deleted file does not count; the unindexed new file does.
+    assert len(messages) == 1 and "symbol=EURUSD" in messages[0]
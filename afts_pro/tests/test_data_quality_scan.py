@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+
+from afts_pro.data import BarArrays, ParquetFeed
+from afts_pro.data import quality as quality_module
+from afts_pro.data.quality import scan_bars
+
+HOUR_NS = 3_600 * 10**9
+
+
+def _bars(hours, high=None, low=None):
+    n = len(hours)
+    return BarArrays(
+        symbol="TEST",
+        timestamp=np.asarray(hours, dtype=np.int64) * HOUR_NS,
+        open=np.full(n, 1.0),
+        high=np.full(n, 2.0) if high is None else np.asarray(high, dtype=float),
+        low=np.full(n, 0.5) if low is None else np.asarray(low, dtype=float),
+        close=np.full(n, 1.5),
+        volume=np.ones(n),
+    )
+
+
+def test_clean_series_passes():
+    report = scan_bars(_bars(range(10)), timeframe="1H")
+    assert report.sequence_ok and report.values_ok
+    assert report.gaps == 0 and report.zero_range == 0
+
+
+def test_scan_reports_each_defect():
+    hours = [0, 1, 1, 0, 5, 6]
+    high = [2.0, 2.0, 2.0, 2.0, 1.0, np.nan]
+    low = [0.5, 0.5, 0.5, 2.0, 0.5, 0.5]
+    report = scan_bars(_bars(hours, high=high, low=low), timeframe="1H")
+
+    assert not report.sequence_ok
+    assert report.duplicates == 1 and report.first_duplicates == [2]
+    assert report.unordered == 1 and report.first_unordered == [3]
+    assert report.gaps == 1 and report.first_gaps == [(0, 5 * HOUR_NS)]
+    assert report.largest_gap_ns == 5 * HOUR_NS
+    # Row 3 is zero-range below its open, row 4 has high < low.
+    assert report.ohlc_violations == 2 and report.first_ohlc_violations == [3, 4]
+    assert report.zero_range == 1
+    assert report.nan_rows == 1
+
+
+def test_report_is_cached_with_bar_store(tmp_path, monkeypatch):
+    folder = tmp_path / "final_agg"
+    folder.mkdir()
+    times = 1_700_000_000_000 + np.arange(5, dtype=np.int64) * 3_600_000
+    pd.DataFrame(
+        {"time": times, "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 1.0}
+    ).to_parquet(folder / "TEST_1H.parquet", index=False)
+
+    feed = ParquetFeed(tmp_path, use_bar_store=True)
+    report = feed.quality_report("TEST_1H")
+    assert report.sequence_ok and report.expected_step_ns == HOUR_NS
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("cached report should be reused")
+
+    monkeypatch.setattr(quality_module, "scan_bars", _fail)
+    from afts_pro.data import parquet_feed
+
+    monkeypatch.setattr(parquet_feed, "scan_bars", _fail)
+    assert ParquetFeed(tmp_path, use_bar_store=True).quality_report("TEST_1H") == report
@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta, timezone
+
+import pyarrow.parquet as pq
+
+from afts_pro.runlogger import EventJournal, read_journal
+from afts_pro.runlogger.journal import format_event
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _fill(journal, bars=5):
+    for bar in range(bars):
+        ts = START + timedelta(hours=bar)
+        journal.record("BAR", bar, ts, "TEST", close=1.0 + bar)
+        journal.record("RISK", bar, ts, "TEST", allow_new_orders=bar != 3, reason=None)
+        if bar == 2:
+            journal.record("DECISION", bar, ts, "TEST", action="entry", side="long", meta={"orb": {"range": 0.5}})
+
+
+def test_journal_writes_batched_row_groups(tmp_path):
+    path = tmp_path / "events.parquet"
+    journal = EventJournal(path, batch_size=4)
+    _fill(journal)
+    assert not path.exists()
+    journal.close()
+
+    assert len(journal) == 11
+    assert pq.ParquetFile(path).metadata.num_row_groups == 3
+    assert not list(tmp_path.glob(".*.partial"))
+
+
+def test_read_journal_filters_and_decodes(tmp_path):
+    path = tmp_path / "events.parquet"
+    journal = EventJournal(path)
+    _fill(journal)
+    journal.close()
+
+    df = read_journal(path, events=["risk", "decision"], start_bar=2, end_bar=3)
+    assert df["event"].tolist() == ["RISK", "DECISION", "RISK"]
+    assert df["timestamp"].iloc[0] == START + timedelta(hours=2)
+    assert df["data"].iloc[1] == {"action": "entry", "side": "long", "meta": {"orb": {"range": 0.5}}}
+    assert df["data"].iloc[2]["allow_new_orders"] is False
+
+    line = format_event(next(df.itertuples(index=False)))
+    assert line.startswith("2 | 2024-01-01T02:00:00+00:00 | RISK | TEST")
+
+
+def test_empty_journal_writes_nothing(tmp_path):
+    path = tmp_path / "events.parquet"
+    journal = EventJournal(path)
+    journal.close()
+    assert not path.exists()
@@ -0,0 +1,111 @@
+import os
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from afts_pro.config.extras_config import ExtraDatasetConfig, ExtrasConfig
+from afts_pro.config.feature_config import FeatureConfig
+from afts_pro.core import MarketState
+from afts_pro.data import ExtrasLoader, clear_extras_cache
+from afts_pro.data import extras_loader as extras_module
+from afts_pro.features import FeatureEngine
+
+
+def _config(tmp_path, names=("funding", "oi")):
+    datasets = [
+        ExtraDatasetConfig(
+            name=name,
+            dataset_type=name,
+            final_file_template="{symbol}_{dataset}.parquet",
+            value_columns=["value"],
+        )
+        for name in names
+    ]
+    return ExtrasConfig(enabled=True, base_dir=str(tmp_path), datasets=datasets)
+
+
+def _write(tmp_path, symbol, dataset, values):
+    folder = tmp_path / "final" / "extras"
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / f"{symbol}_{dataset}.parquet"
+    times = 1_700_000_000_000 + pd.RangeIndex(len(values)) * 3_600_000
+    pd.DataFrame({"time": times[::-1], "value": values[::-1]}).to_parquet(path, index=False)
+    return path
+
+
+def _count_reads(monkeypatch):
+    calls = []
+    original = extras_module._read_frame
+
+    def counting(path, ds_cfg, ts_col):
+        calls.append(ds_cfg.name)
+        return original(path, ds_cfg, ts_col)
+
+    monkeypatch.setattr(extras_module, "_read_frame", counting)
+    return calls
+
+
+def test_datasets_are_read_on_first_access_only(tmp_path, monkeypatch):
+    clear_extras_cache()
+    _write(tmp_path, "TEST", "funding", [0.1, 0.2, 0.3])
+    _write(tmp_path, "TEST", "oi", [1.0, 2.0])
+    calls = _count_reads(monkeypatch)
+
+    extras = ExtrasLoader(_config(tmp_path)).load_for_symbol("TEST")
+    assert sorted(extras) == ["funding", "oi"]
+    assert calls == []
+
+    funding = extras["funding"].df
+    assert calls == ["funding"]
+    assert list(funding.columns) == ["timestamp", "value"]
+    assert funding["value"].tolist() == [0.1, 0.2, 0.3]
+
+    assert sorted(extras.load_all()) == ["funding", "oi"]
+    assert sorted(calls) == ["funding", "oi"]
+
+
+def test_frames_are_cached_per_file_mtime(tmp_path, monkeypatch):
+    clear_extras_cache()
+    path = _write(tmp_path, "TEST", "funding", [0.1, 0.2])
+    calls = _count_reads(monkeypatch)
+    loader = ExtrasLoader(_config(tmp_path, names=("funding",)))
+
+    first = loader.load_for_symbol("TEST")["funding"].df
+    second = loader.load_for_symbol("TEST")["funding"].df
+    assert first is second
+    assert calls == ["funding"]
+
+    _write(tmp_path, "TEST", "funding", [0.5, 0.6, 0.7])
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert len(loader.load_for_symbol("TEST")["funding"].df) == 3
+    assert calls == ["funding", "funding"]
+
+
+def test_unreadable_dataset_is_dropped(tmp_path):
+    clear_extras_cache()
+    folder = tmp_path / "final" / "extras"
+    folder.mkdir(parents=True)
+    pd.DataFrame({"value": [1.0]}).to_parquet(folder / "TEST_funding.parquet", index=False)
+    _write(tmp_path, "TEST", "oi", [1.0])
+
+    extras = ExtrasLoader(_config(tmp_path)).load_for_symbol("TEST")
+    assert dict(extras.items()).keys() == {"oi"}
+    assert "funding" not in extras
+    assert len(extras) == 1
+
+
+def test_feature_engine_without_declarations_gets_every_dataset(tmp_path, monkeypatch):
+    clear_extras_cache()
+    _write(tmp_path, "TEST", "funding", [0.1, 0.2, 0.3])
+    _write(tmp_path, "TEST", "oi", [1.0, 2.0])
+    calls = _count_reads(monkeypatch)
+
+    engine = FeatureEngine(FeatureConfig(enabled=True))
+    engine.attach_extras(ExtrasLoader(_config(tmp_path)).load_for_symbol("TEST"))
+    assert calls == []
+
+    bar = MarketState(timestamp=datetime.fromtimestamp(1_700_000_000 + 3_600, tz=timezone.utc), symbol="TEST", close=1.0)
+    bundle = engine.update(bar)
+    assert sorted(calls) == ["funding", "oi"]
+    assert bundle.extras.values == {"funding": {"value": 0.2}, "oi": {"value": 2.0}}
@@ -0,0 +1,125 @@
+import copy
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from afts_pro.config.feature_config import FeatureConfig
+from afts_pro.core.strategy_orb import ORBConfig, ORBStrategy, SessionConfig
+from afts_pro.data.bar_store import BarArrays
+from afts_pro.data.market_state_builder import MarketStateBuilder
+from afts_pro.exec import AccountState, Order, OrderSide, OrderType, SimFillEngine
+from afts_pro.features import FeatureEngine
+from afts_pro.behaviour import BehaviourManager
+from afts_pro.behaviour.guards import CooldownAfterLossGuard, MaxTradesPerDayGuard
+from afts_pro.strategies import OrbStrategy
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _bars(n=200, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.001, n))
+    spread = np.abs(rng.normal(0, 0.0008, n))
+    timestamps = pd.date_range(T0, periods=n, freq="37min").asi8
+    return BarArrays(
+        symbol="TEST",
+        timestamp=timestamps,
+        open=close,
+        high=close + spread,
+        low=close - spread,
+        close=close,
+        volume=np.ones(n),
+    )
+
+
+def _states(bars):
+    return list(MarketStateBuilder(None).iter_bar_arrays(bars, lightweight=True))
+
+
+def _account():
+    return AccountState(balance=1000.0, equity=1000.0, realized_pnl=0.0, unrealized_pnl=0.0, fees_total=0.0)
+
+
+def _brute_force_strategy_event(strategy, states, start):
+    probe = copy.deepcopy(strategy)
+    for idx in range(start, len(states)):
+        day_before = getattr(probe, "_current_day", None)
+        decision = probe.on_bar(states[idx])
+        if decision.action != "none" or getattr(probe, "_current_day", None) != day_before:
+            return idx
+    return None
+
+
+def test_orb_next_event_index_matches_bar_by_bar():
+    bars = _bars()
+    states = _states(bars)
+    strategy = OrbStrategy(symbol="TEST")
+    for idx, state in enumerate(states):
+        expected = _brute_force_strategy_event(strategy, states, idx)
+        assert strategy.next_event_index(bars, idx) == expected
+        strategy.on_bar(state)
+    assert OrbStrategy(symbol="OTHER").next_event_index(bars, 0) is None
+
+
+def test_session_orb_next_event_index_is_next_in_session_bar():
+    bars = _bars()
+    states = _states(bars)
+    cfg = ORBConfig(range_minutes=15, min_range_pips=0.5, breakout_buffer_pips=0.1, max_entries_per_day=1)
+    strategy = ORBStrategy(cfg, SessionConfig(session_start="08:00", session_end="10:00"), symbol="TEST")
+    for start in (0, 5, 40, 120):
+        expected = next(i for i in range(start, len(states)) if strategy.session.contains(states[i].timestamp))
+        assert strategy.next_event_index(bars, start) == expected
+
+
+def test_next_fill_index_matches_process_bar():
+    bars = _bars()
+    states = _states(bars)
+    engine = SimFillEngine()
+    mid = float(bars.close[0])
+    orders = [
+        Order(id="lim", symbol="TEST", side=OrderSide.BUY, type=OrderType.LIMIT, qty=1.0, price=mid - 0.004, created_at=T0, updated_at=T0),
+        Order(id="stp", symbol="TEST", side=OrderSide.SELL, type=OrderType.STOP_MARKET, qty=1.0, stop_price=mid - 0.006, created_at=T0, updated_at=T0),
+        Order(id="tp", symbol="TEST", side=OrderSide.SELL, type=OrderType.LIMIT, qty=1.0, price=mid, reduce_only=True, created_at=T0, updated_at=T0),
+    ]
+    for start in (1, 10, 50):
+        expected = None
+        for idx in range(start, len(states)):
+            book = {o.id: o.model_copy() for o in orders}
+            if engine.process_bar(account_state=_account(), open_orders=book, market_state=states[idx], last_bar=states[idx - 1]):
+                expected = idx
+                break
+        assert engine.next_fill_index(orders, bars, start) == expected
+
+    market = Order(id="mkt", symbol="TEST", side=OrderSide.BUY, type=OrderType.MARKET, qty=1.0, created_at=T0, updated_at=T0)
+    assert engine.next_fill_index([market], bars, 3) == 3
+
+
+def test_guard_wakeups():
+    account = _account()
+    manager = BehaviourManager(guards=[MaxTradesPerDayGuard(max_trades_per_day=1), CooldownAfterLossGuard(cooldown_minutes=90)])
+    ts = T0 + timedelta(hours=10)
+    assert manager.next_wakeup(ts, account) is None
+
+    manager.on_trade_closed(trade_pnl=-5.0, ts=ts, account_state=account)
+    manager.stats.trades_closed_today = 1
+    # Cooldown ends first; the daily trade cap lifts at midnight.
+    assert manager.next_wakeup(ts, account) == ts + timedelta(minutes=90)
+    later = ts + timedelta(hours=2)
+    assert manager.next_wakeup(later, account) == datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+
+def test_feature_update_batch_matches_per_bar_updates():
+    states = _states(_bars(n=60))
+    cfg = FeatureConfig(
+        raw_features=[
+            {"name": "ret", "calculator": "close_return", "params": {"lookback": 3}},
+            {"name": "trend", "calculator": "trend_score", "params": {"lookback": 10}},
+            {"name": "atr", "calculator": "atr", "params": {"period": 5}},
+        ]
+    )
+    stepped, batched = FeatureEngine(cfg), FeatureEngine(cfg)
+    for state in states:
+        expected = stepped.update(state)
+    batched.update_batch(states[:-1])
+    assert batched.update(states[-1]).raw.values == expected.raw.values
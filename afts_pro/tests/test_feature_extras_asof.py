@@ -0,0 +1,129 @@
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from afts_pro.config.feature_config import FeatureConfig
+from afts_pro.core import MarketState
+from afts_pro.data.extras_loader import ExtrasSeries
+from afts_pro.features import FeatureEngine
+from afts_pro.features.base_calculator import BaseFeatureCalculator
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class FundingCalculator(BaseFeatureCalculator):
+    extras_datasets = ("funding",)
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.value = None
+
+    def update(self, bar, extras=None) -> None:
+        self.value = extras.get_dataset("funding").get("funding_rate") if extras else None
+
+    def current_value(self):
+        return self.value
+
+
+class RecordingExtras(Mapping):
+    """Extras mapping that records which datasets were read."""
+
+    def __init__(self, series):
+        self.series = series
+        self.read = []
+
+    def __getitem__(self, name):
+        self.read.append(name)
+        return self.series[name]
+
+    def __iter__(self):
+        return iter(self.series)
+
+    def __len__(self):
+        return len(self.series)
+
+    def __contains__(self, name):
+        return name in self.series
+
+
+def _bars(n=6):
+    return [
+        MarketState(timestamp=T0 + timedelta(hours=i), symbol="TEST", open=1.0, high=1.0, low=1.0, close=1.0, volume=1.0)
+        for i in range(n)
+    ]
+
+
+def _engine():
+    engine = FeatureEngine(FeatureConfig(enabled=True))
+    engine.calculators["funding"] = FundingCalculator("funding")
+    return engine
+
+
+def _extras():
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime([T0 + timedelta(minutes=30), T0 + timedelta(hours=3)], utc=True),
+            "funding_rate": [0.1, 0.3],
+            "symbol": ["TEST", "TEST"],
+        }
+    )
+    oi = pd.DataFrame({"timestamp": df["timestamp"], "open_interest": [5.0, 6.0], "symbol": ["TEST", "TEST"]})
+    return {
+        "funding": ExtrasSeries(symbol="TEST", dataset="funding", df=df),
+        "oi": ExtrasSeries(symbol="TEST", dataset="oi", df=oi),
+    }
+
+
+def _funding_path(engine, bars):
+    out = []
+    for bar in bars:
+        bundle = engine.update(bar)
+        out.append(bundle.extras.get_dataset("funding").get("funding_rate") if bundle.extras else None)
+    return out
+
+
+def test_extras_asof_join_is_lookahead_safe():
+    engine = _engine()
+    engine.attach_extras(_extras())
+    assert _funding_path(engine, _bars()) == [None, 0.1, 0.1, 0.3, 0.3, 0.3]
+
+
+def test_prealigned_extras_match_per_bar_search():
+    bars = _bars()
+    timeline = np.array([pd.Timestamp(b.timestamp).value for b in bars], dtype=np.int64)
+    engine = _engine()
+    engine.attach_extras(_extras(), bar_timestamps=timeline)
+
+    assert engine.attached_extras == ["funding"]
+    assert engine._aligned["funding"].bar_rows.tolist() == [-1, 0, 0, 1, 1, 1]
+    assert engine._aligned["funding"].columns == ["funding_rate"]
+    assert _funding_path(engine, bars) == [None, 0.1, 0.1, 0.3, 0.3, 0.3]
+    # A bar off the pre-aligned timeline still resolves through the extras timestamps.
+    late = MarketState(timestamp=T0 + timedelta(hours=10), symbol="TEST", close=1.0)
+    assert engine.update(late).extras.get_dataset("funding") == {"funding_rate": 0.3}
+
+
+def test_only_declared_extras_are_read_and_aligned():
+    extras = RecordingExtras(_extras())
+    engine = _engine()
+    engine.attach_extras(extras)
+    assert extras.read == []  # nothing is read before the first bar
+
+    bundle = engine.update(_bars()[2])
+    assert extras.read == ["funding"]
+    assert engine.attached_extras == ["funding"]
+    assert bundle.raw.values["funding"] == 0.1
+    assert set(bundle.extras.values) == {"funding"}
+
+
+def test_undeclared_extras_attach_every_dataset():
+    extras = RecordingExtras(_extras())
+    engine = FeatureEngine(FeatureConfig(enabled=True))
+    engine.attach_extras(extras)
+
+    bundle = engine.update(_bars()[3])
+    assert sorted(extras.read) == ["funding", "oi"]
+    assert bundle.extras.values["funding"]["funding_rate"] == 0.3
+    assert bundle.extras.values["oi"]["open_interest"] == 6.0
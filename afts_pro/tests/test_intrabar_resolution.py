@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from afts_pro.core import MarketState
+from afts_pro.data.bar_store import BarArrays
+from afts_pro.exec import AccountState, Order, OrderSide, OrderType, Position, PositionSide, SimFillEngine
+from afts_pro.exec.intrabar import IntrabarResolver
+
+T0 = datetime(2024, 1, 1, 10, tzinfo=timezone.utc)
+HOUR_NS = 3_600_000_000_000
+
+
+def _fine(highs, lows):
+    n = len(highs)
+    return BarArrays(
+        symbol="TEST",
+        timestamp=pd.date_range(T0, periods=n, freq="15min").asi8,
+        open=np.full(n, 100.0),
+        high=np.asarray(highs, dtype=float),
+        low=np.asarray(lows, dtype=float),
+        close=np.full(n, 100.0),
+        volume=np.ones(n),
+    )
+
+
+def _bracket_account(oco_group="bracket"):
+    position = Position(symbol="TEST", side=PositionSide.LONG, qty=1.0, entry_price=100.0, realized_pnl=0.0, unrealized_pnl=0.0, avg_entry_fees=0.0)
+    account = AccountState(balance=1000.0, equity=1000.0, realized_pnl=0.0, unrealized_pnl=0.0, fees_total=0.0, positions={"TEST": position})
+    common = dict(symbol="TEST", side=OrderSide.SELL, qty=1.0, reduce_only=True, oco_group=oco_group, created_at=T0, updated_at=T0)
+    account.open_orders.add(Order(id="sl", type=OrderType.STOP_MARKET, stop_price=98.0, is_sl=True, **common))
+    account.open_orders.add(Order(id="tp", type=OrderType.LIMIT, price=102.0, is_tp=True, **common))
+    return account
+
+
+def _hour_bar():
+    # The 1H bar spans both the SL and the TP.
+    return MarketState(timestamp=T0, symbol="TEST", open=100.0, high=102.5, low=97.5, close=100.0, volume=1.0)
+
+
+def _prev_bar():
+    return MarketState(timestamp=T0 - timedelta(hours=1), symbol="TEST", open=100.0, high=100.5, low=99.5, close=100.0, volume=1.0)
+
+
+def test_single_bar_logic_fills_first_resting_order():
+    account = _bracket_account()
+    fills = SimFillEngine().process_bar(account_state=account, open_orders=account.open_orders, market_state=_hour_bar(), last_bar=_prev_bar())
+    assert [f.order_id for f in fills] == ["sl"]
+
+
+def test_intrabar_path_fills_the_trigger_reached_first():
+    account = _bracket_account()
+    engine = SimFillEngine()
+    # TP is reached in the second quarter hour, the SL only in the last one.
+    engine.intrabar = IntrabarResolver(_fine(highs=[100.5, 102.5, 101.0, 100.0], lows=[99.5, 100.0, 99.0, 97.5]), bar_ns=HOUR_NS)
+    fills = engine.process_bar(account_state=account, open_orders=account.open_orders, market_state=_hour_bar(), last_bar=_prev_bar())
+    assert [f.order_id for f in fills] == ["tp"]
+    assert not account.open_orders
+    assert engine.intrabar.resolved_bars == 1 and engine.intrabar.reordered_bars == 1
+
+
+def test_unambiguous_bars_never_read_the_fine_series():
+    account = _bracket_account()
+    engine = SimFillEngine()
+    engine.intrabar = IntrabarResolver(_fine(highs=[100.0] * 4, lows=[100.0] * 4), bar_ns=HOUR_NS)
+    quiet = MarketState(timestamp=T0, symbol="TEST", open=100.0, high=102.5, low=99.0, close=100.0, volume=1.0)
+    fills = engine.process_bar(account_state=account, open_orders=account.open_orders, market_state=quiet, last_bar=_prev_bar())
+    assert [f.order_id for f in fills] == ["tp"]
+    assert engine.intrabar.resolved_bars == 0
+
+
+def test_unlinked_protective_orders_stop_once_position_is_flat():
+    account = _bracket_account(oco_group=None)
+    engine = SimFillEngine()
+    engine.intrabar = IntrabarResolver(_fine(highs=[100.5, 102.5, 101.0, 100.0], lows=[99.5, 100.0, 99.0, 97.5]), bar_ns=HOUR_NS)
+    fills = engine.process_bar(account_state=account, open_orders=account.open_orders, market_state=_hour_bar(), last_bar=_prev_bar())
+    # Without an OCO link the SL still reaches its trigger, but the TP already closed the position.
+    assert [(f.order_id, f.qty) for f in fills] == [("tp", 1.0)]
+    assert list(account.open_orders) == ["sl"]
@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import afts_pro.exec
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY = ("numpy", "pandas", "pyarrow")
+
+
+def test_package_exports_resolve_on_access():
+    from afts_pro.exec.position_models import AccountState
+
+    assert afts_pro.exec.AccountState is AccountState
+    assert "SimFillEngine" in dir(afts_pro.exec)
+    with pytest.raises(AttributeError):
+        afts_pro.exec.NotAnExport
+
+
+def test_cli_and_config_loading_skip_heavy_imports():
+    code = (
+        "import sys, main; "
+        "from afts_pro.config import load_global_config_from_profile; "
+        "load_global_config_from_profile('configs/profiles/sim.yaml'); "
+        f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT / "src"), str(ROOT)]), AFTS_CONFIG_CACHE="0")
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    assert proc.stdout.strip() == ""
@@ -0,0 +1,178 @@
+import asyncio
+import json
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+from afts_pro.core import Mode, StrategyDecision
+from afts_pro.engine import engine
+from afts_pro.lab import LockstepSimApi
+from afts_pro.strategies import BaseStrategy, StrategyRegistry
+
+REPO_CONFIGS = engine.PROJECT_ROOT / "configs"
+
+
+def _write_bars(path, days=20, seed=11):
+    n = days * 96
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.0006, n))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    wick = np.abs(rng.normal(0, 0.0004, n))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(
+        {
+            "time": pd.date_range("2024-01-01", periods=n, freq="15min", tz="UTC").asi8 // 1_000_000,
+            "open": open_,
+            "high": np.maximum(open_, close) + wick,
+            "low": np.minimum(open_, close) - wick,
+            "close": close,
+            "volume": np.ones(n),
+        }
+    ).to_parquet(path, index=False)
+    return n
+
+
+def _dump(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump(data))
+    return str(path)
+
+
+def _project(root, use_position_sizer, bar_logging="off", hot_reload=False):
+    """A SIM project tree: session-ORB strategy profile, FTMO policy, no guards, no demo entry."""
+    cfg = root / "configs"
+    strategy = _dump(
+        cfg / "strategy" / "orb.yaml",
+        {
+            "name": "orb_parity",
+            "session": {"session_start": "08:00", "session_end": "18:00"},
+            "orb": {"range_minutes": 30, "min_range_pips": 2.0, "breakout_buffer_pips": 0.5, "max_entries_per_day": 2},
+            "sl_tp": {"range_rr_sl_mult": 1.0, "range_rr_tp_mult": 2.0},
+        },
+    )
+    _dump(
+        cfg / "modes" / "sim.yaml",
+        {
+            "strategy_profile_path": strategy,
+            "use_position_sizer": use_position_sizer,
+            "position_sizer_config": "configs/exec/position_sizer.yaml",
+            "demo_entry": False,
+            "bar_logging": bar_logging,
+            "fast_forward": True,
+            "data": {"use_bar_store": True},
+        },
+    )
+    _dump(
+        cfg / "exec" / "position_sizer.yaml",
+        {"base_risk_mode": "fixed", "fixed_risk_pct": 0.5, "max_risk_per_trade_pct": 1.0, "max_risk_per_day_pct": 4.0},
+    )
+    ftmo = _dump(
+        cfg / "risk" / "ftmo.yaml",
+        {"type": "ftmo", "initial_balance": 10000.0, "total_dd_hard_stop_pct": 0.085, "daily_soft_dd_pct": 0.01, "daily_hard_dd_pct": 0.04},
+    )
+    execution = yaml.safe_load((REPO_CONFIGS / "execution.yaml").read_text())
+    execution["execution"].update(taker_fee_pct=0.0002, max_slippage_pct=0.0001)
+    environment = yaml.safe_load((REPO_CONFIGS / "environment.yaml").read_text())
+    environment["environment"].update(config_hot_reload_enabled=hot_reload, config_hot_reload_scope=["strategy"])
+    includes = {
+        "environment": _dump(cfg / "environment.yaml", environment),
+        "execution": _dump(cfg / "execution.yaml", execution),
+        "assets": _dump(cfg / "assets.yaml", {"assets": {"EURUSD_15T": {"symbol": "EURUSD_15T", "base_asset": "EUR", "quote_asset": "USD", "min_qty": 10000.0, "max_qty": 1e9, "qty_step": 1.0, "price_step": 0.00001}}}),
+        "strategy": _dump(cfg / "strategy.yaml", {"strategy": {"enabled_strategies": ["orb"], "strategy_params": {}}}),
+        "risk": _dump(cfg / "risk" / "risk.yaml", {"risk": {"policy_type": "ftmo", "policy_path": ftmo}}),
+        "behaviour": _dump(cfg / "behaviour.yaml", {"behaviour": {"enabled": False}}),
+        "features": _dump(cfg / "features.yaml", {"features": {"enabled": False}}),
+        "extras": str(REPO_CONFIGS / "extras.yaml"),
+        "runlogger": _dump(cfg / "runlogger.yaml", {"runlogger": {"enabled": True, "base_dir": str(root / "runs")}}),
+    }
+    return _dump(cfg / "profiles" / "parity.yaml", {"profile": {"name": "parity", "includes": includes}})
+
+
+@pytest.mark.parametrize("use_position_sizer", [True, False])
+def test_lockstep_matches_engine_run(tmp_path, monkeypatch, use_position_sizer):
+    n = _write_bars(tmp_path / "data" / "final_agg" / "EURUSD_15T.parquet")
+    profile = _project(tmp_path, use_position_sizer)
+    monkeypatch.setattr(engine, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(engine, "DATA_ROOT", tmp_path / "data")
+    monkeypatch.setattr(engine, "_PROFILE_PATH", None)
+
+    run_dir = asyncio.run(engine.start(Mode.SIM, profile_path=profile))
+    api = LockstepSimApi.from_profile(
+        profile, project_root=tmp_path, data_root=tmp_path / "data", output_root=tmp_path / "lab", record_equity=True
+    )
+    result = api.simulator.run([api.base_params])
+
+    engine_equity = pd.read_parquet(run_dir / "equity_curve.parquet")["equity"].to_numpy()
+    engine_metrics = json.loads((run_dir / "metrics.json").read_text())
+    metrics = result.metrics[0]
+    # A hard stop ends the engine run before that bar's equity point; the variant freezes there.
+    assert metrics["halted"] == (len(engine_equity) < n)
+    assert metrics["fees"] > 0 and abs(metrics["net_pnl"]) > 1.0
+    assert metrics["trades"] == engine_metrics["num_trades"]
+    assert result.equity[: len(engine_equity), 0] == pytest.approx(engine_equity, rel=1e-9)
+
+
+@pytest.mark.parametrize("bar_logging", ["off", "text"])
+def test_bar_logging_off_emits_no_per_bar_text(tmp_path, monkeypatch, caplog, bar_logging):
+    _write_bars(tmp_path / "data" / "final_agg" / "EURUSD_15T.parquet", days=3)
+    profile = _project(tmp_path, False, bar_logging=bar_logging)
+    monkeypatch.setattr(engine, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(engine, "DATA_ROOT", tmp_path / "data")
+    monkeypatch.setattr(engine, "_PROFILE_PATH", None)
+
+    caplog.set_level(logging.DEBUG, logger=engine.__name__)
+    asyncio.run(engine.start(Mode.SIM, profile_path=profile))
+    per_bar = ("SIM bar", "RISK |", "RISK_META", "DECISION", "ORDERS_BUILT", "POSITION |", "Applying fill")
+    lines = [r.getMessage() for r in caplog.records if r.name == engine.__name__ and r.getMessage().startswith(per_bar)]
+    assert bool(lines) == (bar_logging == "text")
+
+
+class RecordingStrategy(BaseStrategy):
+    seen = []
+
+    def on_bar(self, market_state, features=None):
+        RecordingStrategy.seen.append(market_state.timestamp)
+        return StrategyDecision(action="none", side=None, confidence=0.0)
+
+
+class OneShotWatcher:
+    """ConfigWatcher stand-in that reports the strategy file changed right after the first bar."""
+
+    def __init__(self, paths, poll_interval_s=1.0):
+        self.changed = {path for path in paths if path.name == "strategy.yaml"}
+        self.reads = 0
+
+    def start(self):
+        return self
+
+    def stop(self):
+        pass
+
+    @property
+    def pending(self):
+        self.reads += 1
+        return self.reads >= 2 and bool(self.changed)
+
+    def drain(self):
+        changed, self.changed = self.changed, set()
+        return changed
+
+
+def test_fast_forward_applies_pending_reload_before_skipping(tmp_path, monkeypatch):
+    n = _write_bars(tmp_path / "data" / "final_agg" / "EURUSD_15T.parquet", days=3)
+    profile = _project(tmp_path, False, hot_reload=True)
+    monkeypatch.setattr(engine, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(engine, "DATA_ROOT", tmp_path / "data")
+    monkeypatch.setattr(engine, "_PROFILE_PATH", None)
+    monkeypatch.setattr(engine, "ConfigWatcher", OneShotWatcher)
+    monkeypatch.setitem(StrategyRegistry._registry, "recording", RecordingStrategy)
+    monkeypatch.setattr(RecordingStrategy, "seen", [])
+
+    # The session ORB lets the loop skip to its session start; the reload swaps in a strategy
+    # that has to see every bar, so nothing after the first bar may be skipped.
+    _dump(tmp_path / "configs" / "strategy.yaml", {"strategy": {"enabled_strategies": ["recording"], "strategy_params": {}}})
+    asyncio.run(engine.start(Mode.SIM, profile_path=profile))
+    assert len(RecordingStrategy.seen) == n - 1
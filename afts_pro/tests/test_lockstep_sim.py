@@ -0,0 +1,85 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from afts_pro.lab import LabRunner, LabSweepDefinition, LockstepSimApi, LockstepSimulator, VariantParams
+from afts_pro.core.strategy_orb import SessionConfig
+from afts_pro.data.bar_store import BarArrays
+
+SESSION = SessionConfig(session_start="08:00", session_end="18:00")
+
+
+def _bars(days=30, seed=11):
+    n = days * 96
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.0006, n))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    wick = np.abs(rng.normal(0, 0.0004, n))
+    return BarArrays(
+        symbol="EURUSD",
+        timestamp=pd.date_range("2024-01-01", periods=n, freq="15min", tz="UTC").asi8,
+        open=open_,
+        high=np.maximum(open_, close) + wick,
+        low=np.minimum(open_, close) - wick,
+        close=close,
+        volume=np.ones(n),
+    )
+
+
+def _grid():
+    base = VariantParams(min_range_pips=2.0, fixed_risk_pct=0.5)
+    return [
+        base.with_overrides({"orb.range_minutes": rm, "orb.range_rr_tp_mult": tp, "risk.r_per_trade": risk})
+        for rm in (15, 30, 60)
+        for tp in (1.0, 2.0)
+        for risk in (0.25, 1.0)
+    ]
+
+
+def test_lockstep_variants_match_individual_runs():
+    sim = LockstepSimulator(_bars(), SESSION, initial_balance=10_000.0, fee_rate=0.0002, slippage_pct=0.0001)
+    variants = _grid()
+    together = sim.run(variants)
+    assert together.bars == len(sim.bars)
+    assert any(m["fees"] > 0 for m in together.metrics)
+    for params, metrics in zip(variants, together.metrics):
+        alone = sim.run([params]).metrics[0]
+        assert alone == pytest.approx(metrics)
+
+
+def test_drawdown_limits_halt_only_the_breaching_variant():
+    sim = LockstepSimulator(_bars(), SESSION, fixed_qty=10_000.0, record_equity=True)
+    loose = VariantParams(min_range_pips=2.0)
+    tight = loose.with_overrides({"risk.total_dd_hard_stop_pct": 0.0001, "risk.daily_hard_dd_pct": 0.0001})
+    result = sim.run([loose, tight])
+    assert result.metrics[1]["halted"] and not result.metrics[0]["halted"]
+    # The halted variant's curve freezes while the other one keeps trading.
+    last_move = int(np.flatnonzero(np.diff(result.equity[:, 1]))[-1])
+    assert np.diff(result.equity[last_move + 1 :, 0]).any()
+
+
+def test_unknown_parameter_is_rejected():
+    with pytest.raises(ValueError):
+        VariantParams().with_overrides({"orb.nope": 1})
+
+
+def test_lab_sweep_runs_one_lockstep_pass(tmp_path):
+    sim = LockstepSimulator(_bars(days=10), SESSION, record_equity=True)
+    api = LockstepSimApi(sim, VariantParams(min_range_pips=2.0), tmp_path / "raw")
+    calls = []
+    original = sim.run
+    sim.run = lambda variants: calls.append(len(variants)) or original(variants)
+    cfg = {"metrics": ["pf", "winrate", "mdd", "trades"], "output": {"root_dir": str(tmp_path / "lab"), "save_equity": True}}
+    sweep = LabSweepDefinition(id="grid", type="grid", params={"orb.box_length": [15, 30], "risk.r_per_trade": [0.25, 0.5]})
+
+    results = LabRunner(cfg, api).run_sweep(sweep)
+
+    assert calls == [4]
+    assert len(results) == 4
+    assert (Path(results[0].run_path) / "equity_curve.parquet").exists()
+    saved = json.loads((Path(results[0].run_path) / "metrics.json").read_text())
+    assert saved["params"]["range_minutes"] == 15
+    assert (tmp_path / "lab" / "grid" / "kpis.parquet").exists()
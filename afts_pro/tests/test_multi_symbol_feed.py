@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from afts_pro.data import MarketStateBuilder, MultiSymbolFeed, ParquetFeed
+
+
+def _write(root, name, symbol, hours):
+    folder = root / "final_agg"
+    folder.mkdir(parents=True, exist_ok=True)
+    times = 1_700_000_000_000 + np.asarray(hours, dtype=np.int64) * 3_600_000
+    n = len(hours)
+    pd.DataFrame(
+        {
+            "time": times,
+            "open": np.ones(n),
+            "high": np.full(n, 2.0),
+            "low": np.zeros(n),
+            "close": np.asarray(hours, dtype=float),
+            "volume": np.ones(n),
+            "symbol": symbol,
+        }
+    ).to_parquet(folder / f"{name}.parquet", index=False, row_group_size=2)
+
+
+def test_merge_groups_bars_by_timestamp(tmp_path):
+    _write(tmp_path, "AAA_1H", "AAA", [0, 1, 3, 4])
+    _write(tmp_path, "BBB_1H", "BBB", [1, 2, 3])
+    feed = MultiSymbolFeed(MarketStateBuilder(ParquetFeed(tmp_path)), ["AAA_1H", "BBB_1H"])
+
+    groups = [(int(ts.timestamp() - 1_700_000_000) // 3600, [b.symbol for b in bars]) for ts, bars in feed]
+    assert groups == [
+        (0, ["AAA"]),
+        (1, ["AAA", "BBB"]),
+        (2, ["BBB"]),
+        (3, ["AAA", "BBB"]),
+        (4, ["AAA"]),
+    ]
+
+
+def test_merge_is_lazy_and_windowed(tmp_path):
+    _write(tmp_path, "AAA_1H", "AAA", list(range(10)))
+    _write(tmp_path, "BBB_1H", "BBB", list(range(5, 15)))
+    start = pd.Timestamp(1_700_000_000_000 + 5 * 3_600_000, unit="ms", tz="UTC")
+    feed = MultiSymbolFeed(MarketStateBuilder(ParquetFeed(tmp_path)), ["AAA_1H", "BBB_1H"], start=start)
+
+    it = iter(feed)
+    ts, bars = next(it)
+    assert ts == start.to_pydatetime()
+    assert [b.symbol for b in bars] == ["AAA", "BBB"]
+    assert sum(len(bars) for _, bars in it) == 4 + 9
+
+
+def test_duplicate_symbols_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        MultiSymbolFeed(MarketStateBuilder(ParquetFeed(tmp_path)), ["AAA_1H", "AAA_1H"])
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from afts_pro.data import MarketStateBuilder, MissingColumnsError, ParquetFeed
+
+
+def _write_hourly(root, rows=48, row_group_size=12, as_datetime=False):
+    folder = root / "final_agg"
+    folder.mkdir(parents=True, exist_ok=True)
+    times = pd.Timestamp("2024-01-01", tz="UTC").value // 1_000_000 + np.arange(rows, dtype=np.int64) * 3_600_000
+    df = pd.DataFrame(
+        {
+            "time": pd.to_datetime(times, unit="ms", utc=True) if as_datetime else times,
+            "open": np.arange(rows, dtype=float),
+            "high": np.arange(rows, dtype=float) + 1.0,
+            "low": np.arange(rows, dtype=float) - 1.0,
+            "close": np.arange(rows, dtype=float) + 0.5,
+            "volume": np.ones(rows),
+            "vwap": np.zeros(rows),
+            "symbol": "TEST",
+        }
+    )
+    path = folder / "TEST_1H.parquet"
+    df.to_parquet(path, index=False, row_group_size=row_group_size)
+    return path
+
+
+@pytest.mark.parametrize("as_datetime", [False, True])
+def test_time_window_prunes_row_groups(tmp_path, as_datetime):
+    path = _write_hourly(tmp_path, as_datetime=as_datetime)
+    feed = ParquetFeed(tmp_path)
+    start = pd.Timestamp("2024-01-01 13:00", tz="UTC")
+    end = pd.Timestamp("2024-01-01 20:00", tz="UTC")
+
+    groups = feed.select_row_groups(pq.ParquetFile(path), "time", start, end)
+    assert groups == [1]
+
+    df = feed.load("TEST_1H", start=start, end=end)
+    assert df["timestamp"].iloc[0] == start
+    assert df["timestamp"].iloc[-1] == end
+    assert len(df) == 8
+
+
+def test_column_projection_keeps_timestamp(tmp_path):
+    _write_hourly(tmp_path)
+    df = ParquetFeed(tmp_path).load("TEST_1H", columns=["close"])
+    assert list(df.columns) == ["timestamp", "close"]
+    with pytest.raises(MissingColumnsError):
+        ParquetFeed(tmp_path).load("TEST_1H", columns=["bid"])
+
+
+def test_builder_window_matches_between_frame_and_store(tmp_path):
+    _write_hourly(tmp_path)
+    window = {"start": "2024-01-02 00:00", "end": "2024-01-02 05:00"}
+    frame_states = list(MarketStateBuilder(ParquetFeed(tmp_path)).iter_market_states("TEST_1H", **window))
+    store_states = list(
+        MarketStateBuilder(ParquetFeed(tmp_path, use_bar_store=True)).iter_market_states("TEST_1H", **window)
+    )
+    assert len(frame_states) == 6
+    assert [s.model_dump() for s in store_states] == [s.model_dump() for s in frame_states]
@@ -0,0 +1,50 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from afts_pro.config.runlogger_config import RunLoggerConfig
+from afts_pro.engine.portfolio import SymbolRun, merge_runs
+from afts_pro.exec.position_manager import PositionEvent
+from afts_pro.exec.position_models import AccountState
+from afts_pro.runlogger import RunLogger
+from afts_pro.runlogger.models import RunMeta
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _symbol_run(tmp_path, symbol, equities, start_hour, pnls):
+    meta = RunMeta(run_id=f"run_{symbol}", mode="sim", profile_name="test", started_at=T0, symbol=symbol, timeframe="1H")
+    config = RunLoggerConfig(base_dir=str(tmp_path), equity_spill_rows=0)
+    run_logger = RunLogger(meta, config, tmp_path)
+    for i, equity in enumerate(equities):
+        account = AccountState(balance=100.0, equity=equity, realized_pnl=0.0, unrealized_pnl=equity - 100.0, fees_total=0.0)
+        run_logger.on_bar_equity_snapshot(T0 + timedelta(hours=start_hour + i), account)
+    for i, pnl in enumerate(pnls):
+        run_logger.on_trade_close(PositionEvent(symbol=symbol, event_type="CLOSED", realized_pnl_delta=pnl), ts=T0 + timedelta(hours=i))
+    run_logger.finalize_and_persist({})
+    return SymbolRun(symbol=symbol, run_dir=str(run_logger.run_dir), elapsed_s=1.0)
+
+
+def test_merge_sums_equity_and_concatenates_trades(tmp_path):
+    runs = [
+        _symbol_run(tmp_path, "AAA", [100.0, 101.0, 102.0], start_hour=0, pnls=[2.0]),
+        _symbol_run(tmp_path, "BBB", [100.0, 98.0], start_hour=1, pnls=[-1.0, 3.0]),
+        SymbolRun(symbol="CCC", run_dir=None, elapsed_s=0.5, error="FileNotFoundError: no data"),
+    ]
+    out = tmp_path / "portfolio"
+    metrics = merge_runs(runs, out, RunLoggerConfig().filename_patterns, additional={"workers": 2})
+
+    equity = pd.read_parquet(out / "equity_curve.parquet")
+    # BBB sits at its first value before its first bar and is carried forward after its last.
+    assert list(equity["portfolio"]) == [200.0, 201.0, 200.0]
+    trades = pd.read_parquet(out / "trades.parquet")
+    assert sorted(trades["run_id"].unique()) == ["run_AAA", "run_BBB"]
+    assert metrics["num_trades"] == 3
+    assert metrics["profit_factor"] == pytest.approx(5.0)
+    assert metrics["max_drawdown_abs"] == pytest.approx(1.0)
+    assert metrics["additional"]["net_pnl"] == pytest.approx(0.0)
+    assert metrics["additional"]["symbols"]["CCC"]["error"].startswith("FileNotFoundError")
+    written = json.loads((out / "metrics.json").read_text())
+    assert written["num_trades"] == 3 and written["additional"]["workers"] == 2
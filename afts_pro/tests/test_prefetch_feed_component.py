@@ -0,0 +1,47 @@
+import threading
+import time
+
+import pytest
+
+from afts_pro.data import PrefetchingIterator
+
+
+def test_prefetch_preserves_order_across_batches():
+    items = list(PrefetchingIterator(iter(range(1000)), batch_size=64, queue_depth=2))
+    assert items == list(range(1000))
+
+
+def test_prefetch_applies_backpressure():
+    produced = []
+
+    def source():
+        for i in range(10_000):
+            produced.append(i)
+            yield i
+
+    it = PrefetchingIterator(source(), batch_size=10, queue_depth=2)
+    assert next(it) == 0
+    time.sleep(0.2)
+    # consumed batch + queued batches + the batch blocked on put
+    assert len(produced) <= 10 * (2 + 2)
+    it.close()
+
+
+def test_prefetch_reraises_source_errors_in_consumer():
+    def source():
+        yield 1
+        yield 2
+        raise RuntimeError("decode failed")
+
+    it = PrefetchingIterator(source(), batch_size=1, queue_depth=1)
+    assert next(it) == 1
+    assert next(it) == 2
+    with pytest.raises(RuntimeError, match="decode failed"):
+        next(it)
+
+
+def test_prefetch_close_stops_producer_thread():
+    it = PrefetchingIterator(iter(range(1_000_000)), batch_size=8, queue_depth=1, name="prefetch-close-test")
+    next(it)
+    it.close()
+    assert not any(t.name == "prefetch-close-test" for t in threading.enumerate())
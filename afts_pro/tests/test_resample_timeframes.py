@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from afts_pro.data import ParquetFeed
+from afts_pro.data.resample import TimeframeError, parse_timeframe, resample_bars
+
+
+def _minutes(start, count, step="1min"):
+    ts = pd.date_range(start, periods=count, freq=step, tz="UTC")
+    rng = np.random.default_rng(7)
+    close = 100 + rng.normal(0, 1, count).cumsum()
+    return pd.DataFrame(
+        {
+            "time": ts.asi8 // 1_000_000,
+            "open": close + 0.1,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": rng.integers(1, 10, count).astype(float),
+            "symbol": "BTCUSDT",
+        }
+    )
+
+
+def test_parse_timeframe_units():
+    assert parse_timeframe("15T") == parse_timeframe("15min") == 15 * 60 * 10**9
+    assert parse_timeframe("4H") == 4 * 3600 * 10**9
+    assert parse_timeframe("1D") == 86400 * 10**9
+    with pytest.raises(TimeframeError):
+        parse_timeframe("1M")
+
+
+def test_resample_matches_pandas_ohlc():
+    df = _minutes("2024-01-01 00:07", 600)
+    out = resample_bars(df, "1H")
+
+    frame = df.assign(ts=pd.to_datetime(df["time"], unit="ms", utc=True)).set_index("ts")
+    expected = frame.resample("1h").agg(
+        {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+    )
+    assert out["timestamp"].tolist() == expected.index.tolist()
+    for col in ("open", "high", "low", "close", "volume"):
+        np.testing.assert_allclose(out[col].to_numpy(), expected[col].to_numpy())
+    assert out["n_bars"].tolist()[:2] == [53, 60]
+    assert out["symbol"].unique().tolist() == ["BTCUSDT"]
+
+
+def test_session_alignment_follows_local_clock_across_dst():
+    df = _minutes("2024-03-08 00:00", 4 * 24 * 60)
+    out = resample_bars(df, "1D", offset="17H", tz="America/New_York")
+    local = out["timestamp"].dt.tz_convert("America/New_York")
+    assert set(local.dt.hour.tolist()) == {17}
+    # 2024-03-10 is the spring-forward day: the session opening at 17:00 on the 9th is 23h long.
+    by_open = dict(zip(local.dt.strftime("%m-%d"), out["n_bars"]))
+    assert by_open["03-09"] == 23 * 60
+    assert by_open["03-10"] == 24 * 60
+
+
+def test_weekly_buckets_start_on_monday():
+    df = _minutes("2024-01-03", 14 * 24, step="1h")
+    out = resample_bars(df, "1W")
+    assert out["timestamp"].dt.dayofweek.unique().tolist() == [0]
+
+
+def test_feed_resamples_missing_timeframe_from_base(tmp_path):
+    (tmp_path / "final").mkdir()
+    _minutes("2024-01-01", 48 * 60).to_parquet(tmp_path / "final" / "BTCUSDT.parquet", index=False)
+    feed = ParquetFeed(tmp_path, use_bar_store=True)
+
+    df = feed.load("BTCUSDT_4H")
+    assert len(df) == 12
+    assert (df["timestamp"].diff().dropna() == pd.Timedelta("4h")).all()
+    cached = list((tmp_path / ".resample_cache").rglob("BTCUSDT_4H.parquet"))
+    assert len(cached) == 1
+
+    bars = feed.load_bars("BTCUSDT_4H")
+    np.testing.assert_allclose(bars.close, df["close"].to_numpy())
+    assert feed.resolve_path("BTCUSDT_4H") == cached[0]
+
+    with pytest.raises(FileNotFoundError):
+        feed.load("ETHUSDT_4H")
@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from afts_pro.core import MarketState
+from afts_pro.core.models import StrategyDecision
+from afts_pro.exec import (
+    AccountState,
+    Order,
+    OrderBuilder,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    Position,
+    PositionSide,
+    RestingOrderBook,
+    SimFillEngine,
+)
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _order(oid, order_type, side, price, **kwargs):
+    field = "stop_price" if order_type == OrderType.STOP_MARKET else "price"
+    return Order(id=oid, symbol="TEST", side=side, type=order_type, qty=1.0, created_at=T0, updated_at=T0, **{field: price}, **kwargs)
+
+
+def _bar(i, low, high):
+    mid = (low + high) / 2
+    return MarketState(timestamp=T0 + timedelta(hours=i), symbol="TEST", open=mid, high=high, low=low, close=mid, volume=1.0)
+
+
+def _account(**kwargs):
+    return AccountState(balance=1000.0, equity=1000.0, realized_pnl=0.0, unrealized_pnl=0.0, fees_total=0.0, **kwargs)
+
+
+def _random_orders(rng, n):
+    kinds = [OrderType.LIMIT, OrderType.STOP_MARKET, OrderType.STOP_LIMIT]
+    return [
+        _order(f"o{i}", kinds[i % 3], OrderSide.BUY if rng.random() < 0.5 else OrderSide.SELL, float(rng.uniform(90, 110)))
+        for i in range(n)
+    ]
+
+
+def test_book_fills_match_full_scan():
+    rng = np.random.default_rng(3)
+    engine = SimFillEngine()
+    orders = _random_orders(rng, 300)
+    book = RestingOrderBook(o.model_copy() for o in orders)
+    plain = {o.id: o.model_copy() for o in orders}
+    for i in range(1, 60):
+        low = float(rng.uniform(90, 108))
+        bar, prev = _bar(i, low, low + float(rng.uniform(0.1, 2.0))), _bar(i - 1, 99.0, 101.0)
+        from_book = engine.process_bar(account_state=_account(), open_orders=book, market_state=bar, last_bar=prev)
+        from_scan = engine.process_bar(account_state=_account(), open_orders=plain, market_state=bar, last_bar=prev)
+        assert [f.order_id for f in from_book] == [f.order_id for f in from_scan]
+        assert list(book) == list(plain)
+
+
+def test_triggered_only_returns_reachable_orders():
+    book = RestingOrderBook(
+        [
+            _order("lim_in", OrderType.LIMIT, OrderSide.BUY, 100.0),
+            _order("lim_out", OrderType.LIMIT, OrderSide.SELL, 105.0),
+            _order("buy_stop_gap", OrderType.STOP_MARKET, OrderSide.BUY, 95.0),
+            _order("buy_stop_far", OrderType.STOP_MARKET, OrderSide.BUY, 103.0),
+            _order("sell_stop", OrderType.STOP_MARKET, OrderSide.SELL, 99.5),
+        ]
+    )
+    assert [o.id for o in book.triggered(99.0, 101.0)] == ["lim_in", "buy_stop_gap", "sell_stop"]
+    book.pop("lim_in")
+    del book["sell_stop"]
+    assert [o.id for o in book.triggered(99.0, 101.0)] == ["buy_stop_gap"]
+
+
+def test_oco_fill_cancels_sibling():
+    position = Position(symbol="TEST", side=PositionSide.LONG, qty=1.0, entry_price=100.0, realized_pnl=0.0, unrealized_pnl=0.0, avg_entry_fees=0.0)
+    account = _account(positions={"TEST": position})
+    sl = _order("sl", OrderType.STOP_MARKET, OrderSide.SELL, 98.0, reduce_only=True, is_sl=True, oco_group="g")
+    tp = _order("tp", OrderType.LIMIT, OrderSide.SELL, 99.0, reduce_only=True, is_tp=True, oco_group="g")
+    account.open_orders.add(sl)
+    account.open_orders.add(tp)
+    # The bar reaches both; the SL rests first, fills, and takes the TP with it.
+    fills = SimFillEngine().process_bar(account_state=account, open_orders=account.open_orders, market_state=_bar(1, 97.0, 100.0), last_bar=_bar(0, 99.0, 101.0))
+    assert [f.order_id for f in fills] == ["sl"]
+    assert tp.status == OrderStatus.CANCELED
+    assert not account.open_orders
+
+
+def test_new_stop_replaces_resting_stop():
+    builder = OrderBuilder()
+    account = _account()
+    state = _bar(0, 99.0, 101.0)
+    decision = StrategyDecision(action="manage", side="long", confidence=1.0, update={"new_sl": 98.0, "new_tp": 104.0})
+    first = builder.build_manage_orders(decision, state, account)
+    assert first[0].oco_group and first[0].oco_group == first[1].oco_group
+    for order in first:
+        account.open_orders.add(order)
+
+    moved = builder.build_manage_orders(StrategyDecision(action="manage", side="long", confidence=1.0, update={"new_sl": 99.0}), state, account)
+    replaced = account.open_orders.add(moved[0])
+    assert [o.id for o in replaced] == [first[0].id]
+    assert sorted(o.id for o in account.open_orders.values()) == sorted([first[1].id, moved[0].id])
+
+
+def test_replaced_stop_keeps_oco_link():
+    builder = OrderBuilder()
+    position = Position(symbol="TEST", side=PositionSide.LONG, qty=1.0, entry_price=100.0, realized_pnl=0.0, unrealized_pnl=0.0, avg_entry_fees=0.0)
+    account = _account(positions={"TEST": position})
+    state = _bar(0, 99.5, 100.5)
+    bracket = StrategyDecision(action="manage", side="long", confidence=1.0, update={"new_sl": 98.0, "new_tp": 104.0})
+    for order in builder.build_manage_orders(bracket, state, account):
+        account.open_orders.add(order)
+    tp = next(o for o in account.open_orders.values() if o.is_tp)
+
+    moved = builder.build_manage_orders(StrategyDecision(action="manage", side="long", confidence=1.0, update={"new_sl": 99.0}), state, account)
+    account.open_orders.add(moved[0])
+    assert moved[0].oco_group == tp.oco_group
+
+    fills = SimFillEngine().process_bar(account_state=account, open_orders=account.open_orders, market_state=_bar(1, 98.5, 100.0), last_bar=state)
+    assert [f.order_id for f in fills] == [moved[0].id]
+    assert tp.status == OrderStatus.CANCELED
+    assert not account.open_orders
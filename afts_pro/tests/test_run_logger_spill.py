@@ -0,0 +1,71 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from afts_pro.config.runlogger_config import RunLoggerConfig
+from afts_pro.engine.throughput import ThroughputMeter
+from afts_pro.exec.position_models import AccountState
+from afts_pro.runlogger import RunLogger
+from afts_pro.runlogger.metrics import build_metrics_snapshot
+from afts_pro.runlogger.models import EquityPoint, RunMeta
+
+EQUITY = [100.0, 101.0, 99.5, 102.0, 98.0, 98.0, 103.0, 100.5, 104.0, 97.0, 99.0]
+
+
+def _run(tmp_path, run_id, spill_rows):
+    meta = RunMeta(
+        run_id=run_id,
+        mode="sim",
+        profile_name="test",
+        started_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        symbol="TEST",
+        timeframe="1H",
+    )
+    config = RunLoggerConfig(base_dir=str(tmp_path), equity_spill_rows=spill_rows)
+    run_logger = RunLogger(meta, config, tmp_path)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for i, equity in enumerate(EQUITY):
+        account = AccountState(balance=100.0, equity=equity, realized_pnl=0.0, unrealized_pnl=equity - 100.0, fees_total=0.0)
+        run_logger.on_bar_equity_snapshot(start + timedelta(hours=i), account)
+    metrics = run_logger.finalize_and_persist({}, throughput={"bars": len(EQUITY)})
+    return run_logger, metrics
+
+
+def test_spilled_equity_matches_in_memory_run(tmp_path):
+    unspilled, metrics_full = _run(tmp_path, "full", spill_rows=0)
+    spilled, metrics_spilled = _run(tmp_path, "spilled", spill_rows=3)
+
+    assert spilled.equity_point_count == len(EQUITY)
+    assert spilled.equity_points == []
+    df_full = pd.read_parquet(unspilled.run_dir / "equity_curve.parquet")
+    df_spilled = pd.read_parquet(spilled.run_dir / "equity_curve.parquet")
+    pd.testing.assert_frame_equal(df_full, df_spilled)
+    assert not list(spilled.run_dir.glob(".*.partial"))
+
+    assert metrics_spilled == metrics_full
+    reference = build_metrics_snapshot([], [EquityPoint(**row._asdict()) for row in df_full.itertuples(index=False)])
+    assert metrics_full.max_drawdown_abs == pytest.approx(reference.max_drawdown_abs)
+    assert metrics_full.max_drawdown_pct == pytest.approx(reference.max_drawdown_pct)
+    assert metrics_full.sharpe_like_basic == pytest.approx(reference.sharpe_like_basic)
+
+
+def test_throughput_written_to_run_dir(tmp_path):
+    run_logger, _ = _run(tmp_path, "tp", spill_rows=0)
+    payload = json.loads((run_logger.run_dir / "throughput.json").read_text())
+    assert payload == {"bars": len(EQUITY)}
+
+
+def test_throughput_meter_report():
+    meter = ThroughputMeter()
+    meter.start_loop()
+    for _ in range(3):
+        meter.lap("data")
+        meter.lap("strategy")
+        meter.bar_done()
+    report = meter.report()
+    assert report["bars"] == 3
+    assert set(report["stages_s"]) == {"setup", "data", "strategy"}
+    assert report["loop_s"] >= sum(v for k, v in report["stages_s"].items() if k != "setup")
+    assert report["peak_rss_mb"] is None or report["peak_rss_mb"] > 0
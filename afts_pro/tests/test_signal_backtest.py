@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from afts_pro.core import MarketState
+from afts_pro.core.signal_backtest import SignalArrays, run_signal_backtest
+from afts_pro.core.strategy_orb import ORBConfig, ORBStrategy, SessionConfig
+from afts_pro.data.bar_store import BarArrays
+from afts_pro.exec import AccountState, OrderBuilder, OrderSide, PositionManager, SimFillEngine
+from afts_pro.exec.fill_models import Fill
+
+ORB = ORBConfig(range_minutes=30, min_range_pips=2.0, breakout_buffer_pips=0.5, max_entries_per_day=2)
+SESSION = SessionConfig(session_start="08:00", session_end="18:00")
+
+
+def _bars(days=12, seed=5, start="2024-01-01"):
+    n = days * 96
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.0005, n))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    wick = np.abs(rng.normal(0, 0.0003, n))
+    return BarArrays(
+        symbol="EURUSD",
+        timestamp=pd.date_range(start, periods=n, freq="15min", tz="UTC").asi8,
+        open=open_,
+        high=np.maximum(open_, close) + wick,
+        low=np.minimum(open_, close) - wick,
+        close=close,
+        volume=np.ones(n),
+    )
+
+
+def _event_pipeline(bars, fee_rate, slippage_pct):
+    """The SIM loop's strategy -> order -> fill -> position steps, one bar at a time."""
+    strategy = ORBStrategy(ORB, SESSION, symbol="EURUSD")
+    builder, fills_engine, positions = OrderBuilder(), SimFillEngine(fee_rate=fee_rate, slippage_pct=slippage_pct), PositionManager()
+    account = AccountState(balance=10_000.0, equity=10_000.0, realized_pnl=0.0, unrealized_pnl=0.0, fees_total=0.0)
+    pending, last_bar, fills, equity = [], None, [], []
+    for i, state in enumerate(bars.iter_rows()):
+        bar = _market_state(state)
+        for order in pending:
+            account.open_orders.add(order)
+        pending = []
+        if last_bar is not None:
+            for fill in fills_engine.process_bar(account_state=account, open_orders=account.open_orders, market_state=bar, last_bar=last_bar):
+                positions.apply_fill(fill, account)
+                fills.append((i, fill.qty if fill.side == OrderSide.BUY else -fill.qty, fill.price))
+        positions.update_unrealized_pnl(account, market_price=bar.close)
+        pending = builder.build_entry_orders(strategy.on_bar(bar), bar, account)
+        equity.append(account.equity)
+        last_bar = bar
+    return account, fills, np.asarray(equity)
+
+
+def _market_state(row):
+    ts, o, h, l, c, v = row
+    return MarketState(timestamp=ts, symbol="EURUSD", open=o, high=h, low=l, close=c, volume=v)
+
+
+def test_orb_signal_arrays_match_on_bar():
+    bars = _bars()
+    signals = ORBStrategy(ORB, SESSION).signal_arrays(bars)
+    strategy = ORBStrategy(ORB, SESSION, symbol="EURUSD")
+    for i, row in enumerate(bars.iter_rows()):
+        decision = strategy.on_bar(_market_state(row))
+        assert signals.long_entry[i] == (decision.side == "long"), i
+        assert signals.short_entry[i] == (decision.side == "short"), i
+        if decision.action == "entry":
+            assert signals.sl[i] == pytest.approx(decision.update["sl_price"])
+            assert signals.tp[i] == pytest.approx(decision.update["tp_price"])
+    assert signals.long_entry.sum() + signals.short_entry.sum() > 5
+
+
+def test_netting_backtest_matches_event_pipeline():
+    bars = _bars()
+    account, event_fills, event_equity = _event_pipeline(bars, fee_rate=0.0006, slippage_pct=0.0001)
+    signals = ORBStrategy(ORB, SESSION).signal_arrays(bars)
+    plain = SignalArrays(long_entry=signals.long_entry, short_entry=signals.short_entry)
+    result = run_signal_backtest(bars, plain, qty=0.01, fee_rate=0.0006, slippage_pct=0.0001)
+
+    assert [(i, q) for i, q, _ in event_fills] == list(zip(result.fills.bar_index, result.fills.qty))
+    assert [p for _, _, p in event_fills] == pytest.approx(list(result.fills.price))
+    assert account.fees_total == pytest.approx(result.metrics["fees"])
+    assert account.realized_pnl == pytest.approx(result.metrics["realized_pnl"])
+    # PositionManager books opening fees in fees_total only; add them back to compare equity.
+    opening_fees = np.zeros(len(bars))
+    opening = result.fills[result.fills.realized_pnl == 0]
+    np.add.at(opening_fees, opening.bar_index.to_numpy(), opening.fee.to_numpy())
+    assert event_equity == pytest.approx(result.equity + np.cumsum(opening_fees))
+
+
+def test_brackets_close_on_stop_target_or_exit():
+    ts = pd.date_range("2024-01-01", periods=8, freq="1h", tz="UTC").asi8
+    bars = BarArrays(
+        symbol="T",
+        timestamp=ts,
+        open=np.array([100, 100, 101, 102, 100, 99, 98, 98.0]),
+        high=np.array([100.5, 101, 102, 104.5, 100.5, 99.5, 98.5, 99.0]),
+        low=np.array([99.5, 99.5, 100.5, 101, 99.0, 97.5, 97.0, 97.5]),
+        close=np.array([100, 101, 102, 103, 99, 98, 98, 98.0]),
+        volume=np.ones(8),
+    )
+    long_entry = np.array([1, 0, 0, 0, 0, 0, 0, 0], dtype=bool)
+    short_entry = np.array([0, 0, 0, 0, 1, 0, 1, 0], dtype=bool)
+    exits = np.array([0, 0, 0, 0, 0, 1, 0, 0], dtype=bool)
+    sl = np.array([95.0, np.nan, np.nan, np.nan, 104.0, np.nan, 99.0, np.nan])
+    tp = np.array([104.0, np.nan, np.nan, np.nan, 90.0, np.nan, 97.0, np.nan])
+    result = run_signal_backtest(bars, SignalArrays(long_entry, short_entry, exit=exits, sl=sl, tp=tp), qty=1.0)
+
+    fills = result.fills
+    assert list(fills.bar_index) == [1, 3, 5, 6, 7]
+    assert list(fills.reason) == ["FILL", "TP", "FILL", "FILL", "FILL"]
+    assert list(fills.price) == [100.0, 104.0, 99.0, 98.0, 98.0]
+    assert result.metrics["trades"] == 2
+    assert result.position[-1] == -1.0
+    assert result.metrics["realized_pnl"] == pytest.approx(4.0 + 1.0)
+
+
+def test_netting_equal_sizes_leaves_no_dust_position():
+    account = AccountState(balance=10_000.0, equity=10_000.0, realized_pnl=0.0, unrealized_pnl=0.0, fees_total=0.0)
+    manager = PositionManager()
+    ts = pd.Timestamp("2024-01-01", tz="UTC")
+    for i, side in enumerate([OrderSide.BUY, OrderSide.BUY, OrderSide.BUY, OrderSide.SELL, OrderSide.SELL, OrderSide.SELL]):
+        fill = Fill(order_id=f"o{i}", trade_id=f"t{i}", symbol="EURUSD", side=side, qty=0.01, price=1.1, fee=0.0, fee_asset="USD", timestamp=ts)
+        manager.apply_fill(fill, account)
+    assert "EURUSD" not in account.positions
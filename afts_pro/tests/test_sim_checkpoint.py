@@ -0,0 +1,73 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from afts_pro.config.runlogger_config import RunLoggerConfig
+from afts_pro.engine.checkpoint import CheckpointWriter, find_resumable_run, load_snapshot
+from afts_pro.exec.position_manager import PositionEvent
+from afts_pro.exec.position_models import AccountState
+from afts_pro.runlogger import RunLogger
+from afts_pro.runlogger.models import RunMeta
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+EQUITY = [100.0, 101.0, 99.5, 102.0, 98.0, 98.0, 103.0, 100.5, 104.0, 97.0, 99.0]
+
+
+def _logger(tmp_path, spill_rows=3):
+    meta = RunMeta(run_id="20240101T000000_sim_test", mode="sim", profile_name="test", started_at=T0, symbol="TEST", timeframe="1H")
+    return RunLogger(meta, RunLoggerConfig(base_dir=str(tmp_path), equity_spill_rows=spill_rows), tmp_path)
+
+
+def _bars(run_logger, start, stop, equity=EQUITY):
+    journal = run_logger.open_journal()
+    for i in range(start, stop):
+        ts = T0 + timedelta(hours=i)
+        account = AccountState(balance=100.0, equity=equity[i], realized_pnl=0.0, unrealized_pnl=equity[i] - 100.0, fees_total=0.0)
+        journal.record("BAR", i, ts, "TEST", close=equity[i])
+        run_logger.on_bar_equity_snapshot(ts, account)
+        if i % 4 == 3:
+            run_logger.on_trade_close(PositionEvent(symbol="TEST", event_type="CLOSED", realized_pnl_delta=float(i)), ts=ts)
+
+
+def test_restored_run_logger_matches_uninterrupted_run(tmp_path):
+    reference = _logger(tmp_path / "ref")
+    _bars(reference, 0, len(EQUITY))
+    expected = reference.finalize_and_persist({})
+
+    interrupted = _logger(tmp_path / "resumed")
+    _bars(interrupted, 0, 5)
+    state = interrupted.checkpoint()
+    # Output written after the checkpoint (with different values) must be discarded on restore.
+    _bars(interrupted, 5, 9, equity=[0.0] * len(EQUITY))
+    interrupted.checkpoint()
+    resumed = _logger(tmp_path / "resumed")
+    resumed.restore(state)
+    _bars(resumed, 5, len(EQUITY))
+    metrics = resumed.finalize_and_persist({})
+
+    for key in ("num_trades", "max_drawdown_abs", "profit_factor"):
+        assert getattr(metrics, key) == pytest.approx(getattr(expected, key))
+    for name in ("equity_curve.parquet", "trades.parquet", "events.parquet"):
+        got = pd.read_parquet(resumed.run_dir / name).drop(columns=["trade_id"], errors="ignore")
+        want = pd.read_parquet(reference.run_dir / name).drop(columns=["trade_id"], errors="ignore")
+        pd.testing.assert_frame_equal(got, want)
+    assert not list(resumed.run_dir.glob(".*"))  # no partials or segments left behind
+    assert json.loads((resumed.run_dir / "metrics.json").read_text())["num_trades"] == 2
+
+
+def test_checkpoint_writer_round_trip_and_lookup(tmp_path):
+    run_dir = tmp_path / "20240101T000000_sim_test"
+    writer = CheckpointWriter(run_dir, every_bars=10)
+    assert not writer.due(9) and writer.due(10)
+    writer.write(12, {"account_state": AccountState(balance=1.0, equity=1.0, realized_pnl=0.0, unrealized_pnl=0.0, fees_total=0.0)})
+    assert writer.next_bar == 22
+
+    assert find_resumable_run(tmp_path, "_sim_test") == run_dir
+    assert find_resumable_run(tmp_path, "_sim_other") is None
+    snapshot = load_snapshot(run_dir)
+    assert snapshot["bar_index"] == 12 and snapshot["account_state"].equity == 1.0
+
+    writer.clear()
+    assert find_resumable_run(tmp_path, "_sim_test") is None
@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from afts_pro.config.runlogger_config import RunLoggerConfig
+from afts_pro.data.bar_store import BarArrays
+from afts_pro.engine.engine import _continuation_mismatch
+from afts_pro.exec.position_manager import PositionEvent
+from afts_pro.exec.position_models import AccountState
+from afts_pro.runlogger import RunLogger
+from afts_pro.runlogger.models import RunMeta
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+EQUITY = [100.0, 101.0, 99.5, 102.0, 98.0, 98.0, 103.0, 100.5, 104.0, 97.0, 99.0]
+
+
+def _logger(tmp_path):
+    meta = RunMeta(run_id="20240101T000000_sim_test", mode="sim", profile_name="test", started_at=T0, symbol="TEST", timeframe="1H")
+    return RunLogger(meta, RunLoggerConfig(base_dir=str(tmp_path), equity_spill_rows=4), tmp_path)
+
+
+def _bars(run_logger, start, stop):
+    journal = run_logger.open_journal()
+    for i in range(start, stop):
+        ts = T0 + timedelta(hours=i)
+        account = AccountState(balance=100.0, equity=EQUITY[i], realized_pnl=0.0, unrealized_pnl=EQUITY[i] - 100.0, fees_total=0.0)
+        journal.record("BAR", i, ts, "TEST", close=EQUITY[i])
+        run_logger.on_bar_equity_snapshot(ts, account)
+        if i % 3 == 2:
+            run_logger.on_trade_close(PositionEvent(symbol="TEST", event_type="CLOSED", realized_pnl_delta=float(i)), ts=ts)
+
+
+def _arrays(n, bump_at=None):
+    close = 1.0 + np.arange(n) * 0.001
+    if bump_at is not None:
+        close[bump_at] += 0.5
+    ts = (np.arange(n, dtype=np.int64) * 3_600_000_000_000) + 1_700_000_000_000_000_000
+    return BarArrays(symbol="TEST", timestamp=ts, open=close, high=close, low=close, close=close, volume=np.ones(n))
+
+
+def test_reopened_run_appends_to_finalized_output(tmp_path):
+    reference = _logger(tmp_path / "ref")
+    _bars(reference, 0, len(EQUITY))
+    reference.finalize_and_persist({})
+
+    first = _logger(tmp_path / "cont")
+    _bars(first, 0, 6)
+    end_state = first.checkpoint()
+    first.finalize_and_persist({})
+
+    continued = _logger(tmp_path / "cont")
+    continued.reopen(end_state)
+    _bars(continued, 6, len(EQUITY))
+    metrics = continued.finalize_and_persist({})
+
+    assert metrics.num_trades == 3
+    for name in ("equity_curve.parquet", "trades.parquet", "events.parquet"):
+        got = pd.read_parquet(continued.run_dir / name).drop(columns=["trade_id"], errors="ignore")
+        want = pd.read_parquet(reference.run_dir / name).drop(columns=["trade_id"], errors="ignore")
+        pd.testing.assert_frame_equal(got, want)
+    assert not list(continued.run_dir.glob(".*"))
+
+
+def test_continuation_requires_unchanged_prefix_and_config():
+    previous = _arrays(100)
+    snapshot = {"config_hash": "abc", "data": {"rows": 100, "fingerprint": previous.fingerprint()}}
+
+    assert _continuation_mismatch(snapshot, _arrays(120), 120, "abc") is None
+    assert _continuation_mismatch(snapshot, _arrays(120), 120, "xyz") == "config_changed"
+    assert _continuation_mismatch(snapshot, _arrays(120, bump_at=40), 120, "abc") == "history_changed"
+    assert _continuation_mismatch(snapshot, _arrays(90), 90, "abc") == "fewer_bars"
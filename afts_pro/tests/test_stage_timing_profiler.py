@@ -0,0 +1,67 @@
+import threading
+import time
+
+from afts_pro.engine.profiler import SamplingProfiler
+from afts_pro.engine.throughput import HISTOGRAM_EDGES_S, ThroughputMeter
+
+
+def test_stage_percentiles_from_histogram():
+    meter = ThroughputMeter(flush_every=7)
+    meter.start_loop()
+    durations = [1.05e-5] * 90 + [1.05e-3] * 9 + [5e-2]
+    for value in durations:
+        meter.stages["fills"] += value
+        meter._samples["fills"].append(value)
+        meter.bar_done()
+
+    stats = meter.stage_stats()["fills"]
+    assert stats["count"] == 100
+    # One bucket is 10 ** (1 / 20) ~ 12% wide.
+    assert 10.5 <= stats["p50_us"] <= 10.5 * 1.13
+    assert 1050 <= stats["p95_us"] <= 1050 * 1.13
+    assert 1050 <= stats["p99_us"] <= 1050 * 1.13
+    assert stats["max_us"] == 5e4
+    hist = meter.histograms()
+    assert len(hist["edges_s"]) == len(HISTOGRAM_EDGES_S)
+    assert sum(hist["counts"]["fills"].values()) == 100
+
+
+def test_report_includes_stage_stats():
+    meter = ThroughputMeter()
+    meter.start_loop()
+    for _ in range(5):
+        meter.lap("data")
+        meter.lap("risk")
+        meter.bar_done()
+    report = meter.report()
+    assert set(report["stage_stats"]) == {"data", "risk"}
+    assert report["stage_stats"]["risk"]["count"] == 5
+
+
+def _busy_wait(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_sampling_profiler_writes_folded_stacks(tmp_path):
+    profiler = SamplingProfiler(interval_s=0.001)
+    with profiler:
+        _busy_wait(0.2)
+    assert not profiler.running
+    assert profiler.samples > 0
+    path = profiler.write(tmp_path)
+    lines = path.read_text().splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("_busy_wait" in name for name, _, _ in profiler.top_functions())
+
+
+def test_sampling_profiler_targets_given_thread():
+    done = threading.Event()
+    worker = threading.Thread(target=lambda: (_busy_wait(0.2), done.set()))
+    worker.start()
+    profiler = SamplingProfiler(interval_s=0.001, thread_id=worker.ident).start()
+    done.wait()
+    profiler.stop()
+    worker.join()
+    assert all("test_sampling_profiler_targets_given_thread" not in stack for stack in profiler.stacks)
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from afts_pro.data import MarketStateBuilder, ParquetFeed, UnorderedDataError
+
+
+def _write(root, times, row_group_size=10):
+    folder = root / "final_agg"
+    folder.mkdir(parents=True, exist_ok=True)
+    rows = len(times)
+    df = pd.DataFrame(
+        {
+            "time": np.asarray(times, dtype=np.int64),
+            "open": np.arange(rows, dtype=float),
+            "high": np.arange(rows, dtype=float) + 1.0,
+            "low": np.arange(rows, dtype=float) - 1.0,
+            "close": np.arange(rows, dtype=float) + 0.5,
+            "volume": [None] + [1.0] * (rows - 1),
+            "symbol": "TEST",
+        }
+    )
+    df.to_parquet(folder / "TEST_1H.parquet", index=False, row_group_size=row_group_size)
+
+
+def _hourly(rows):
+    return 1_704_067_200_000 + np.arange(rows, dtype=np.int64) * 3_600_000
+
+
+@pytest.mark.parametrize("batch_size", [None, 7])
+def test_stream_matches_full_load(tmp_path, batch_size):
+    _write(tmp_path, _hourly(35))
+    builder = MarketStateBuilder(ParquetFeed(tmp_path))
+    full = [s.model_dump() for s in builder.iter_market_states("TEST_1H")]
+    streamed = [s.model_dump() for s in builder.iter_market_states("TEST_1H", stream=True, batch_size=batch_size)]
+    assert len(streamed) == 35
+    np.testing.assert_equal(streamed, full)
+
+
+def test_stream_respects_window_and_batches_by_row_group(tmp_path):
+    _write(tmp_path, _hourly(40))
+    feed = ParquetFeed(tmp_path)
+    batches = list(feed.iter_bar_batches("TEST_1H", start="2024-01-01 12:00", end="2024-01-01 22:00"))
+    assert [len(b) for b in batches] == [8, 3]
+    assert batches[0].timestamp[0] == pd.Timestamp("2024-01-01 12:00", tz="UTC").value
+
+
+def test_stream_rejects_order_violation_across_batches(tmp_path):
+    times = _hourly(20)
+    times[10:] -= 24 * 3_600_000
+    _write(tmp_path, times)
+    builder = MarketStateBuilder(ParquetFeed(tmp_path))
+    with pytest.raises(UnorderedDataError):
+        list(builder.iter_market_states("TEST_1H", stream=True))